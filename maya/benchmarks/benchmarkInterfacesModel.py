@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarkInterfacesModel.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the :class:`snippets.ui.models.InterfacesModel` class population with synthetic interfaces.
+
+**Others:**
+	Usage: python benchmarkInterfacesModel.py [count ...]
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+from snippets.ui.models import Interface
+from snippets.ui.models import InterfacesModel
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["COUNTS", "WORDS", "createInterfaces", "benchmarkPopulation", "main"]
+
+COUNTS = (500, 1000, 5000)
+
+WORDS = ("make", "planar", "snap", "vertex", "select", "uvs", "shell", "random", "align", "export", "camera", "zoom")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def createInterfaces(count):
+	"""
+	Creates given count of synthetic interfaces with unique names in random order.
+
+	:param count: Interfaces count.
+	:type count: int
+	:return: Interfaces.
+	:rtype: list
+	"""
+
+	random.seed(count)
+	names = set()
+	while len(names) < count:
+		names.add("{0} {1}".format(" ".join(random.choice(WORDS).title() for i in range(3)), random.randint(0, 999)))
+	return [Interface(name=name, attribute="I{0}".format(name.replace(" ", "")), module=None) for name in names]
+
+def benchmarkPopulation(count):
+	"""
+	Benchmarks the population of a Model with given count of interfaces.
+
+	:param count: Interfaces count.
+	:type count: int
+	:return: Per interface registration time, bulk registration time.
+	:rtype: tuple
+	"""
+
+	interfaces = createInterfaces(count)
+
+	model = InterfacesModel()
+	start = timeit.default_timer()
+	for interface in interfaces:
+		model.registerInterface(interface)
+	registrationTime = timeit.default_timer() - start
+
+	model = InterfacesModel()
+	start = timeit.default_timer()
+	model.registerInterfaces(interfaces)
+	bulkRegistrationTime = timeit.default_timer() - start
+	return registrationTime, bulkRegistrationTime
+
+def main(counts=COUNTS):
+	"""
+	Runs the benchmark.
+
+	:param counts: Interfaces counts.
+	:type counts: tuple
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	print("{0:>10} | {1:>21} | {2:>22} | {3:>8}".format(
+	"Interfaces", "registerInterface (s)", "registerInterfaces (s)", "Speedup"))
+	for count in counts:
+		registrationTime, bulkRegistrationTime = benchmarkPopulation(count)
+		print("{0:>10} | {1:>21.4f} | {2:>22.4f} | {3:>7.1f}x".format(count,
+																	registrationTime,
+																	bulkRegistrationTime,
+																	registrationTime / bulkRegistrationTime))
+	return True
+
+if __name__ == "__main__":
+	main([int(count) for count in sys.argv[1:]] or COUNTS)
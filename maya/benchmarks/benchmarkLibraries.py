@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarkLibraries.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the uvs and geometry libraries definitions on synthetic meshes using the headless
+	Maya stand-in from **mayaStandIn** directory.
+
+**Others:**
+	Usage: python benchmarkLibraries.py [--output file.json] [--benchmark name ...] [--commands] [count ...]
+
+	Counts are the synthetic meshes faces counts, the largest ones take minutes with the default calls overhead,
+	e.g. python benchmarkLibraries.py --benchmark uvsBoundingBox --benchmark uvsMove 1000000.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import argparse
+import datetime
+import json
+import math
+import os
+import platform
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "mayaStandIn"))
+
+import maya.cmds as cmds
+import maya.mel as mel
+import maya.standIn
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.strings
+from snippets.libraries import alignComponents
+from snippets.libraries import collapseComponents
+from snippets.libraries import makePlanar
+from snippets.libraries import snapOnClosestVertex
+from snippets.libraries import uvsUtilities
+from snippets.profilers.commands import CommandsProfiler
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["COUNTS",
+			"SOURCE",
+			"REFERENCE",
+			"SIZE",
+			"BENCHMARKS",
+			"createMesh",
+			"benchmarkLibraries",
+			"main"]
+
+COUNTS = (10000, 100000, 1000000)
+
+SOURCE = "source"
+REFERENCE = "reference"
+SIZE = 100
+
+BENCHMARKS = (("uvsBoundingBox", lambda: uvsUtilities.getComponentsBoundingBox([SOURCE])),
+			("uvsOccupation", lambda: uvsUtilities.getComponentsOccupationAsMariPatches([SOURCE])),
+			("uvsArea", lambda: uvsUtilities.getObjectUVsArea(SOURCE)),
+			("uvsMove", lambda: uvsUtilities.moveComponentsUVs([SOURCE], 1, 0)),
+			("uvsScaleCenter", lambda: uvsUtilities.scaleCenterComponentsUVs([SOURCE])),
+			("uvsRotate", lambda: uvsUtilities.rotateComponentsUVs([SOURCE], 90)),
+			("collapseComponents", lambda: collapseComponents.collapseComponents([SOURCE])),
+			("alignComponents", lambda: alignComponents.alignComponentsBetweenAnchors(
+				"{0}.vtx[0]".format(SOURCE),
+				"{0}.vtx[{1}]".format(SOURCE, cmds.polyEvaluate(SOURCE, vertex=True) - 1), [SOURCE])),
+			("makePlanar", lambda: makePlanar.makePlanar([SOURCE])),
+			("snapOnClosestVertex", lambda: snapOnClosestVertex.snapComponentsOnClosestVertex(
+				cmds.listRelatives(REFERENCE, shapes=True)[0], [SOURCE], snapOnClosestVertex.TOLERANCE)))
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def createMesh(name, count):
+	"""
+	Creates a plane mesh of given name with at least given faces count and slightly random points heights.
+
+	:param name: Mesh name.
+	:type name: unicode
+	:param count: Faces count.
+	:type count: int
+	:return: Mesh transform.
+	:rtype: unicode
+	"""
+
+	subdivisions = max(int(math.ceil(math.sqrt(count))), 1)
+	transform = cmds.polyPlane(name=name, sx=subdivisions, sy=subdivisions, w=SIZE, h=SIZE)[0]
+	mesh = maya.standIn.getMesh(maya.standIn.getNode(transform))
+	for i, point in enumerate(mesh.points):
+		point[1] = math.sin(i) * 0.1
+	return transform
+
+def benchmarkLibraries(count, benchmarks=None, commandsProfiling=False):
+	"""
+	Benchmarks the libraries definitions on a mesh of given faces count.
+
+	Each definition runs in a new scene, the reference mesh for the vertices snapping has a quarter of the faces.
+
+	:param count: Faces count.
+	:type count: int
+	:param benchmarks: Benchmarks names, all by default.
+	:type benchmarks: tuple or list
+	:param commandsProfiling: Record the commands calls count, timings include the recording overhead.
+	:type commandsProfiling: bool
+	:return: Timings in seconds and commands calls counts.
+	:rtype: dict
+	"""
+
+	timings = {}
+	for name, definition in BENCHMARKS:
+		if benchmarks and not name in benchmarks:
+			continue
+
+		cmds.file(new=True, force=True)
+		createMesh(SOURCE, count)
+		createMesh(REFERENCE, count // 4)
+		cmds.xform(REFERENCE, t=(0.25, 0.5, 0.25))
+
+		commandsProfiler = CommandsProfiler((cmds, mel))
+		start = timeit.default_timer()
+		if commandsProfiling:
+			commandsProfiler.runcall(definition)
+		else:
+			definition()
+		timings[name] = timeit.default_timer() - start
+		if commandsProfiling:
+			timings["{0}Calls".format(name)] = sum(calls for command, (calls, time) in
+													commandsProfiler.getStatistics(0))
+	return timings
+
+def main(counts=COUNTS, output=None, benchmarks=None, commandsProfiling=False):
+	"""
+	Runs the benchmark.
+
+	:param counts: Faces counts.
+	:type counts: tuple
+	:param output: Json results file.
+	:type output: unicode
+	:param benchmarks: Benchmarks names, all by default.
+	:type benchmarks: tuple or list
+	:param commandsProfiling: Record the commands calls count.
+	:type commandsProfiling: bool
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	results = {}
+	for count in counts:
+		results[count] = timings = benchmarkLibraries(count, benchmarks, commandsProfiling)
+		print("{0:>10} faces:".format(count))
+		for name, value in sorted(timings.iteritems()):
+			if name.endswith("Calls"):
+				print("{0:>32} | {1:>12} calls".format(name, value))
+			else:
+				print("{0:>32} | {1:>12.4f} ms".format(name, value * 1000))
+
+	if output:
+		with open(output, "w") as file:
+			json.dump({"date": datetime.datetime.now().isoformat(),
+						"platform": platform.platform(),
+						"python": sys.version,
+						"overheads": maya.standIn.OVERHEADS,
+						"results": results}, file, indent=4, sort_keys=True)
+	return True
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Benchmarks the snippets uvs and geometry libraries.")
+	parser.add_argument("counts", type=int, nargs="*", default=COUNTS, help="Meshes faces counts.")
+	parser.add_argument("-o", "--output", help="Json results file.")
+	parser.add_argument("-b", "--benchmark", action="append", dest="benchmarks",
+						choices=[name for name, definition in BENCHMARKS], help="Benchmark name, repeatable.")
+	parser.add_argument("-c", "--commands", action="store_true", help="Record the commands calls count.")
+	parser.add_argument("--commandOverhead", type=float, default=maya.standIn.OVERHEADS["command"],
+						help="Stand-in command call overhead in seconds.")
+	parser.add_argument("--apiOverhead", type=float, default=maya.standIn.OVERHEADS["api"],
+						help="Stand-in api call overhead in seconds.")
+	arguments = parser.parse_args()
+	maya.standIn.OVERHEADS.update(command=arguments.commandOverhead, api=arguments.apiOverhead)
+	main(arguments.counts,
+		arguments.output and foundations.strings.toString(arguments.output),
+		arguments.benchmarks,
+		arguments.commands)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarkModulesManager.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the :class:`snippets.managers.modulesManager.ModulesManager` class registration costs
+	on synthetic libraries directories.
+
+**Others:**
+	Usage: python benchmarkModulesManager.py [count ...]
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+from snippets.managers.modulesManager import ModulesManager
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["COUNTS", "MODULE_TEMPLATE", "createLibraries", "benchmarkRegistration", "main"]
+
+COUNTS = (100, 1000, 10000)
+
+MODULE_TEMPLATE = """
+\"\"\"
+Synthetic module {0}.
+\"\"\"
+
+def module{0}():
+	\"\"\"
+	Does nothing.
+	\"\"\"
+
+	pass
+
+def IModule{0}():
+	\"\"\"
+	Defines the module{0} definition Interface.
+	\"\"\"
+
+	module{0}()
+"""
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def createLibraries(directory, count):
+	"""
+	Creates given count of synthetic modules into given directory.
+
+	:param directory: Directory.
+	:type directory: unicode
+	:param count: Modules count.
+	:type count: int
+	:return: Modules paths.
+	:rtype: list
+	"""
+
+	paths = []
+	for i in range(count):
+		path = os.path.join(directory, "module{0}.py".format(i))
+		with open(path, "w") as file:
+			file.write(MODULE_TEMPLATE.format(i))
+		paths.append(path)
+	return paths
+
+def benchmarkRegistration(count):
+	"""
+	Benchmarks the registration of given count of modules.
+
+	:param count: Modules count.
+	:type count: int
+	:return: Modules registration time, interfaces registration time.
+	:rtype: tuple
+	"""
+
+	directory = tempfile.mkdtemp()
+	try:
+		paths = createLibraries(directory, count)
+
+		modulesManager = ModulesManager([directory])
+		start = timeit.default_timer()
+		for path in paths:
+			modulesManager.registerModule(os.path.splitext(os.path.basename(path))[0], path)
+		modulesTime = timeit.default_timer() - start
+
+		start = timeit.default_timer()
+		modulesManager.registerInterfaces()
+		interfacesTime = timeit.default_timer() - start
+
+		start = timeit.default_timer()
+		for i in range(count):
+			"module{0}".format(i) in modulesManager
+			modulesManager.getInterfaceModule("IModule{0}".format(i))
+		lookupsTime = timeit.default_timer() - start
+	finally:
+		shutil.rmtree(directory)
+	return modulesTime, interfacesTime, lookupsTime
+
+def main(counts=COUNTS):
+	"""
+	Runs the benchmark.
+
+	:param counts: Modules counts.
+	:type counts: tuple
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	print("{0:>8} | {1:>24} | {2:>24} | {3:>24}".format(
+	"Modules", "Registration (us/module)", "Interfaces (us/module)", "Lookups (us/module)"))
+	for count in counts:
+		modulesTime, interfacesTime, lookupsTime = benchmarkRegistration(count)
+		print("{0:>8} | {1:>24.2f} | {2:>24.2f} | {3:>24.2f}".format(count,
+																	modulesTime / count * 1e6,
+																	interfacesTime / count * 1e6,
+																	lookupsTime / count * 1e6))
+	return True
+
+if __name__ == "__main__":
+	main([int(count) for count in sys.argv[1:]] or COUNTS)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarkPopup.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the :class:`snippets.popup.Popup` class invocation latency, from a cold instantiation,
+	from the session pre-warmed instance and after a modules registry change.
+
+**Others:**
+	The benchmark runs in a Maya session, e.g. from the script editor:
+
+	import benchmarkPopup
+	benchmarkPopup.main()
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import os
+import sys
+import timeit
+from PyQt4.QtGui import QApplication
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import snippets.engine
+import snippets.popup
+from snippets.globals.runtimeGlobals import RuntimeGlobals
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["ITERATIONS", "timeInvocation", "benchmarkInvocation", "main"]
+
+ITERATIONS = 50
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def timeInvocation():
+	"""
+	Times a :func:`snippets.popup.showPopup` definition invocation until the popup is painted, the popup is then hidden.
+
+	:return: Invocation time.
+	:rtype: float
+	"""
+
+	start = timeit.default_timer()
+	snippets.popup.showPopup()
+	QApplication.processEvents()
+	invocationTime = timeit.default_timer() - start
+	RuntimeGlobals.popup.hide()
+	QApplication.processEvents()
+	return invocationTime
+
+def benchmarkInvocation(iterations=ITERATIONS):
+	"""
+	Benchmarks the popup invocation latencies.
+
+	:param iterations: Warm invocations count.
+	:type iterations: int
+	:return: Cold invocation time, warm invocations times, invocation time after a registry change.
+	:rtype: tuple
+	"""
+
+	RuntimeGlobals.popup = None
+	coldTime = timeInvocation()
+
+	warmTimes = [timeInvocation() for i in range(iterations)]
+
+	modulesManager = RuntimeGlobals.modulesManager
+	name = sorted(modulesManager.listModules())[0]
+	modulesManager.reloadModule(name, modulesManager[name].file)
+	refreshTime = timeInvocation()
+	return coldTime, warmTimes, refreshTime
+
+def main(iterations=ITERATIONS):
+	"""
+	Runs the benchmark.
+
+	:param iterations: Warm invocations count.
+	:type iterations: int
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	if RuntimeGlobals.modulesManager is None:
+		snippets.engine.run()
+
+	coldTime, warmTimes, refreshTime = benchmarkInvocation(iterations)
+	warmTimes = sorted(warmTimes)
+	print("{0:>24} | {1:>10}".format("Invocation", "Time (ms)"))
+	print("{0:>24} | {1:>10.3f}".format("Cold", coldTime * 1000))
+	print("{0:>24} | {1:>10.3f}".format("Warm (median)", warmTimes[len(warmTimes) // 2] * 1000))
+	print("{0:>24} | {1:>10.3f}".format("Warm (max)", warmTimes[-1] * 1000))
+	print("{0:>24} | {1:>10.3f}".format("After registry change", refreshTime * 1000))
+	return True
+
+if __name__ == "__main__":
+	main(int(sys.argv[1]) if sys.argv[1:] else ITERATIONS)
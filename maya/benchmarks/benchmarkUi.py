@@ -0,0 +1,327 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarkUi.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the ui layer, :class:`snippets.ui.models.InterfacesModel`, :class:`snippets.ui.search.InterfacesIndex`,
+	:class:`snippets.ui.views.Interfaces_QListView` and :class:`snippets.ui.widgets.search_QLineEdit.Search_QLineEdit`
+	classes, on synthetic catalogs served by a stub modules manager, the Loader and Popup population paths
+	are replayed without Maya.
+
+**Others:**
+	Usage: python benchmarkUi.py [--output file.json] [count ...]
+
+	The benchmark runs headless with Qt **offscreen** platform, Qt 4 builds without that platform
+	need a virtual X server, e.g. xvfb-run python benchmarkUi.py.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt4.QtCore import PYQT_VERSION_STR
+from PyQt4.QtCore import QT_VERSION_STR
+from PyQt4.QtGui import QApplication
+from PyQt4.QtGui import QStringListModel
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.dataStructures
+import foundations.strings
+from snippets.ui.models import InterfacesModel
+from snippets.ui.search import InterfacesIndex
+from snippets.ui.views import Interfaces_QListView
+from snippets.ui.widgets.search_QLineEdit import Search_QLineEdit
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["COUNTS",
+			"WORDS",
+			"QUERIES",
+			"StubModule",
+			"StubModulesManager",
+			"getInterfaceName",
+			"timeCall",
+			"benchmarkCatalog",
+			"benchmarkPainting",
+			"main"]
+
+COUNTS = (100, 1000, 5000, 20000)
+
+WORDS = ("make", "planar", "snap", "vertex", "select", "uvs", "shell", "random", "align", "export", "camera", "zoom",
+		"mirror", "freeze", "transform", "cleanup", "hierarchy", "history", "normals", "soft", "edges", "faces")
+
+QUERIES = ("snap vertex", "selshell", "cleanup history", "mirror")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class StubModule(foundations.dataStructures.Structure):
+	"""
+	Defines a stub module exposing the attributes the ui layer reads from
+	:class:`snippets.managers.modulesManager.Module` class instances.
+	"""
+
+	def __init__(self, **kwargs):
+		"""
+		Initializes the class.
+
+		:param \*\*kwargs: name, file, interfaces, tokens.
+		:type \*\*kwargs: dict
+		"""
+
+		foundations.dataStructures.Structure.__init__(self, **kwargs)
+
+class StubModulesManager(object):
+	"""
+	Defines a stub modules manager serving a synthetic interfaces catalog
+	like :class:`snippets.managers.modulesManager.ModulesManager` class does.
+	"""
+
+	def __init__(self, count, interfacesPerModule=8):
+		"""
+		Initializes the class.
+
+		:param count: Interfaces count.
+		:type count: int
+		:param interfacesPerModule: Interfaces count per module.
+		:type interfacesPerModule: int
+		"""
+
+		random.seed(count)
+		attributes = set()
+		while len(attributes) < count:
+			attributes.add("I{0}{1}".format("".join(random.choice(WORDS).title() for i in range(3)),
+											random.randint(0, 999)))
+		attributes = sorted(attributes)
+
+		self.version = 1
+		self.__interfaces = {}
+		for i in range(0, count, interfacesPerModule):
+			name = "module{0}".format(i // interfacesPerModule)
+			module = StubModule(name=name,
+								file="/libraries/{0}.py".format(name),
+								interfaces=attributes[i:i + interfacesPerModule],
+								tokens=None)
+			for attribute in module.interfaces:
+				self.__interfaces[attribute] = module
+
+	def listInterfaces(self):
+		"""
+		Lists the interfaces.
+
+		:return: Interfaces.
+		:rtype: list
+		"""
+
+		return self.__interfaces.keys()
+
+	def getInterfaceModule(self, interface):
+		"""
+		Returns given interface module.
+
+		:param interface: Interface name.
+		:type interface: unicode
+		:return: Module.
+		:rtype: StubModule
+		"""
+
+		return self.__interfaces.get(interface)
+
+def getInterfaceName(attribute):
+	"""
+	Returns given interface attribute display name like the Loader and Popup do.
+
+	:param attribute: Interface attribute.
+	:type attribute: unicode
+	:return: Interface name.
+	:rtype: unicode
+	"""
+
+	return foundations.strings.getNiceName("{0}{1}".format(attribute[1].lower(), attribute[2:]))
+
+def timeCall(callable, *args):
+	"""
+	Returns given callable execution time.
+
+	:param callable: Callable.
+	:type callable: object
+	:param \*args: Arguments.
+	:type \*args: \*
+	:return: Execution time.
+	:rtype: float
+	"""
+
+	start = timeit.default_timer()
+	callable(*args)
+	return timeit.default_timer() - start
+
+def benchmarkCatalog(count):
+	"""
+	Benchmarks the ui layer on a catalog of given interfaces count.
+
+	Keystrokes times are the mean time per typed character of :attr:`QUERIES` attribute queries.
+
+	:param count: Interfaces count.
+	:type count: int
+	:return: Timings in seconds.
+	:rtype: dict
+	"""
+
+	modulesManager = StubModulesManager(count)
+	timings = {}
+
+	index = InterfacesIndex(getInterfaceName)
+	timings["indexBuild"] = timeCall(index.build, modulesManager)
+
+	interfaces = index.filter()
+	model = InterfacesModel()
+	timings["modelBuild"] = timeCall(model.registerInterfaces, interfaces)
+
+	lineEdit = Search_QLineEdit()
+	timings["completerBuild"] = timeCall(
+	lambda: lineEdit.completer.setModel(QStringListModel([interface.name for interface in interfaces])))
+
+	timings["modelSort"] = timeCall(model.sort)
+
+	names = [interface.name for interface in interfaces]
+	random.shuffle(names)
+	timings["exactLookup"] = timeCall(lambda: [model.getInterfaceByName(name) for name in names]) / len(names)
+
+	def loaderKeystroke(text):
+		model.updateInterfaces(sorted(index.search(text), key=lambda x: (x.name)))
+
+	def loaderFilterKeystroke(text):
+		model.updateInterfaces(index.filter(text))
+
+	def popupKeystroke(text):
+		lineEdit.completer.setModel(QStringListModel([interface.name for interface in index.search(text)]))
+
+	for name, keystroke in (("loaderKeystroke", loaderKeystroke),
+							("loaderFilterKeystroke", loaderFilterKeystroke),
+							("popupKeystroke", popupKeystroke)):
+		model.updateInterfaces(interfaces)
+		times = []
+		for query in QUERIES:
+			for i in range(1, len(query) + 1):
+				times.append(timeCall(keystroke, query[:i]))
+			keystroke("")
+		times.sort()
+		timings[name] = sum(times) / len(times)
+		timings["{0}Max".format(name)] = times[-1]
+	return timings
+
+def benchmarkPainting(count, width=320, height=640):
+	"""
+	Benchmarks the painting of a catalog of given interfaces count in a View.
+
+	Scrolling time is the mean time per page painted while scrolling through the whole catalog.
+
+	:param count: Interfaces count.
+	:type count: int
+	:param width: View width.
+	:type width: int
+	:param height: View height.
+	:type height: int
+	:return: Timings in seconds.
+	:rtype: dict
+	"""
+
+	index = InterfacesIndex(getInterfaceName)
+	index.build(StubModulesManager(count))
+	model = InterfacesModel()
+	model.registerInterfaces(index.filter())
+
+	view = Interfaces_QListView(None, model)
+	view.resize(width, height)
+	timings = {}
+	timings["viewShow"] = timeCall(lambda: (view.show(), QApplication.processEvents()))
+	timings["viewPaint"] = timeCall(view.viewport().repaint)
+
+	scrollBar = view.verticalScrollBar()
+	times = []
+	for value in range(scrollBar.minimum(), scrollBar.maximum() + 1, max(scrollBar.pageStep(), 1)):
+		times.append(timeCall(lambda: (scrollBar.setValue(value), view.viewport().repaint())))
+	timings["viewScroll"] = sum(times) / max(len(times), 1)
+	timings["viewScrollMax"] = max(times or (0,))
+
+	timings["viewResize"] = timeCall(lambda: (view.resize(width * 2, height * 2), QApplication.processEvents()))
+	view.close()
+	return timings
+
+def main(counts=COUNTS, output=None):
+	"""
+	Runs the benchmark.
+
+	:param counts: Interfaces counts.
+	:type counts: tuple
+	:param output: Json results file.
+	:type output: unicode
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	application = QApplication.instance() or QApplication(sys.argv)
+
+	results = {}
+	for count in counts:
+		results[count] = timings = benchmarkCatalog(count)
+		timings.update(benchmarkPainting(count))
+		print("{0:>10} interfaces:".format(count))
+		for name, value in sorted(timings.iteritems()):
+			print("{0:>32} | {1:>12.4f} ms".format(name, value * 1000))
+
+	if output:
+		with open(output, "w") as file:
+			json.dump({"date": datetime.datetime.now().isoformat(),
+						"platform": platform.platform(),
+						"python": sys.version,
+						"qt": QT_VERSION_STR,
+						"pyqt": PYQT_VERSION_STR,
+						"results": results}, file, indent=4, sort_keys=True)
+	return True
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Benchmarks the snippets ui layer.")
+	parser.add_argument("counts", type=int, nargs="*", default=COUNTS, help="Interfaces counts.")
+	parser.add_argument("-o", "--output", help="Json results file.")
+	arguments = parser.parse_args()
+	main(arguments.counts, arguments.output and foundations.strings.toString(arguments.output))
@@ -0,0 +1,351 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**benchmarkVectors.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Benchmarks the :mod:`snippets.libraries.core.vectors` module against the per point Maya api helpers
+	the libraries used before, with and without NumPy.
+
+**Others:**
+	Usage: python benchmarkVectors.py [--output file.json] [--benchmark name ...] [count ...]
+
+	The legacy helpers use :mod:`maya.OpenMaya` when available, e.g. with mayapy, and the headless Maya stand-in
+	from **mayaStandIn** directory otherwise, its api calls overhead is given by the --apiOverhead argument.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+try:
+	import maya.OpenMaya as OpenMaya
+except ImportError:
+	sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "mayaStandIn"))
+	import maya.OpenMaya as OpenMaya
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.strings
+from snippets.libraries.core import vectors
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["STAND_IN",
+			"COUNTS",
+			"MATRIX",
+			"getMVector",
+			"getMMatrix",
+			"normalize",
+			"vectorMatrixMultiplication",
+			"dot",
+			"getAverageVector",
+			"norme",
+			"getPlaneOffsets",
+			"BENCHMARKS",
+			"getValues",
+			"benchmarkVectors",
+			"main"]
+
+STAND_IN = sys.modules.get("maya.standIn")
+
+COUNTS = (1000, 10000, 100000)
+
+MATRIX = [0., 0., -1., 0., 0., 1., 0., 0., 1., 0., 0., 0., 10., 20., 30., 1.]
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getMVector(vector):
+	"""
+	Returns an MVector.
+
+	:param vector: Vector.
+	:type vector: list
+	:return: MVector
+	:rtype: MVector
+	"""
+
+	return OpenMaya.MVector(vector[0], vector[1], vector[2])
+
+def getMMatrix(matrix):
+	"""
+	Returns an MMatrix.
+
+	:param matrix: matrix.
+	:type matrix: list
+	:return: MMatrix
+	:rtype: MMatrix
+	"""
+
+	mMatrix = OpenMaya.MMatrix()
+	OpenMaya.MScriptUtil.createMatrixFromList(matrix, mMatrix)
+	return mMatrix
+
+def normalize(vector):
+	"""
+	Returns the normalized vector.
+
+	:param vector: Vector.
+	:type vector: list
+	:return: Normalized vector
+	:rtype: tuple
+	"""
+
+	mVector = getMVector(vector)
+	mVector.normalize()
+	return (mVector.x, mVector.y, mVector.z)
+
+def vectorMatrixMultiplication(vector, matrix):
+	"""
+	Returns the vector multiplication between a Vector And a matrix.
+
+	:param vector: Vector.
+	:type vector: list
+	:param matrix: matrix.
+	:type matrix: list
+	:return: Matrix multiplied vector.
+	:rtype: tuple
+	"""
+
+	mVector = getMVector(vector)
+	mMatrix = getMMatrix(matrix)
+	mVector = mVector * mMatrix
+	return (mVector.x, mVector.y, mVector.z)
+
+def dot(vectorA, vectorB):
+	"""
+	Returns the dot product between two vectors.
+
+	:param vectorA: Vector A.
+	:type vectorA: list
+	:param vectorB: Vector B.
+	:type vectorB: list
+	:return: Dot product.
+	:rtype: float
+	"""
+
+	mVectorA = getMVector(vectorA)
+	mVectorB = getMVector(vectorB)
+	return mVectorA * mVectorB
+
+def getAverageVector(vectors):
+	"""
+	Returns the average vector from a list of vectors.
+
+	:param vectors: Vectors to get the average one.
+	:type vectors: list
+	:return: Average vector.
+	:rtype: list
+	"""
+
+	averageVector = [0, 0, 0]
+	for vector in vectors:
+		for i in range(3):
+			averageVector[i] += vector[i]
+	for i in range(3):
+		averageVector[i] = averageVector[i] / len(vectors)
+	return averageVector
+
+def norme(pointA, pointB):
+	"""
+	Returns the norme of a vector.
+
+	:param pointA: Point A.
+	:type pointA: list
+	:param pointB: Point B.
+	:type pointB: list
+	:return: Norme
+	:rtype: float
+	"""
+
+	mPointA = OpenMaya.MPoint(pointA[0], pointA[1], pointA[2])
+	mPointB = OpenMaya.MPoint(pointB[0], pointB[1], pointB[2])
+	mVector = mPointA - mPointB
+	return mVector.length()
+
+def getPlaneOffsets(points, normal):
+	"""
+	Returns the offsets projecting given points onto the plane passing through their barycenter.
+
+	:param points: Points.
+	:type points: list
+	:param normal: Plane normal.
+	:type normal: tuple
+	:return: Offsets.
+	:rtype: list
+	"""
+
+	offset = -dot(normal, getAverageVector(points))
+	offsets = []
+	for point in points:
+		distance = -(dot(normal, point) + offset)
+		offsets.append((normal[0] * distance, normal[1] * distance, normal[2] * distance))
+	return offsets
+
+def _getPoints(values):
+	"""
+	Returns given flat values as points the way the libraries did before :mod:`snippets.libraries.core.vectors`.
+
+	:param values: Flat values.
+	:type values: list
+	:return: Points.
+	:rtype: list
+	"""
+
+	return [(values[i], values[i + 1], values[i + 2]) for i in range(0, len(values), 3)]
+
+BENCHMARKS = (("distances",
+				lambda values: [norme(point, (1, 2, 3)) for point in _getPoints(values)],
+				lambda values: vectors.getDistances(vectors.getVectors(values), (1, 2, 3))),
+			("dots",
+				lambda values: [dot(point, (0, 1, 0)) for point in _getPoints(values)],
+				lambda values: vectors.getDots(vectors.getVectors(values), (0, 1, 0))),
+			("normalize",
+				lambda values: [normalize(point) for point in _getPoints(values)],
+				lambda values: vectors.normalize(vectors.getVectors(values))),
+			("transform",
+				lambda values: [vectorMatrixMultiplication(point, MATRIX) for point in _getPoints(values)],
+				lambda values: vectors.transform(vectors.getVectors(values), MATRIX)),
+			("centroid",
+				lambda values: getAverageVector(_getPoints(values)),
+				lambda values: vectors.getCentroid(vectors.getVectors(values))),
+			("planeOffsets",
+				lambda values: getPlaneOffsets(_getPoints(values), (0, 1, 0)),
+				lambda values: vectors.getPlaneOffsets(vectors.getVectors(values),
+														vectors.getCentroid(vectors.getVectors(values)), (0, 1, 0))),
+			("closest",
+				lambda values: min(_getPoints(values), key=lambda point: norme(point, (1, 2, 3))),
+				lambda values: vectors.getClosest((1, 2, 3), vectors.getVectors(values))))
+
+def getValues(count):
+	"""
+	Returns given count of random points as flat values, e.g. like a **cmds.xform** query.
+
+	:param count: Points count.
+	:type count: int
+	:return: Flat values.
+	:rtype: list
+	"""
+
+	generator = random.Random(count)
+	return [generator.uniform(-100, 100) for i in range(count * 3)]
+
+def benchmarkVectors(count, benchmarks=None):
+	"""
+	Benchmarks the vectors definitions on given count of points.
+
+	:param count: Points count.
+	:type count: int
+	:param benchmarks: Benchmarks names, all by default.
+	:type benchmarks: tuple or list
+	:return: Timings in seconds.
+	:rtype: dict
+	"""
+
+	values = getValues(count)
+	numpy = vectors.numpy
+	timings = {}
+	for name, legacy, definition in BENCHMARKS:
+		if benchmarks and not name in benchmarks:
+			continue
+
+		start = timeit.default_timer()
+		legacy(values)
+		timings["{0}Legacy".format(name)] = timeit.default_timer() - start
+
+		try:
+			for implementation, module in (("NumPy", numpy), ("Python", None)):
+				if implementation == "NumPy" and module is None:
+					continue
+
+				vectors.numpy = module
+				start = timeit.default_timer()
+				definition(values)
+				timings["{0}{1}".format(name, implementation)] = timeit.default_timer() - start
+		finally:
+			vectors.numpy = numpy
+	return timings
+
+def main(counts=COUNTS, output=None, benchmarks=None):
+	"""
+	Runs the benchmark.
+
+	:param counts: Points counts.
+	:type counts: tuple
+	:param output: Json results file.
+	:type output: unicode
+	:param benchmarks: Benchmarks names, all by default.
+	:type benchmarks: tuple or list
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	results = {}
+	for count in counts:
+		results[count] = timings = benchmarkVectors(count, benchmarks)
+		print("{0:>10} points:".format(count))
+		for name, value in sorted(timings.iteritems()):
+			print("{0:>32} | {1:>12.4f} ms".format(name, value * 1000))
+
+	if output:
+		with open(output, "w") as file:
+			json.dump({"date": datetime.datetime.now().isoformat(),
+						"platform": platform.platform(),
+						"python": sys.version,
+						"numpy": vectors.numpy is not None and vectors.numpy.__version__ or None,
+						"openMaya": OpenMaya.__file__,
+						"overheads": STAND_IN and STAND_IN.OVERHEADS,
+						"results": results}, file, indent=4, sort_keys=True)
+	return True
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Benchmarks the snippets libraries vectors module.")
+	parser.add_argument("counts", type=int, nargs="*", default=COUNTS, help="Points counts.")
+	parser.add_argument("-o", "--output", help="Json results file.")
+	parser.add_argument("-b", "--benchmark", action="append", dest="benchmarks",
+						choices=[name for name, legacy, definition in BENCHMARKS], help="Benchmark name, repeatable.")
+	if STAND_IN:
+		parser.add_argument("--apiOverhead", type=float, default=STAND_IN.OVERHEADS["api"],
+							help="Stand-in api call overhead in seconds.")
+	arguments = parser.parse_args()
+	if STAND_IN:
+		STAND_IN.OVERHEADS.update(api=arguments.apiOverhead)
+	main(arguments.counts,
+		arguments.output and foundations.strings.toString(arguments.output),
+		arguments.benchmarks)
@@ -0,0 +1,910 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**OpenMaya.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the stand-in :mod:`maya.OpenMaya` module classes used by the libraries.
+
+**Others:**
+	Pointers created with :class:`MScriptUtil` class are plain Python objects storing their value.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import math
+import sys
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import maya.standIn as standIn
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["MObject",
+			"MDagPath",
+			"MSelectionList",
+			"MItSelectionList",
+			"MItMeshPolygon",
+			"MSpace",
+			"MIntArray",
+			"MPointArray",
+			"MFnMesh",
+			"MScriptUtil",
+			"MVector",
+			"MPoint",
+			"MMatrix",
+			"MGlobal"]
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class MObject(object):
+	"""
+	Defines the stand-in **MObject** class.
+	"""
+
+	def __init__(self, node=None):
+		"""
+		Initializes the class.
+
+		:param node: Stand-in node.
+		:type node: Node
+		"""
+
+		self.standInNode = node
+
+	def isNull(self):
+		"""
+		Returns if the object is null.
+
+		:return: Null state.
+		:rtype: bool
+		"""
+
+		return self.standInNode is None
+
+class MDagPath(object):
+	"""
+	Defines the stand-in **MDagPath** class.
+	"""
+
+	def __init__(self):
+		"""
+		Initializes the class.
+		"""
+
+		self.standInNode = None
+
+	def isValid(self):
+		"""
+		Returns if the path is valid.
+
+		:return: Path validity.
+		:rtype: bool
+		"""
+
+		return self.standInNode is not None
+
+	def node(self):
+		"""
+		Returns the path node.
+
+		:return: Node.
+		:rtype: MObject
+		"""
+
+		return MObject(self.standInNode)
+
+	def fullPathName(self):
+		"""
+		Returns the path full name.
+
+		:return: Full path name.
+		:rtype: unicode
+		"""
+
+		return self.standInNode.getPath(True)
+
+	def partialPathName(self):
+		"""
+		Returns the path partial name.
+
+		:return: Partial path name.
+		:rtype: unicode
+		"""
+
+		return self.standInNode.getPath()
+
+	@standIn.api
+	def extendToShape(self):
+		"""
+		Extends the path to the node mesh shape.
+		"""
+
+		mesh = standIn.getMesh(self.standInNode)
+		if mesh is None:
+			raise RuntimeError("(kInvalidParameter): Object is not a shape or has no shape")
+		self.standInNode = mesh
+
+	@standIn.api
+	def inclusiveMatrixInverse(self):
+		"""
+		Returns the path inverse world matrix, the stand-in transforms only have a translation.
+
+		:return: Inverse world matrix.
+		:rtype: MMatrix
+		"""
+
+		matrix = MMatrix()
+		matrix.rows[3][:3] = [-value for value in standIn.getTransform(self.standInNode).translate]
+		return matrix
+
+class MSelectionList(object):
+	"""
+	Defines the stand-in **MSelectionList** class, only nodes are supported.
+	"""
+
+	def __init__(self):
+		"""
+		Initializes the class.
+		"""
+
+		self.nodes = []
+
+	@standIn.api
+	def add(self, name):
+		"""
+		Adds given node to the selection list.
+
+		:param name: Node name.
+		:type name: unicode
+		"""
+
+		node = standIn.getNode(name)
+		if node is None:
+			raise RuntimeError("(kInvalidParameter): Object does not exist")
+		self.nodes.append(node)
+
+	def length(self):
+		"""
+		Returns the selection list length.
+
+		:return: Selection list length.
+		:rtype: int
+		"""
+
+		return len(self.nodes)
+
+	def clear(self):
+		"""
+		Clears the selection list.
+		"""
+
+		del self.nodes[:]
+
+	@standIn.api
+	def getDagPath(self, index, dagPath, component=None):
+		"""
+		Sets given dag path to given index node.
+
+		:param index: Node index.
+		:type index: int
+		:param dagPath: Dag path.
+		:type dagPath: MDagPath
+		:param component: Unused, components are not supported.
+		:type component: MObject
+		"""
+
+		dagPath.standInNode = self.nodes[index]
+
+class MItSelectionList(object):
+	"""
+	Defines the stand-in **MItSelectionList** class.
+	"""
+
+	def __init__(self, selectionList):
+		"""
+		Initializes the class.
+
+		:param selectionList: Selection list.
+		:type selectionList: MSelectionList
+		"""
+
+		self.__selectionList = selectionList
+		self.__index = 0
+
+	def isDone(self):
+		"""
+		Returns if the iteration is done.
+
+		:return: Iteration state.
+		:rtype: bool
+		"""
+
+		return self.__index >= self.__selectionList.length()
+
+	def next(self):
+		"""
+		Moves to the next node.
+		"""
+
+		self.__index += 1
+
+	def getDagPath(self, dagPath, component=None):
+		"""
+		Sets given dag path to current node.
+
+		:param dagPath: Dag path.
+		:type dagPath: MDagPath
+		:param component: Unused, components are not supported.
+		:type component: MObject
+		"""
+
+		self.__selectionList.getDagPath(self.__index, dagPath, component)
+
+class MItMeshPolygon(object):
+	"""
+	Defines the stand-in **MItMeshPolygon** class.
+	"""
+
+	@standIn.api
+	def __init__(self, dagPath, component=None):
+		"""
+		Initializes the class.
+
+		:param dagPath: Mesh dag path or object.
+		:type dagPath: MDagPath or MObject
+		:param component: Unused, components are not supported.
+		:type component: MObject
+		"""
+
+		self.__mesh = standIn.getMesh(dagPath.standInNode)
+		if self.__mesh is None:
+			raise RuntimeError("(kInvalidParameter): Object is incompatible with this method")
+		self.__index = 0
+
+	@standIn.api
+	def isDone(self):
+		"""
+		Returns if the iteration is done.
+
+		:return: Iteration state.
+		:rtype: bool
+		"""
+
+		return self.__index >= len(self.__mesh.faces)
+
+	@standIn.api
+	def next(self):
+		"""
+		Moves to the next polygon.
+		"""
+
+		self.__index += 1
+
+	def reset(self):
+		"""
+		Resets the iterator.
+		"""
+
+		self.__index = 0
+
+	def index(self):
+		"""
+		Returns current polygon index.
+
+		:return: Polygon index.
+		:rtype: int
+		"""
+
+		return self.__index
+
+	def count(self):
+		"""
+		Returns the polygons count.
+
+		:return: Polygons count.
+		:rtype: int
+		"""
+
+		return len(self.__mesh.faces)
+
+	@standIn.api
+	def polygonVertexCount(self):
+		"""
+		Returns current polygon vertices count.
+
+		:return: Vertices count.
+		:rtype: int
+		"""
+
+		return len(self.__mesh.faces[self.__index])
+
+	@standIn.api
+	def getArea(self, pointer, space=None):
+		"""
+		Stores current polygon area in given pointer.
+
+		:param pointer: Double pointer.
+		:type pointer: object
+		:param space: Unused, meshes transforms only carry a translation.
+		:type space: int
+		"""
+
+		pointer.value = self.__mesh.getFaceNormalArea(self.__index)[1]
+
+	@standIn.api
+	def getUVArea(self, pointer, uvSet=None):
+		"""
+		Stores current polygon uvs area in given pointer.
+
+		:param pointer: Double pointer.
+		:type pointer: object
+		:param uvSet: Unused, meshes have a single uv set.
+		:type uvSet: unicode
+		"""
+
+		pointer.value = self.__mesh.getFaceUVArea(self.__index)
+
+class MSpace(object):
+	"""
+	Defines the stand-in **MSpace** class.
+	"""
+
+	kInvalid = 0
+	kTransform = 1
+	kPreTransform = 2
+	kPostTransform = 3
+	kWorld = 4
+	kObject = kPreTransform
+
+class _Array(object):
+	"""
+	Defines the stand-in arrays base class.
+	"""
+
+	def __init__(self):
+		"""
+		Initializes the class.
+		"""
+
+		self.values = []
+
+	def length(self):
+		"""
+		Returns the array length.
+
+		:return: Array length.
+		:rtype: int
+		"""
+
+		return len(self.values)
+
+	@standIn.api
+	def __getitem__(self, index):
+		"""
+		Reimplements the :meth:`object.__getitem__` method.
+
+		:param index: Item index.
+		:type index: int
+		:return: Item.
+		:rtype: object
+		"""
+
+		return self.values[index]
+
+class MIntArray(_Array):
+	"""
+	Defines the stand-in **MIntArray** class.
+	"""
+
+	pass
+
+class MPointArray(_Array):
+	"""
+	Defines the stand-in **MPointArray** class.
+	"""
+
+	pass
+
+class MFnMesh(object):
+	"""
+	Defines the stand-in **MFnMesh** class.
+	"""
+
+	@standIn.api
+	def __init__(self, dagPath):
+		"""
+		Initializes the class.
+
+		:param dagPath: Mesh dag path or object.
+		:type dagPath: MDagPath or MObject
+		"""
+
+		self.__mesh = standIn.getMesh(dagPath.standInNode)
+
+	@standIn.api
+	def numVertices(self):
+		"""
+		Returns the mesh vertices count.
+
+		:return: Vertices count.
+		:rtype: int
+		"""
+
+		return len(self.__mesh.points)
+
+	@standIn.api
+	def getPoints(self, pointArray, space=MSpace.kObject):
+		"""
+		Sets given array to the mesh points.
+
+		:param pointArray: Points array.
+		:type pointArray: MPointArray
+		:param space: Points space.
+		:type space: int
+		"""
+
+		points = [self.__mesh.getWorldPoint(index) for index in range(len(self.__mesh.points))] \
+		if space == MSpace.kWorld else self.__mesh.points
+
+		# The points are built without the api call overhead, a single call fills the whole array.
+		pointArray.values = []
+		for x, y, z in points:
+			point = MPoint.__new__(MPoint)
+			point.x, point.y, point.z, point.w = float(x), float(y), float(z), 1.
+			pointArray.values.append(point)
+
+	@standIn.api
+	def getPolygonVertices(self, index, vertices):
+		"""
+		Sets given array to given face vertices indices.
+
+		:param index: Face index.
+		:type index: int
+		:param vertices: Vertices indices array.
+		:type vertices: MIntArray
+		"""
+
+		vertices.values = list(self.__mesh.faces[index])
+
+	@standIn.api
+	def getClosestPoint(self, point, closestPoint, space=MSpace.kObject, closestPolygon=None):
+		"""
+		Sets given point to the closest point on the mesh to given point, the closest point is the center of the face
+		with the closest center.
+
+		:param point: Point.
+		:type point: MPoint
+		:param closestPoint: Closest point.
+		:type closestPoint: MPoint
+		:param space: Points space.
+		:type space: int
+		:param closestPolygon: Closest face index pointer.
+		:type closestPolygon: MScriptUtil
+		"""
+
+		translate = self.__mesh.parent.translate if space != MSpace.kWorld else (0., 0., 0.)
+		face = self.__mesh.getClosestFace([point.x + translate[0], point.y + translate[1], point.z + translate[2]])
+		center = self.__mesh.getFaceCenter(face)
+		closestPoint.x, closestPoint.y, closestPoint.z = [a - b for a, b in zip(center, translate)]
+		if closestPolygon is not None:
+			closestPolygon.value = face
+
+class MScriptUtil(object):
+	"""
+	Defines the stand-in **MScriptUtil** class.
+	"""
+
+	def __init__(self):
+		"""
+		Initializes the class.
+		"""
+
+		self.value = 0.
+
+	def createFromDouble(self, *args):
+		"""
+		Initializes the stored value.
+
+		:param \*args: Values, only the first one is stored.
+		:type \*args: \*
+		"""
+
+		self.value = float(args[0]) if args else 0.
+
+	def createFromInt(self, *args):
+		"""
+		Initializes the stored value.
+
+		:param \*args: Values, only the first one is stored.
+		:type \*args: \*
+		"""
+
+		self.value = int(args[0]) if args else 0
+
+	def asIntPtr(self):
+		"""
+		Returns a pointer to the stored value.
+
+		:return: Pointer.
+		:rtype: MScriptUtil
+		"""
+
+		return self
+
+	def asDoublePtr(self):
+		"""
+		Returns a pointer to the stored value.
+
+		:return: Pointer.
+		:rtype: MScriptUtil
+		"""
+
+		return self
+
+	@staticmethod
+	@standIn.api
+	def getDouble(pointer):
+		"""
+		Returns given pointer value.
+
+		:param pointer: Pointer.
+		:type pointer: MScriptUtil
+		:return: Pointer value.
+		:rtype: float
+		"""
+
+		return pointer.value
+
+	@staticmethod
+	@standIn.api
+	def getInt(pointer):
+		"""
+		Returns given pointer value.
+
+		:param pointer: Pointer.
+		:type pointer: MScriptUtil
+		:return: Pointer value.
+		:rtype: int
+		"""
+
+		return int(pointer.value)
+
+	@staticmethod
+	@standIn.api
+	def createMatrixFromList(values, matrix):
+		"""
+		Sets given matrix from given 16 values list.
+
+		:param values: Matrix values.
+		:type values: list
+		:param matrix: Matrix.
+		:type matrix: MMatrix
+		"""
+
+		matrix.rows = [list(values[i:i + 4]) for i in range(0, 16, 4)]
+
+class MVector(object):
+	"""
+	Defines the stand-in **MVector** class.
+	"""
+
+	@standIn.api
+	def __init__(self, x=0., y=0., z=0.):
+		"""
+		Initializes the class.
+
+		:param x: X value.
+		:type x: float
+		:param y: Y value.
+		:type y: float
+		:param z: Z value.
+		:type z: float
+		"""
+
+		self.x, self.y, self.z = float(x), float(y), float(z)
+
+	def __getitem__(self, index):
+		"""
+		Reimplements the :meth:`object.__getitem__` method.
+
+		:param index: Component index.
+		:type index: int
+		:return: Component value.
+		:rtype: float
+		"""
+
+		return (self.x, self.y, self.z)[index]
+
+	def __add__(self, other):
+		"""
+		Reimplements the :meth:`object.__add__` method.
+
+		:param other: Vector.
+		:type other: MVector
+		:return: Sum.
+		:rtype: MVector
+		"""
+
+		return MVector(self.x + other.x, self.y + other.y, self.z + other.z)
+
+	def __sub__(self, other):
+		"""
+		Reimplements the :meth:`object.__sub__` method.
+
+		:param other: Vector.
+		:type other: MVector
+		:return: Difference.
+		:rtype: MVector
+		"""
+
+		return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+
+	def __neg__(self):
+		"""
+		Reimplements the :meth:`object.__neg__` method.
+
+		:return: Negated vector.
+		:rtype: MVector
+		"""
+
+		return MVector(-self.x, -self.y, -self.z)
+
+	def __mul__(self, other):
+		"""
+		Reimplements the :meth:`object.__mul__` method.
+
+		:param other: Vector, matrix or scalar.
+		:type other: MVector or MMatrix or float
+		:return: Dot product, transformed vector or scaled vector.
+		:rtype: float or MVector
+		"""
+
+		if isinstance(other, MVector):
+			return self.x * other.x + self.y * other.y + self.z * other.z
+		elif isinstance(other, MMatrix):
+			rows = other.rows
+			return MVector(*(self.x * rows[0][i] + self.y * rows[1][i] + self.z * rows[2][i] for i in range(3)))
+		return MVector(self.x * other, self.y * other, self.z * other)
+
+	__rmul__ = __mul__
+
+	def __imul__(self, other):
+		"""
+		Reimplements the :meth:`object.__imul__` method.
+
+		:param other: Scalar.
+		:type other: float
+		:return: Scaled vector.
+		:rtype: MVector
+		"""
+
+		self.x *= other
+		self.y *= other
+		self.z *= other
+		return self
+
+	def __xor__(self, other):
+		"""
+		Reimplements the :meth:`object.__xor__` method.
+
+		:param other: Vector.
+		:type other: MVector
+		:return: Cross product.
+		:rtype: MVector
+		"""
+
+		return MVector(self.y * other.z - self.z * other.y,
+						self.z * other.x - self.x * other.z,
+						self.x * other.y - self.y * other.x)
+
+	@standIn.api
+	def length(self):
+		"""
+		Returns the vector length.
+
+		:return: Length.
+		:rtype: float
+		"""
+
+		return math.sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
+
+	def normalize(self):
+		"""
+		Normalizes the vector in place.
+
+		:return: Vector.
+		:rtype: MVector
+		"""
+
+		length = self.length()
+		if length:
+			self.x, self.y, self.z = self.x / length, self.y / length, self.z / length
+		return self
+
+	def normal(self):
+		"""
+		Returns the normalized vector.
+
+		:return: Normalized vector.
+		:rtype: MVector
+		"""
+
+		return MVector(self.x, self.y, self.z).normalize()
+
+class MPoint(object):
+	"""
+	Defines the stand-in **MPoint** class.
+	"""
+
+	@standIn.api
+	def __init__(self, x=0., y=0., z=0., w=1.):
+		"""
+		Initializes the class.
+
+		:param x: X value.
+		:type x: float
+		:param y: Y value.
+		:type y: float
+		:param z: Z value.
+		:type z: float
+		:param w: W value.
+		:type w: float
+		"""
+
+		self.x, self.y, self.z, self.w = float(x), float(y), float(z), float(w)
+
+	def __getitem__(self, index):
+		"""
+		Reimplements the :meth:`object.__getitem__` method.
+
+		:param index: Component index.
+		:type index: int
+		:return: Component value.
+		:rtype: float
+		"""
+
+		return (self.x, self.y, self.z, self.w)[index]
+
+	def __add__(self, other):
+		"""
+		Reimplements the :meth:`object.__add__` method.
+
+		:param other: Vector.
+		:type other: MVector
+		:return: Translated point.
+		:rtype: MPoint
+		"""
+
+		return MPoint(self.x + other.x, self.y + other.y, self.z + other.z)
+
+	def __sub__(self, other):
+		"""
+		Reimplements the :meth:`object.__sub__` method.
+
+		:param other: Point or vector.
+		:type other: MPoint or MVector
+		:return: Vector between the points or translated point.
+		:rtype: MVector or MPoint
+		"""
+
+		if isinstance(other, MPoint):
+			return MVector(self.x - other.x, self.y - other.y, self.z - other.z)
+		return MPoint(self.x - other.x, self.y - other.y, self.z - other.z)
+
+	def distanceTo(self, other):
+		"""
+		Returns the distance to given point.
+
+		:param other: Point.
+		:type other: MPoint
+		:return: Distance.
+		:rtype: float
+		"""
+
+		return (self - other).length()
+
+class MMatrix(object):
+	"""
+	Defines the stand-in **MMatrix** class.
+	"""
+
+	def __init__(self):
+		"""
+		Initializes the class.
+		"""
+
+		self.rows = [[float(i == j) for j in range(4)] for i in range(4)]
+
+	def __call__(self, row, column):
+		"""
+		Reimplements the :meth:`object.__call__` method.
+
+		:param row: Row index.
+		:type row: int
+		:param column: Column index.
+		:type column: int
+		:return: Matrix value.
+		:rtype: float
+		"""
+
+		return self.rows[row][column]
+
+class MGlobal(object):
+	"""
+	Defines the stand-in **MGlobal** class.
+	"""
+
+	@staticmethod
+	def displayInfo(message):
+		"""
+		Displays given info message.
+
+		:param message: Message.
+		:type message: unicode
+		"""
+
+		sys.stderr.write("{0}\n".format(message))
+
+	@staticmethod
+	def displayWarning(message):
+		"""
+		Displays given warning message.
+
+		:param message: Message.
+		:type message: unicode
+		"""
+
+		sys.stderr.write("# Warning: {0} #\n".format(message))
+
+	@staticmethod
+	def displayError(message):
+		"""
+		Displays given error message.
+
+		:param message: Message.
+		:type message: unicode
+		"""
+
+		sys.stderr.write("# Error: {0} #\n".format(message))
+
+	@staticmethod
+	def getActiveSelectionList(selectionList):
+		"""
+		Sets given selection list to the active selection nodes.
+
+		:param selectionList: Selection list.
+		:type selectionList: MSelectionList
+		"""
+
+		selectionList.clear()
+		for name, node, type, indices in standIn.getItems(standIn.SCENE.selection):
+			selectionList.nodes.append(node)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**__init__.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the headless in-memory Maya stand-in package, :mod:`maya.cmds`, :mod:`maya.mel`
+	and :mod:`maya.OpenMaya` modules are implemented on top of :mod:`maya.standIn` module scene.
+
+**Others:**
+	Only the subset used by the libraries is implemented, the package directory parent is inserted in **sys.path**
+	to shadow a missing Maya installation, e.g. by the benchmarks.
+
+"""
@@ -0,0 +1,674 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**cmds.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the stand-in :mod:`maya.cmds` module commands used by the libraries.
+
+**Others:**
+	Commands accept the long and short flags names, unsupported flags are ignored.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import math
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import maya.standIn as standIn
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["file",
+			"polyPlane",
+			"ls",
+			"select",
+			"objExists",
+			"nodeType",
+			"listRelatives",
+			"listHistory",
+			"delete",
+			"getAttr",
+			"setAttr",
+			"polyListComponentConversion",
+			"filterExpand",
+			"polyEvaluate",
+			"polyInfo",
+			"polyEditUV",
+			"xform",
+			"pointPosition",
+			"move",
+			"undoInfo",
+			"repeatLast",
+			"progressBar",
+			"pluginInfo",
+			"loadPlugin"]
+
+CONVERSIONS = (("toVertex", "tv", "vtx"),
+				("toEdge", "te", "e"),
+				("toFace", "tf", "f"),
+				("toUV", "tuv", "map"),
+				("toVertexFace", "tvf", "vtxFace"))
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def _getNodes(items):
+	"""
+	Returns the nodes of given items or the selected ones.
+
+	:param items: Items.
+	:type items: tuple
+	:return: Nodes.
+	:rtype: list
+	"""
+
+	return [node for name, node, type, indices in standIn.getItems(items[0] if items else standIn.SCENE.selection)]
+
+def _getVertices(items):
+	"""
+	Returns the vertices of given items as (mesh, vertex indices) tuples.
+
+	:param items: Items.
+	:type items: unicode or tuple or list
+	:return: Vertices.
+	:rtype: list
+	"""
+
+	vertices = []
+	for name, node, type, indices in standIn.getItems(items):
+		mesh = standIn.getMesh(node)
+		if mesh is None:
+			continue
+
+		vertices.append((mesh, indices if type == "vtx" else mesh.convert(type, indices, "vtx")))
+	return vertices
+
+@standIn.command
+def file(*args, **kwargs):
+	"""
+	Stand-in **file** command, only supports new scenes.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	"""
+
+	if standIn.getFlag(kwargs, ("new",)):
+		standIn.SCENE.clear()
+
+@standIn.command
+def polyPlane(**kwargs):
+	"""
+	Stand-in **polyPlane** command creating a plane in the xz plane.
+
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Transform, creation node.
+	:rtype: list
+	"""
+
+	subdivisionsX = int(standIn.getFlag(kwargs, ("subdivisionsX", "sx"), 10))
+	subdivisionsY = int(standIn.getFlag(kwargs, ("subdivisionsY", "sy"), 10))
+	width = float(standIn.getFlag(kwargs, ("width", "w"), 1))
+	height = float(standIn.getFlag(kwargs, ("height", "h"), 1))
+
+	points, uvs = [], []
+	for j in range(subdivisionsY + 1):
+		for i in range(subdivisionsX + 1):
+			u, v = float(i) / subdivisionsX, float(j) / subdivisionsY
+			points.append([(u - 0.5) * width, 0., (0.5 - v) * height])
+			uvs.append([u, v])
+
+	faces = []
+	for j in range(subdivisionsY):
+		for i in range(subdivisionsX):
+			vertex = j * (subdivisionsX + 1) + i
+			faces.append((vertex, vertex + 1, vertex + subdivisionsX + 2, vertex + subdivisionsX + 1))
+
+	mesh = standIn.SCENE.createMesh(standIn.getFlag(kwargs, ("name", "n"), "pPlane1"), points, faces, uvs, list(faces))
+	return [mesh.parent.name, standIn.SCENE.getUniqueName("polyPlane1")]
+
+@standIn.command
+def ls(*args, **kwargs):
+	"""
+	Stand-in **ls** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Nodes and components.
+	:rtype: list
+	"""
+
+	flatten = standIn.getFlag(kwargs, ("flatten", "fl"), False)
+	long = standIn.getFlag(kwargs, ("long", "l"), False)
+	objectsOnly = standIn.getFlag(kwargs, ("objectsOnly", "o"), False)
+	types = standIn.getFlag(kwargs, ("type", "typ"))
+	types = types and (set(types) if isinstance(types, (tuple, list)) else set((types,)))
+
+	if args:
+		items = args[0]
+	elif standIn.getFlag(kwargs, ("selection", "sl")):
+		items = standIn.SCENE.selection
+	else:
+		items = [node.name for node in standIn.SCENE.nodes.values()]
+
+	output, seen = [], set()
+	for name, node, type, indices in standIn.getItems(items):
+		if type is None or objectsOnly:
+			if type is not None:
+				node = standIn.getMesh(node)
+			if types and not node.type in types:
+				continue
+
+			path = node.getPath(long)
+			if not path in seen:
+				seen.add(path)
+				output.append(path)
+			continue
+
+		for component in standIn.formatComponents(node.getPath(long), type, sorted(set(indices)), flatten):
+			if not component in seen:
+				seen.add(component)
+				output.append(component)
+	return output
+
+@standIn.command
+def select(*args, **kwargs):
+	"""
+	Stand-in **select** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	"""
+
+	if standIn.getFlag(kwargs, ("clear", "cl")):
+		del standIn.SCENE.selection[:]
+		return
+
+	items = ls(*args) if args else []
+	if standIn.getFlag(kwargs, ("add", "af")):
+		standIn.SCENE.selection.extend(items)
+	elif standIn.getFlag(kwargs, ("deselect", "d")):
+		standIn.SCENE.selection[:] = [item for item in standIn.SCENE.selection if not item in set(items)]
+	else:
+		standIn.SCENE.selection[:] = items
+
+@standIn.command
+def objExists(name):
+	"""
+	Stand-in **objExists** command.
+
+	:param name: Node name.
+	:type name: unicode
+	:return: Node existence.
+	:rtype: bool
+	"""
+
+	return bool(standIn.getItems(name))
+
+@standIn.command
+def nodeType(*args, **kwargs):
+	"""
+	Stand-in **nodeType** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Node type.
+	:rtype: unicode
+	"""
+
+	nodes = _getNodes(args)
+	if not nodes:
+		raise RuntimeError("No object matches name: {0}".format(args and args[0]))
+	return nodes[0].type
+
+@standIn.command
+def listRelatives(*args, **kwargs):
+	"""
+	Stand-in **listRelatives** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Relatives, **None** if there are none.
+	:rtype: list
+	"""
+
+	fullPath = standIn.getFlag(kwargs, ("fullPath", "f"), False)
+	relatives = []
+	for node in _getNodes(args):
+		if standIn.getFlag(kwargs, ("parent", "p")):
+			node.parent is not None and relatives.append(node.parent)
+		elif standIn.getFlag(kwargs, ("shapes", "s")):
+			relatives.extend(child for child in node.children if isinstance(child, standIn.Mesh))
+		else:
+			relatives.extend(node.children)
+	return [relative.getPath(fullPath) for relative in relatives] or None
+
+@standIn.command
+def listHistory(*args, **kwargs):
+	"""
+	Stand-in **listHistory** command, the stand-in nodes don't have any history.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: History nodes, **None** if there are none.
+	:rtype: list
+	"""
+
+	if not _getNodes(args):
+		raise RuntimeError("No object matches name: {0}".format(args and args[0]))
+
+@standIn.command
+def delete(*args, **kwargs):
+	"""
+	Stand-in **delete** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	"""
+
+	for node in _getNodes(args):
+		standIn.SCENE.removeNode(node)
+
+@standIn.command
+def getAttr(attribute, **kwargs):
+	"""
+	Stand-in **getAttr** command.
+
+	:param attribute: Node attribute.
+	:type attribute: unicode
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Attribute value.
+	:rtype: object
+	"""
+
+	name, attribute = attribute.split(".", 1)
+	node = standIn.getNode(name)
+	if node is None:
+		raise ValueError("No object matches name: {0}.{1}".format(name, attribute))
+	return node.getAttribute(attribute)
+
+@standIn.command
+def setAttr(attribute, *args, **kwargs):
+	"""
+	Stand-in **setAttr** command.
+
+	:param attribute: Node attribute.
+	:type attribute: unicode
+	:param \*args: Attribute values.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	"""
+
+	name, attribute = attribute.split(".", 1)
+	node = standIn.getNode(name)
+	if node is None:
+		raise RuntimeError("No object matches name: {0}.{1}".format(name, attribute))
+	node.setAttribute(attribute, list(args) if len(args) > 1 else args[0])
+
+@standIn.command
+def polyListComponentConversion(*args, **kwargs):
+	"""
+	Stand-in **polyListComponentConversion** command, the source components types are inferred.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Converted components.
+	:rtype: list
+	"""
+
+	target = "vtx"
+	for longName, shortName, type in CONVERSIONS:
+		if standIn.getFlag(kwargs, (longName, shortName)):
+			target = type
+			break
+
+	components = []
+	for name, node, type, indices in standIn.getItems(args[0] if args else standIn.SCENE.selection):
+		mesh = standIn.getMesh(node)
+		if mesh is not None:
+			components.extend(standIn.formatComponents(name, target, mesh.convert(type, indices, target)))
+	return components
+
+@standIn.command
+def filterExpand(*args, **kwargs):
+	"""
+	Stand-in **filterExpand** command, only supports polygon components masks.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Expanded components, **None** if there are none.
+	:rtype: list
+	"""
+
+	masks = standIn.getFlag(kwargs, ("selectionMask", "sm"), ())
+	types = set(standIn.COMPONENTS_MASKS.get(mask) for mask in (masks if isinstance(masks, (tuple, list)) else (masks,)))
+
+	components = []
+	for name, node, type, indices in standIn.getItems(args[0] if args else standIn.SCENE.selection):
+		if type in types:
+			components.extend(standIn.formatComponents(name, type, sorted(set(indices)), True))
+	return components or None
+
+@standIn.command
+def polyEvaluate(*args, **kwargs):
+	"""
+	Stand-in **polyEvaluate** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Evaluated value, a dictionary of the components counts if no flag is given.
+	:rtype: object
+	"""
+
+	nodes = _getNodes(args)
+	mesh = nodes and standIn.getMesh(nodes[0])
+	if not mesh:
+		return "Nothing counted : no polygonal object is selected."
+
+	if standIn.getFlag(kwargs, ("vertex", "v")):
+		return len(mesh.points)
+	elif standIn.getFlag(kwargs, ("edge", "e")):
+		return mesh.getCount("e")
+	elif standIn.getFlag(kwargs, ("face", "f")):
+		return len(mesh.faces)
+	elif standIn.getFlag(kwargs, ("uvcoord", "uv")):
+		return len(mesh.uvs)
+	elif standIn.getFlag(kwargs, ("triangle", "t")):
+		return sum(len(face) - 2 for face in mesh.faces)
+	elif standIn.getFlag(kwargs, ("area", "a")) or standIn.getFlag(kwargs, ("worldArea", "wa")):
+		return sum(mesh.getFaceNormalArea(i)[1] for i in range(len(mesh.faces)))
+	elif standIn.getFlag(kwargs, ("uvArea", "uva")):
+		return sum(mesh.getFaceUVArea(i) for i in range(len(mesh.faces)))
+
+	return {"vertex": len(mesh.points),
+			"edge": mesh.getCount("e"),
+			"face": len(mesh.faces),
+			"uvcoord": len(mesh.uvs),
+			"triangle": sum(len(face) - 2 for face in mesh.faces)}
+
+@standIn.command
+def polyInfo(*args, **kwargs):
+	"""
+	Stand-in **polyInfo** command, only supports faces normals.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Informations.
+	:rtype: list
+	"""
+
+	if not standIn.getFlag(kwargs, ("faceNormals", "fn")):
+		raise RuntimeError("Unsupported 'polyInfo' flags: {0}".format(", ".join(kwargs)))
+
+	informations = []
+	for name, node, type, indices in standIn.getItems(args[0] if args else standIn.SCENE.selection):
+		mesh = standIn.getMesh(node)
+		for index in mesh.convert(type, indices, "f"):
+			normal, area = mesh.getFaceNormalArea(index)
+			informations.append("FACE_NORMAL {0:>6}: {1:f} {2:f} {3:f}\n".format(index, *normal))
+	return informations
+
+@standIn.command
+def polyEditUV(*args, **kwargs):
+	"""
+	Stand-in **polyEditUV** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Queried uvs values.
+	:rtype: list
+	"""
+
+	uvs = []
+	for name, node, type, indices in standIn.getItems(args[0] if args else standIn.SCENE.selection):
+		mesh = standIn.getMesh(node)
+		if mesh is not None:
+			uvs.append((mesh, indices if type == "map" else mesh.convert(type, indices, "map")))
+
+	if standIn.getFlag(kwargs, ("query", "q")):
+		uValue = standIn.getFlag(kwargs, ("uValue", "u"), False)
+		vValue = standIn.getFlag(kwargs, ("vValue", "v"), False)
+		values = []
+		for mesh, indices in uvs:
+			for index in indices:
+				uv = mesh.uvs[index]
+				uValue and values.append(uv[0])
+				vValue and values.append(uv[1])
+		return values
+
+	pivotU = standIn.getFlag(kwargs, ("pivotU", "pu"), 0.)
+	pivotV = standIn.getFlag(kwargs, ("pivotV", "pv"), 0.)
+	scaleU = standIn.getFlag(kwargs, ("scaleU", "su"), 1.)
+	scaleV = standIn.getFlag(kwargs, ("scaleV", "sv"), 1.)
+	angle = math.radians(standIn.getFlag(kwargs, ("angle", "a"), 0.))
+	u = standIn.getFlag(kwargs, ("uValue", "u"), 0.)
+	v = standIn.getFlag(kwargs, ("vValue", "v"), 0.)
+	relative = standIn.getFlag(kwargs, ("relative", "r"), True)
+	transform = scaleU != 1 or scaleV != 1 or angle != 0
+	cosine, sine = math.cos(angle), math.sin(angle)
+	for mesh, indices in uvs:
+		for index in indices:
+			uv = mesh.uvs[index]
+			if transform:
+				x, y = (uv[0] - pivotU) * scaleU, (uv[1] - pivotV) * scaleV
+				uv[0], uv[1] = pivotU + x * cosine - y * sine, pivotV + x * sine + y * cosine
+			if relative:
+				uv[0] += u
+				uv[1] += v
+			else:
+				uv[0], uv[1] = u, v
+
+@standIn.command
+def xform(*args, **kwargs):
+	"""
+	Stand-in **xform** command, only supports translations and matrices queries.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Queried values.
+	:rtype: list
+	"""
+
+	items = standIn.getItems(args[0] if args else standIn.SCENE.selection)
+	if standIn.getFlag(kwargs, ("query", "q")):
+		values = []
+		for name, node, type, indices in items:
+			if type is None:
+				node = standIn.getTransform(node)
+				if standIn.getFlag(kwargs, ("matrix", "m")):
+					x, y, z = node.translate
+					values.extend((1., 0., 0., 0., 0., 1., 0., 0., 0., 0., 1., 0., x, y, z, 1.))
+				else:
+					values.extend(node.translate)
+				continue
+
+			mesh = standIn.getMesh(node)
+			for index in (indices if type == "vtx" else mesh.convert(type, indices, "vtx")):
+				values.extend(mesh.getWorldPoint(index))
+		return values
+
+	translation = standIn.getFlag(kwargs, ("translation", "t"))
+	if translation is None:
+		return
+
+	relative = standIn.getFlag(kwargs, ("relative", "r"), False)
+	for name, node, type, indices in items:
+		if type is None:
+			node = standIn.getTransform(node)
+			node.translate[:] = [a + b for a, b in zip(node.translate, translation)] if relative else list(translation)
+			continue
+
+		mesh = standIn.getMesh(node)
+		for index in (indices if type == "vtx" else mesh.convert(type, indices, "vtx")):
+			mesh.setWorldPoint(index, [a + b for a, b in zip(mesh.getWorldPoint(index), translation)]
+										if relative else translation)
+
+@standIn.command
+def pointPosition(*args, **kwargs):
+	"""
+	Stand-in **pointPosition** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Point position.
+	:rtype: list
+	"""
+
+	for mesh, indices in _getVertices(args[0] if args else standIn.SCENE.selection):
+		for index in indices:
+			if standIn.getFlag(kwargs, ("local", "l")):
+				return list(mesh.points[index])
+			return mesh.getWorldPoint(index)
+	raise RuntimeError("pointPosition: Invalid object or component.")
+
+@standIn.command
+def move(*args, **kwargs):
+	"""
+	Stand-in **move** command, only supports vertices.
+
+	:param \*args: x, y, z values, items.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	"""
+
+	translation, items = args[:3], list(args[3:]) or standIn.SCENE.selection
+	relative = standIn.getFlag(kwargs, ("relative", "r"), False)
+	for mesh, indices in _getVertices(items):
+		for index in indices:
+			mesh.setWorldPoint(index, [a + b for a, b in zip(mesh.getWorldPoint(index), translation)]
+										if relative else translation)
+
+@standIn.command
+def undoInfo(*args, **kwargs):
+	"""
+	Stand-in **undoInfo** command, the stand-in does not record any undo.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Queried state.
+	:rtype: bool
+	"""
+
+	if standIn.getFlag(kwargs, ("query", "q")):
+		return True
+
+@standIn.command
+def repeatLast(*args, **kwargs):
+	"""
+	Stand-in **repeatLast** command.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	"""
+
+	pass
+
+@standIn.command
+def progressBar(*args, **kwargs):
+	"""
+	Stand-in **progressBar** command, progress bars are never cancelled.
+
+	:param \*args: Arguments.
+	:type \*args: \*
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Queried value.
+	:rtype: object
+	"""
+
+	if standIn.getFlag(kwargs, ("query", "q")):
+		return False
+
+@standIn.command
+def pluginInfo(plugin, **kwargs):
+	"""
+	Stand-in **pluginInfo** command, only supports loaded state query.
+
+	:param plugin: Plugin.
+	:type plugin: unicode
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Plugin loaded state.
+	:rtype: bool
+	"""
+
+	return plugin in standIn.SCENE.plugins
+
+@standIn.command
+def loadPlugin(plugin, **kwargs):
+	"""
+	Stand-in **loadPlugin** command.
+
+	:param plugin: Plugin.
+	:type plugin: unicode
+	:param \*\*kwargs: Keywords arguments.
+	:type \*\*kwargs: \*\*
+	:return: Loaded plugins.
+	:rtype: list
+	"""
+
+	standIn.SCENE.plugins.add(plugin)
+	return [plugin]
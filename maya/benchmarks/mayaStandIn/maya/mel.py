@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**mel.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the stand-in :mod:`maya.mel` module evaluating the Mel statements used by the libraries.
+
+**Others:**
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import re
+import sys
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import maya.standIn as standIn
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["MAIN_PROGRESS_BAR",
+			"PROGRESS_BAR_PATTERN",
+			"NEAREST_POINT_ON_MESH_PATTERN",
+			"WARNING_PATTERN",
+			"eval"]
+
+MAIN_PROGRESS_BAR = "MainProgressBar"
+
+PROGRESS_BAR_PATTERN = re.compile(r"^\s*(\$\w+\s*=\s*)?\$gMainProgressBar\s*;?\s*$")
+NEAREST_POINT_ON_MESH_PATTERN = re.compile(r"^\s*nearestPointOnMesh\s+(?P<mesh>\S+?)\s*;?\s*$")
+WARNING_PATTERN = re.compile(r"^\s*warning\s*\(?\s*\"(?P<message>.*)\"\s*\)?\s*;?\s*$")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+@standIn.command
+def eval(statement):
+	"""
+	Evaluates given Mel statement.
+
+	:param statement: Mel statement.
+	:type statement: unicode
+	:return: Statement value.
+	:rtype: object
+	"""
+
+	if PROGRESS_BAR_PATTERN.match(statement):
+		return MAIN_PROGRESS_BAR
+
+	match = NEAREST_POINT_ON_MESH_PATTERN.match(statement)
+	if match:
+		node = standIn.getNode(match.group("mesh"))
+		mesh = node and standIn.getMesh(node)
+		if mesh is None:
+			raise RuntimeError("Error occurred during execution of MEL script")
+
+		return standIn.SCENE.addNode(
+		standIn.NearestPointOnMesh(standIn.SCENE.getUniqueName("nearestPointOnMesh1"), mesh)).name
+
+	match = WARNING_PATTERN.match(statement)
+	if match:
+		sys.stderr.write("# Warning: {0} #\n".format(match.group("message")))
+		return
+
+	raise RuntimeError("Unsupported Mel statement: {0}".format(statement))
@@ -0,0 +1,906 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**standIn.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the Maya stand-in scene: nodes, in-memory meshes, components parsing / formatting and the calls overhead.
+
+**Others:**
+	Meshes transforms only carry a translation, the nodes do not have any history.
+
+	The calls overhead is spent busy waiting, :attr:`OVERHEADS` attribute default values are an estimate
+	of a Maya 2014 session and should be calibrated against the targeted Maya version.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import functools
+import math
+import re
+import timeit
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["OVERHEADS",
+			"COMPONENT_PATTERN",
+			"COMPONENTS_MASKS",
+			"TWEAKS_PATTERN",
+			"spend",
+			"command",
+			"api",
+			"getFlag",
+			"getRanges",
+			"Node",
+			"Transform",
+			"Mesh",
+			"NearestPointOnMesh",
+			"Scene",
+			"SCENE",
+			"getNode",
+			"getMesh",
+			"getTransform",
+			"getIndices",
+			"getItems",
+			"formatComponents"]
+
+OVERHEADS = {"command": 15e-6, "api": 1e-6}
+
+COMPONENT_PATTERN = re.compile(
+r"^(?P<node>[^.\[]+)(?:\.(?P<type>vtxFace|vtx|map|e|f)\[(?P<first>[^\]]*)\](?:\[(?P<second>[^\]]*)\])?)?$")
+
+COMPONENTS_MASKS = {31: "vtx", 32: "e", 34: "f", 35: "map", 70: "vtxFace"}
+
+TWEAKS_PATTERN = re.compile(r"^(?:pnts|pt)\[(?P<first>\d+)(?::(?P<last>\d+))?\]$")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def spend(kind):
+	"""
+	Spends given kind calls overhead.
+
+	:param kind: Overhead kind, **command** or **api**.
+	:type kind: unicode
+	"""
+
+	overhead = OVERHEADS[kind]
+	if overhead <= 0:
+		return
+
+	end = timeit.default_timer() + overhead
+	while timeit.default_timer() < end:
+		pass
+
+def command(object):
+	"""
+	Spends a command call overhead when calling given command.
+
+	:param object: Command.
+	:type object: object
+	:return: Command wrapper.
+	:rtype: object
+	"""
+
+	@functools.wraps(object)
+	def commandWrapper(*args, **kwargs):
+		"""
+		Spends a command call overhead when calling the command.
+		"""
+
+		spend("command")
+		return object(*args, **kwargs)
+
+	return commandWrapper
+
+def api(object):
+	"""
+	Spends an api call overhead when calling given method.
+
+	:param object: Method.
+	:type object: object
+	:return: Method wrapper.
+	:rtype: object
+	"""
+
+	@functools.wraps(object)
+	def apiWrapper(*args, **kwargs):
+		"""
+		Spends an api call overhead when calling the method.
+		"""
+
+		spend("api")
+		return object(*args, **kwargs)
+
+	return apiWrapper
+
+def getFlag(kwargs, names, default=None):
+	"""
+	Returns given flag value from a command keywords arguments using its long and short names.
+
+	:param kwargs: Keywords arguments.
+	:type kwargs: dict
+	:param names: Flag names.
+	:type names: tuple
+	:param default: Default value.
+	:type default: object
+	:return: Flag value.
+	:rtype: object
+	"""
+
+	for name in names:
+		if name in kwargs:
+			return kwargs[name]
+	return default
+
+def getRanges(indices):
+	"""
+	Returns the contiguous ranges of given sorted indices.
+
+	:param indices: Sorted indices.
+	:type indices: list
+	:return: Ranges.
+	:rtype: list
+	"""
+
+	ranges = []
+	start = previous = None
+	for index in indices:
+		if previous is not None and index == previous + 1:
+			previous = index
+			continue
+
+		if start is not None:
+			ranges.append((start, previous))
+		start = previous = index
+	if start is not None:
+		ranges.append((start, previous))
+	return ranges
+
+class Node(object):
+	"""
+	Defines a stand-in scene node.
+	"""
+
+	def __init__(self, name, type, parent=None):
+		"""
+		Initializes the class.
+
+		:param name: Node name.
+		:type name: unicode
+		:param type: Node type.
+		:type type: unicode
+		:param parent: Parent node.
+		:type parent: Node
+		"""
+
+		self.name = name
+		self.type = type
+		self.parent = parent
+		self.children = []
+		self.attributes = {}
+
+		if parent is not None:
+			parent.children.append(self)
+
+	def getPath(self, long=False):
+		"""
+		Returns the node path.
+
+		:param long: Long path.
+		:type long: bool
+		:return: Node path.
+		:rtype: unicode
+		"""
+
+		if not long:
+			return self.name
+
+		return "{0}|{1}".format(self.parent.getPath(True) if self.parent is not None else "", self.name)
+
+	def getAttribute(self, attribute):
+		"""
+		Returns given attribute value.
+
+		:param attribute: Attribute name.
+		:type attribute: unicode
+		:return: Attribute value.
+		:rtype: object
+		"""
+
+		if not attribute in self.attributes:
+			raise ValueError("No object matches name: {0}.{1}".format(self.name, attribute))
+		return self.attributes[attribute]
+
+	def setAttribute(self, attribute, value):
+		"""
+		Sets given attribute value.
+
+		:param attribute: Attribute name.
+		:type attribute: unicode
+		:param value: Attribute value.
+		:type value: object
+		"""
+
+		self.attributes[attribute] = value
+
+class Transform(Node):
+	"""
+	Defines a stand-in transform node.
+	"""
+
+	def __init__(self, name, parent=None):
+		"""
+		Initializes the class.
+
+		:param name: Node name.
+		:type name: unicode
+		:param parent: Parent node.
+		:type parent: Node
+		"""
+
+		Node.__init__(self, name, "transform", parent)
+
+		self.attributes["translate"] = [0., 0., 0.]
+
+	@property
+	def translate(self):
+		"""
+		Property for **translate** attribute.
+
+		:return: Translation.
+		:rtype: list
+		"""
+
+		return self.attributes["translate"]
+
+class Mesh(Node):
+	"""
+	Defines a stand-in mesh shape node storing its points, faces, uvs and faces uvs.
+	"""
+
+	def __init__(self, name, parent, points, faces, uvs, facesUVs):
+		"""
+		Initializes the class.
+
+		:param name: Node name.
+		:type name: unicode
+		:param parent: Parent transform.
+		:type parent: Transform
+		:param points: Points, object space.
+		:type points: list
+		:param faces: Faces vertices indices.
+		:type faces: list
+		:param uvs: UVs.
+		:type uvs: list
+		:param facesUVs: Faces uvs indices.
+		:type facesUVs: list
+		"""
+
+		Node.__init__(self, name, "mesh", parent)
+
+		self.points = points
+		self.faces = faces
+		self.uvs = uvs
+		self.facesUVs = facesUVs
+		self.tweaks = {}
+
+		self.__edges = None
+		self.__facesEdges = None
+		self.__vertexFaces = None
+		self.__vertexUVs = None
+		self.__uvVertices = None
+		self.__facesCells = None
+
+	def getAttribute(self, attribute):
+		"""
+		Returns given attribute value, the **pnts** tweaks ranges are supported.
+
+		:param attribute: Attribute name.
+		:type attribute: unicode
+		:return: Attribute value.
+		:rtype: object
+		"""
+
+		match = TWEAKS_PATTERN.match(attribute)
+		if not match:
+			return Node.getAttribute(self, attribute)
+
+		first = int(match.group("first"))
+		last = int(match.group("last") or first)
+		return [tuple(self.tweaks.get(index, (0., 0., 0.))) for index in range(first, last + 1)]
+
+	def setAttribute(self, attribute, value):
+		"""
+		Sets given attribute value, the **pnts** tweaks ranges are supported and offset the points.
+
+		:param attribute: Attribute name.
+		:type attribute: unicode
+		:param value: Attribute value.
+		:type value: object
+		"""
+
+		match = TWEAKS_PATTERN.match(attribute)
+		if not match:
+			return Node.setAttribute(self, attribute, value)
+
+		first = int(match.group("first"))
+		for i in range(0, len(value), 3):
+			index = first + i // 3
+			tweak = [float(component) for component in value[i:i + 3]]
+			previous = self.tweaks.get(index, (0., 0., 0.))
+			self.points[index] = [a + b - c for a, b, c in zip(self.points[index], tweak, previous)]
+			self.tweaks[index] = tweak
+		self.__facesCells = None
+
+	def getEdges(self):
+		"""
+		Returns the edges vertices indices and the faces edges indices.
+
+		:return: Edges, faces edges.
+		:rtype: tuple
+		"""
+
+		if self.__edges is None:
+			edges, facesEdges, indexes = [], [], {}
+			for face in self.faces:
+				faceEdges = []
+				for i, vertex in enumerate(face):
+					edge = tuple(sorted((vertex, face[(i + 1) % len(face)])))
+					index = indexes.get(edge)
+					if index is None:
+						index = indexes[edge] = len(edges)
+						edges.append(edge)
+					faceEdges.append(index)
+				facesEdges.append(faceEdges)
+			self.__edges, self.__facesEdges = edges, facesEdges
+		return self.__edges, self.__facesEdges
+
+	def getVertexFaces(self):
+		"""
+		Returns the faces indices per vertex.
+
+		:return: Vertex faces.
+		:rtype: list
+		"""
+
+		if self.__vertexFaces is None:
+			self.__vertexFaces = vertexFaces = [[] for i in range(len(self.points))]
+			for i, face in enumerate(self.faces):
+				for vertex in face:
+					vertexFaces[vertex].append(i)
+		return self.__vertexFaces
+
+	def getVertexUVs(self):
+		"""
+		Returns the uvs indices per vertex and the vertex index per uv.
+
+		:return: Vertex uvs, uvs vertices.
+		:rtype: tuple
+		"""
+
+		if self.__vertexUVs is None:
+			vertexUVs = [set() for i in range(len(self.points))]
+			uvVertices = [None] * len(self.uvs)
+			for face, faceUVs in zip(self.faces, self.facesUVs):
+				for vertex, uv in zip(face, faceUVs):
+					vertexUVs[vertex].add(uv)
+					uvVertices[uv] = vertex
+			self.__vertexUVs, self.__uvVertices = vertexUVs, uvVertices
+		return self.__vertexUVs, self.__uvVertices
+
+	def getCount(self, type):
+		"""
+		Returns given component type count.
+
+		:param type: Component type.
+		:type type: unicode
+		:return: Components count.
+		:rtype: int
+		"""
+
+		if type == "vtx":
+			return len(self.points)
+		elif type == "f":
+			return len(self.faces)
+		elif type == "map":
+			return len(self.uvs)
+		elif type == "e":
+			return len(self.getEdges()[0])
+		elif type == "vtxFace":
+			return sum(len(face) for face in self.faces)
+
+	def convert(self, type, indices, target):
+		"""
+		Converts given components indices to given target component type.
+
+		:param type: Component type, **None** for the whole mesh.
+		:type type: unicode
+		:param indices: Components indices.
+		:type indices: list
+		:param target: Target component type.
+		:type target: unicode
+		:return: Target components indices, sorted.
+		:rtype: list
+		"""
+
+		if type is None:
+			if target == "vtxFace":
+				return sorted((vertex, i) for i, face in enumerate(self.faces) for vertex in face)
+			return range(self.getCount(target))
+
+		if type == target:
+			return sorted(set(indices))
+
+		if type == "vtxFace":
+			type, indices = "vtx", set(vertex for vertex, face in indices)
+			if target == "vtx":
+				return sorted(indices)
+
+		if target == "vtxFace":
+			faces = self.convert(type, indices, "f")
+			vertices = set(self.convert(type, indices, "vtx"))
+			return sorted((vertex, face) for face in faces for vertex in self.faces[face]
+						if type == "f" or vertex in vertices)
+
+		if type == "e":
+			edges = self.getEdges()[0]
+			type, indices = "vtx", set(vertex for index in indices for vertex in edges[index])
+			if target == "vtx":
+				return sorted(indices)
+
+		if type == "map":
+			uvVertices = self.getVertexUVs()[1]
+			if target == "vtx":
+				return sorted(set(uvVertices[index] for index in indices))
+			type, indices = "vtx", set(uvVertices[index] for index in indices)
+
+		if type == "vtx":
+			if target == "f":
+				vertexFaces = self.getVertexFaces()
+				return sorted(set(face for index in indices for face in vertexFaces[index]))
+			elif target == "map":
+				vertexUVs = self.getVertexUVs()[0]
+				return sorted(set(uv for index in indices for uv in vertexUVs[index]))
+			elif target == "e":
+				vertices = set(indices)
+				return [i for i, edge in enumerate(self.getEdges()[0]) if edge[0] in vertices or edge[1] in vertices]
+
+		if type == "f":
+			if target == "vtx":
+				return sorted(set(vertex for index in indices for vertex in self.faces[index]))
+			elif target == "map":
+				return sorted(set(uv for index in indices for uv in self.facesUVs[index]))
+			elif target == "e":
+				facesEdges = self.getEdges()[1]
+				return sorted(set(edge for index in indices for edge in facesEdges[index]))
+
+		raise RuntimeError("Unsupported '{0}' to '{1}' components conversion!".format(type, target))
+
+	def getWorldPoint(self, index):
+		"""
+		Returns given vertex world space position.
+
+		:param index: Vertex index.
+		:type index: int
+		:return: Position.
+		:rtype: list
+		"""
+
+		translate = self.parent.translate
+		point = self.points[index]
+		return [point[0] + translate[0], point[1] + translate[1], point[2] + translate[2]]
+
+	def setWorldPoint(self, index, point):
+		"""
+		Sets given vertex world space position.
+
+		:param index: Vertex index.
+		:type index: int
+		:param point: Position.
+		:type point: list
+		"""
+
+		translate = self.parent.translate
+		self.points[index] = [point[0] - translate[0], point[1] - translate[1], point[2] - translate[2]]
+		self.__facesCells = None
+
+	def getFaceNormalArea(self, index):
+		"""
+		Returns given face normal and area using Newell method.
+
+		:param index: Face index.
+		:type index: int
+		:return: Normal, area.
+		:rtype: tuple
+		"""
+
+		points = self.points
+		face = self.faces[index]
+		x = y = z = 0.
+		for i, vertex in enumerate(face):
+			pointA, pointB = points[vertex], points[face[(i + 1) % len(face)]]
+			x += (pointA[1] - pointB[1]) * (pointA[2] + pointB[2])
+			y += (pointA[2] - pointB[2]) * (pointA[0] + pointB[0])
+			z += (pointA[0] - pointB[0]) * (pointA[1] + pointB[1])
+		length = math.sqrt(x * x + y * y + z * z)
+		if not length:
+			return (0., 0., 0.), 0.
+		return (x / length, y / length, z / length), length / 2.
+
+	def getFaceUVArea(self, index):
+		"""
+		Returns given face uvs area.
+
+		:param index: Face index.
+		:type index: int
+		:return: UVs area.
+		:rtype: float
+		"""
+
+		uvs = self.uvs
+		faceUVs = self.facesUVs[index]
+		area = 0.
+		for i, uv in enumerate(faceUVs):
+			uvA, uvB = uvs[uv], uvs[faceUVs[(i + 1) % len(faceUVs)]]
+			area += uvA[0] * uvB[1] - uvB[0] * uvA[1]
+		return math.fabs(area) / 2.
+
+	def getFaceCenter(self, index):
+		"""
+		Returns given face world space center.
+
+		:param index: Face index.
+		:type index: int
+		:return: Center.
+		:rtype: list
+		"""
+
+		face = self.faces[index]
+		center = [0., 0., 0.]
+		for vertex in face:
+			point = self.getWorldPoint(vertex)
+			for i in range(3):
+				center[i] += point[i]
+		return [value / len(face) for value in center]
+
+	def getClosestFace(self, point):
+		"""
+		Returns the face with the closest center to given world space point.
+
+		:param point: Point.
+		:type point: list
+		:return: Face index.
+		:rtype: int
+		"""
+
+		if self.__facesCells is None:
+			centers = [self.getFaceCenter(i) for i in range(len(self.faces))]
+			extent = max(max(center[i] for center in centers) - min(center[i] for center in centers) for i in range(3))
+			size = max(extent / max(math.sqrt(len(centers)), 1), 1e-6)
+			cells = {}
+			for i, center in enumerate(centers):
+				cells.setdefault(tuple(int(math.floor(value / size)) for value in center), []).append(i)
+			bounds = [(min(cell[i] for cell in cells), max(cell[i] for cell in cells)) for i in range(3)]
+			self.__facesCells = (centers, cells, size, bounds)
+
+		centers, cells, size, bounds = self.__facesCells
+		origin = [min(max(int(math.floor(value / size)), minimum), maximum)
+				for value, (minimum, maximum) in zip(point, bounds)]
+		closest, closestDistance, radius = None, float("inf"), 0
+		while True:
+			for i in range(max(origin[0] - radius, bounds[0][0]), min(origin[0] + radius, bounds[0][1]) + 1):
+				for j in range(max(origin[1] - radius, bounds[1][0]), min(origin[1] + radius, bounds[1][1]) + 1):
+					if abs(i - origin[0]) == radius or abs(j - origin[1]) == radius:
+						ks = range(max(origin[2] - radius, bounds[2][0]), min(origin[2] + radius, bounds[2][1]) + 1)
+					else:
+						ks = [k for k in set((origin[2] - radius, origin[2] + radius)) if
+							bounds[2][0] <= k <= bounds[2][1]]
+					for k in ks:
+						for face in cells.get((i, j, k), ()):
+							center = centers[face]
+							distance = sum((center[l] - point[l]) ** 2 for l in range(3))
+							if distance < closestDistance:
+								closest, closestDistance = face, distance
+
+			# Lower bound of the distance to the cells not searched yet.
+			distance = float("inf")
+			for l in range(3):
+				if origin[l] - radius > bounds[l][0]:
+					distance = min(distance, max(point[l] - (origin[l] - radius) * size, 0))
+				if origin[l] + radius < bounds[l][1]:
+					distance = min(distance, max((origin[l] + radius + 1) * size - point[l], 0))
+			if distance == float("inf") or distance ** 2 >= closestDistance:
+				break
+			radius += 1
+		return closest
+
+class NearestPointOnMesh(Node):
+	"""
+	Defines a stand-in **nearestPointOnMesh** plugin node, the nearest face is the face with the closest center.
+	"""
+
+	def __init__(self, name, mesh):
+		"""
+		Initializes the class.
+
+		:param name: Node name.
+		:type name: unicode
+		:param mesh: Input mesh.
+		:type mesh: Mesh
+		"""
+
+		Node.__init__(self, name, "nearestPointOnMesh")
+
+		self.mesh = mesh
+		self.attributes["inPosition"] = [0., 0., 0.]
+
+	def getAttribute(self, attribute):
+		"""
+		Returns given attribute value.
+
+		:param attribute: Attribute name.
+		:type attribute: unicode
+		:return: Attribute value.
+		:rtype: object
+		"""
+
+		if attribute == "nearestFaceIndex":
+			return self.mesh.getClosestFace(self.attributes["inPosition"])
+		elif attribute == "position":
+			return [tuple(self.mesh.getFaceCenter(self.getAttribute("nearestFaceIndex")))]
+		return Node.getAttribute(self, attribute)
+
+class Scene(object):
+	"""
+	Defines the stand-in scene storing the nodes, the selection and the loaded plugins.
+	"""
+
+	def __init__(self):
+		"""
+		Initializes the class.
+		"""
+
+		self.nodes = {}
+		self.selection = []
+		self.plugins = set()
+
+	def clear(self):
+		"""
+		Clears the scene.
+		"""
+
+		self.nodes.clear()
+		del self.selection[:]
+
+	def getUniqueName(self, name):
+		"""
+		Returns an unique node name from given name, trailing digits are incremented.
+
+		:param name: Node name.
+		:type name: unicode
+		:return: Unique name.
+		:rtype: unicode
+		"""
+
+		if not name in self.nodes:
+			return name
+
+		base = name.rstrip("0123456789")
+		i = 1
+		while "{0}{1}".format(base, i) in self.nodes:
+			i += 1
+		return "{0}{1}".format(base, i)
+
+	def addNode(self, node):
+		"""
+		Adds given node to the scene.
+
+		:param node: Node.
+		:type node: Node
+		:return: Node.
+		:rtype: Node
+		"""
+
+		self.nodes[node.name] = node
+		return node
+
+	def removeNode(self, node):
+		"""
+		Removes given node and its children from the scene.
+
+		:param node: Node.
+		:type node: Node
+		"""
+
+		for child in node.children:
+			self.removeNode(child)
+		if node.parent is not None:
+			node.parent.children.remove(node)
+		self.nodes.pop(node.name, None)
+
+	def createMesh(self, name, points, faces, uvs, facesUVs):
+		"""
+		Creates a mesh transform and shape.
+
+		:param name: Transform name.
+		:type name: unicode
+		:param points: Points.
+		:type points: list
+		:param faces: Faces vertices indices.
+		:type faces: list
+		:param uvs: UVs.
+		:type uvs: list
+		:param facesUVs: Faces uvs indices.
+		:type facesUVs: list
+		:return: Mesh.
+		:rtype: Mesh
+		"""
+
+		transform = self.addNode(Transform(self.getUniqueName(name)))
+		return self.addNode(Mesh(self.getUniqueName("{0}Shape".format(transform.name)),
+								transform, points, faces, uvs, facesUVs))
+
+SCENE = Scene()
+
+def getNode(name):
+	"""
+	Returns the node with given name or path.
+
+	:param name: Node name or path.
+	:type name: unicode
+	:return: Node.
+	:rtype: Node
+	"""
+
+	return SCENE.nodes.get(name.rsplit("|", 1)[-1])
+
+def getMesh(node):
+	"""
+	Returns given node mesh, either the node itself or its first mesh shape.
+
+	:param node: Node.
+	:type node: Node
+	:return: Mesh.
+	:rtype: Mesh
+	"""
+
+	if isinstance(node, Mesh):
+		return node
+
+	for child in node.children:
+		if isinstance(child, Mesh):
+			return child
+
+def getTransform(node):
+	"""
+	Returns given node transform, either the node itself or its parent.
+
+	:param node: Node.
+	:type node: Node
+	:return: Transform.
+	:rtype: Transform
+	"""
+
+	return node if isinstance(node, Transform) else node.parent
+
+def getIndices(specification, count):
+	"""
+	Returns the indices of given components index specification, e.g. **3**, **0:10** or *****.
+
+	:param specification: Index specification.
+	:type specification: unicode
+	:param count: Components count.
+	:type count: int
+	:return: Indices.
+	:rtype: list
+	"""
+
+	if specification == "*":
+		return range(count)
+
+	if ":" in specification:
+		first, last = specification.split(":")
+		return range(int(first), min(int(last), count - 1) + 1)
+
+	index = int(specification)
+	return [index] if index < count else []
+
+def getItems(items):
+	"""
+	Parses given nodes and components items.
+
+	:param items: Items.
+	:type items: unicode or tuple or list
+	:return: Items as (name, node, component type, indices) tuples, type and indices are **None** for nodes.
+	:rtype: list
+	"""
+
+	if items is None:
+		return []
+
+	if not isinstance(items, (tuple, list)):
+		items = (items,)
+
+	parsedItems = []
+	for item in items:
+		match = COMPONENT_PATTERN.match(item)
+		if not match:
+			continue
+
+		node = getNode(match.group("node"))
+		if node is None:
+			continue
+
+		type = match.group("type")
+		if type is None:
+			parsedItems.append((match.group("node"), node, None, None))
+			continue
+
+		mesh = getMesh(node)
+		if mesh is None:
+			continue
+
+		if type == "vtxFace":
+			vertexFaces = mesh.getVertexFaces()
+			faces = set(getIndices(match.group("second"), len(mesh.faces)))
+			indices = [(vertex, face) for vertex in getIndices(match.group("first"), len(mesh.points))
+						for face in vertexFaces[vertex] if face in faces]
+		else:
+			indices = getIndices(match.group("first"), mesh.getCount(type))
+
+		if parsedItems and parsedItems[-1][1] is node and parsedItems[-1][2] == type:
+			parsedItems[-1][3].extend(indices)
+		else:
+			parsedItems.append((match.group("node"), node, type, list(indices)))
+	return parsedItems
+
+def formatComponents(name, type, indices, flatten=False):
+	"""
+	Formats given components.
+
+	:param name: Node name.
+	:type name: unicode
+	:param type: Component type.
+	:type type: unicode
+	:param indices: Sorted components indices.
+	:type indices: list
+	:param flatten: Flatten components, contiguous components are formatted as ranges otherwise.
+	:type flatten: bool
+	:return: Components.
+	:rtype: list
+	"""
+
+	if type == "vtxFace":
+		return ["{0}.vtxFace[{1}][{2}]".format(name, vertex, face) for vertex, face in indices]
+
+	if flatten:
+		return ["{0}.{1}[{2}]".format(name, type, index) for index in indices]
+
+	return ["{0}.{1}[{2}]".format(name, type, first) if first == last else
+			"{0}.{1}[{2}:{3}]".format(name, type, first, last) for first, last in getRanges(indices)]
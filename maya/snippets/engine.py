@@ -30,6 +30,10 @@ from __future__ import unicode_literals
 #**********************************************************************************************************************
 import logging
 import os
+import timeit
+
+# Starting the clock before the dependencies imports for the startup profiler.
+_IMPORT_START = timeit.default_timer()
 
 #**********************************************************************************************************************
 #***	Dependencies globals manipulation.
@@ -46,6 +50,8 @@ def _overrideDependenciesGlobals():
 	"""
 
 	foundations.globals.constants.Constants.logger = Constants.logger
+	foundations.globals.constants.Constants.applicationDirectory = Constants.applicationDirectory
+	foundations.globals.constants.Constants.providerDirectory = Constants.providerDirectory
 	return True
 
 _overrideDependenciesGlobals()
@@ -53,10 +59,19 @@ _overrideDependenciesGlobals()
 #**********************************************************************************************************************
 #***	Internal imports.
 #**********************************************************************************************************************
+import foundations.common
+import foundations.environment
+import foundations.strings
 import foundations.verbose
 import snippets.libraries.common
+from foundations.environment import Environment
 from snippets.globals.runtimeGlobals import RuntimeGlobals
+from snippets.managers.manifest import Manifest
 from snippets.managers.modulesManager import ModulesManager
+from snippets.managers.usage import UsageStore
+from snippets.managers.watcher import LibrariesWatcher
+from snippets.profilers.execution import ExecutionProfiler
+from snippets.profilers.startup import PROFILER
 
 #**********************************************************************************************************************
 #***	Module attributes.
@@ -77,17 +92,79 @@ del logging.root.handlers[:]
 
 foundations.verbose.getLoggingConsoleHandler()
 
+PROFILER.record("engine | Dependencies import", timeit.default_timer() - _IMPORT_START)
+
 #**********************************************************************************************************************
 #***	Module classes and definitions.
 #**********************************************************************************************************************
+def _getLibrariesDirectories():
+	"""
+	Returns the libraries directories by decreasing priority: the directories from the
+	:attr:`snippets.globals.constants.Constants.librariesPathsVariable` environment variable, e.g. user, show
+	and studio directories, followed by the bundled libraries directory.
+
+	:return: Libraries directories.
+	:rtype: list
+	"""
+
+	directories = []
+	for directory in (Environment(Constants.librariesPathsVariable).getValue() or "").split(os.pathsep):
+		if not directory:
+			continue
+
+		if not foundations.common.pathExists(directory):
+			LOGGER.warning("!> '{0}' libraries directory doesn't exists and will be skipped!".format(directory))
+			continue
+
+		directory = foundations.strings.toString(directory)
+		if not directory in directories:
+			directories.append(directory)
+	directories.append(RuntimeGlobals.librariesDirectory)
+	return directories
+
 def _setModulesManager():
 	"""
 	Sets the global modules manager instance.
 	"""
 
 	if not isinstance(RuntimeGlobals.modulesManager, ModulesManager):
-		RuntimeGlobals.modulesManager = ModulesManager([RuntimeGlobals.librariesDirectory])
-		RuntimeGlobals.modulesManager.registerAll()
+		RuntimeGlobals.modulesManager = ModulesManager(RuntimeGlobals.librariesDirectories,
+													manifest=Manifest(os.path.join(RuntimeGlobals.cacheDirectory,
+																				Constants.manifestFile)))
+		with PROFILER.phase("engine | Modules registration"):
+			RuntimeGlobals.modulesManager.registerAll()
+
+def _setUsageStore():
+	"""
+	Sets the global interfaces usage store instance.
+	"""
+
+	if not isinstance(RuntimeGlobals.usageStore, UsageStore):
+		RuntimeGlobals.usageStore = UsageStore(os.path.join(RuntimeGlobals.userApplicationDataDirectory,
+															Constants.usageFile))
+		RuntimeGlobals.usageStore.read()
+
+def _setExecutionProfiler():
+	"""
+	Sets the global interfaces execution profiler instance.
+	"""
+
+	if not isinstance(RuntimeGlobals.executionProfiler, ExecutionProfiler):
+		RuntimeGlobals.executionProfiler = ExecutionProfiler(
+		os.path.join(RuntimeGlobals.userApplicationDataDirectory, Constants.executionsFile),
+		os.path.join(RuntimeGlobals.cacheDirectory, Constants.profilesDirectory),
+		ExecutionProfiler.isProfilingRequested(),
+		ExecutionProfiler.isProfilingRequested(Constants.commandsProfilerVariable))
+		RuntimeGlobals.executionProfiler.read()
+
+def _setLibrariesWatcher():
+	"""
+	Sets and starts the global libraries watcher instance.
+	"""
+
+	if not isinstance(RuntimeGlobals.librariesWatcher, LibrariesWatcher):
+		RuntimeGlobals.librariesWatcher = LibrariesWatcher(RuntimeGlobals.modulesManager)
+		RuntimeGlobals.librariesWatcher.start()
 
 def run():
 	"""
@@ -100,4 +177,17 @@ def run():
 	RuntimeGlobals.librariesDirectory = os.path.join(os.path.dirname(__file__), Constants.librariesDirectory)
 	RuntimeGlobals.resourcesDirectory = os.path.join(os.path.dirname(__file__), Constants.resourcesDirectory)
 
-	_setModulesManager()
+	RuntimeGlobals.userApplicationDataDirectory = foundations.environment.getUserApplicationDataDirectory()
+	RuntimeGlobals.cacheDirectory = os.path.join(RuntimeGlobals.userApplicationDataDirectory, Constants.cacheDirectory)
+
+	RuntimeGlobals.librariesDirectories = _getLibrariesDirectories()
+
+	if PROFILER.enabled and not PROFILER.file:
+		PROFILER.file = os.path.join(RuntimeGlobals.cacheDirectory, Constants.startupProfileFile)
+
+	with PROFILER.phase("engine | Run"):
+		_setModulesManager()
+		_setLibrariesWatcher()
+		_setUsageStore()
+		_setExecutionProfiler()
+	PROFILER.report()
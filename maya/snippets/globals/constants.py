@@ -20,6 +20,11 @@
 
 """
 
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import platform
+
 #**********************************************************************************************************************
 #***	Module attributes.
 #**********************************************************************************************************************
@@ -46,8 +51,38 @@ class Constants():
 
 	libraryExtension = "py"
 	libraryCompiledExtension = "pyc"
+	bundleExtension = "zip"
+	libraryPackageFile = "__init__.py"
+	interfacesPattern = r"^I[A-Z]\w+"
+	librariesNamespace = "snippets_user"
+	librariesPathsVariable = "SNIPPETS_LIBRARIES_PATHS"
+	scanningThreads = 8
+	watcherInterval = 0.5
 
 	librariesDirectory = "libraries"
 	resourcesDirectory = "resources"
 
+	applicationDirectory = "Snippets"
+	if platform.system() == "Windows" or platform.system() == "Microsoft" or platform.system() == "Darwin":
+		providerDirectory = "HDRLabs"
+	elif platform.system() == "Linux":
+		providerDirectory = ".HDRLabs"
+
+	cacheDirectory = "cache"
+	manifestFile = "manifest.json"
+	manifestVersion = 3
+	startupProfilerVariable = "SNIPPETS_PROFILE_STARTUP"
+	startupProfileFile = "startup.json"
+	uiCacheDirectory = "ui"
+	usageFile = "usage.json"
+	usageHalfLife = 7 * 24 * 60 * 60
+	minimumTokenLength = 3
+	executionsFile = "executions.json"
+	executionsSamples = 100
+	executionsWriteInterval = 5
+	executionProfilerVariable = "SNIPPETS_PROFILE_EXECUTIONS"
+	profilesDirectory = "profiles"
+	commandsProfilerVariable = "SNIPPETS_PROFILE_COMMANDS"
+	commandsReportCount = 20
+
 	nullObject = "None"
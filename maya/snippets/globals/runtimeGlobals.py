@@ -44,8 +44,16 @@ class RuntimeGlobals():
 	popupUiFile = None
 
 	modulesManager = None
+	librariesWatcher = None
+	usageStore = None
+	executionProfiler = None
 
 	librariesDirectory = None
+	librariesDirectories = None
 	resourcesDirectory = None
 
+	userApplicationDataDirectory = None
+	cacheDirectory = None
+
+	popup = None
 	popupPattern = None
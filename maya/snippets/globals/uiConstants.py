@@ -44,3 +44,5 @@ class UiConstants():
 	popupUiFile = "Popup.ui"
 
 	snippetsLoaderLogo = "images/Snippets_Loader_Logo.png"
+
+	viewsBatchSize = 256
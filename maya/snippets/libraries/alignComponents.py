@@ -1,7 +1,9 @@
 # Credits: Zananick (Unknown).
 import maya.cmds as cmds
 import maya.mel as mel
-import maya.OpenMaya as OpenMaya
+
+from snippets.libraries.core import meshPoints
+from snippets.libraries.core import vectors
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
@@ -12,8 +14,6 @@ __status__ = "Production"
 
 __all__ = ["ALIGNEMENT_ANCHORS",
 			"stacksHandler",
-			"getMVector",
-			"normalize",
 			"alignComponentsBetweenAnchors",
 			"selectAnchors_button_OnClicked",
 			"alignSelection_button_OnClicked",
@@ -56,32 +56,6 @@ def stacksHandler(object):
 
 	return stacksHandlerCall
 
-def getMVector(vector):
-	"""
-	Returns an MVector.
-
-	:param vector: Vector.
-	:type vector: list
-	:return: MVector
-	:rtype: MVector
-	"""
-
-	return OpenMaya.MVector(vector[0], vector[1], vector[2])
-
-def normalize(vector):
-	"""
-	Returns the normalized vector.
-
-	:param vector: Vector.
-	:type vector: list
-	:return: Normalized vector
-	:rtype: tuple
-	"""
-
-	mVector = getMVector(vector)
-	mVector.normalize()
-	return (mVector.x, mVector.y, mVector.z)
-
 def alignComponentsBetweenAnchors(anchorA, anchorB, components, axis=("X", "Y", "Z")):
 	"""
 	Aligns given Components between the two anchors.
@@ -96,26 +70,17 @@ def alignComponentsBetweenAnchors(anchorA, anchorB, components, axis=("X", "Y",
 	:type axis: tuple
 	"""
 
-	vertices = cmds.ls(cmds.polyListComponentConversion(components, toVertex=True), fl=True)
+	componentsPoints = meshPoints.getComponentsPoints(components)
 
 	pointA = cmds.xform(anchorA, q=True, t=True, ws=True)
 	pointB = cmds.xform(anchorB, q=True, t=True, ws=True)
-	vectorA = normalize([pointB_ - pointA_ for pointA_, pointB_ in zip(pointA, pointB)])
-
-	for vertex in vertices:
-		pointC = cmds.xform(vertex, q=True, ws=True, t=True)
-		vectorB = [pointC_ - pointA_ for pointA_, pointC_ in zip(pointA, pointC)]
-		mVectorA = getMVector(vectorA)
-		mVectorB = getMVector(vectorB)
-		dot = mVectorB * mVectorA
-		mVectorA *= dot
-		offset = mVectorB - mVectorA
-
-		xValue = "X" in axis and - offset.x or 0
-		yValue = "Y" in axis and - offset.y or 0
-		zValue = "Z" in axis and - offset.z or 0
-
-		cmds.xform(vertex, ws=True, r=True, t=(xValue, yValue, zValue))
+	direction = vectors.normalize([pointB_ - pointA_ for pointA_, pointB_ in zip(pointA, pointB)])
+
+	mask = [float(value in axis) for value in ("X", "Y", "Z")]
+	matrix = [mask[0], 0, 0, 0, 0, mask[1], 0, 0, 0, 0, mask[2], 0, 0, 0, 0, 1]
+	for mesh, indices in componentsPoints:
+		mesh.movePoints(indices, vectors.transform(vectors.getLineOffsets(mesh.getPoints(indices), pointA, direction), matrix))
+		mesh.write()
 
 @stacksHandler
 def selectAnchors_button_OnClicked(state=None):
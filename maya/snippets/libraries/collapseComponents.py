@@ -1,9 +1,11 @@
 import inspect
 import maya.cmds as cmds
 import maya.mel as mel
-import maya.OpenMaya as OpenMaya
 import re
 
+from snippets.libraries.core import meshPoints
+from snippets.libraries.core import vectors
+
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
 __license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
@@ -13,7 +15,6 @@ __status__ = "Production"
 
 __all__ = ["stacksHandler",
 			"getTransform",
-			"getAverageVector",
 			"collapseComponents",
 			"ICollapseComponents",
 			"collapseComponentsOnX",
@@ -71,24 +72,6 @@ def getTransform(node, fullPath=True):
 		transform = parents[0]
 	return transform
 
-def getAverageVector(vectors):
-	"""
-	Returns the average vector from a list of vectors.
-
-	:param vectors: Vectors to get the average one.
-	:type vectors: list
-	:return: Average vector.
-	:rtype: list
-	"""
-
-	averageVector = [0, 0, 0]
-	for vector in vectors:
-		for i in range(3):
-			averageVector[i] += vector[i]
-	for i in range(3):
-		averageVector[i] = averageVector[i] / len(vectors)
-	return averageVector
-
 def collapseComponents(components, axis=("X", "Y", "Z")):
 	"""
 	Collapses the given Components.
@@ -99,16 +82,17 @@ def collapseComponents(components, axis=("X", "Y", "Z")):
 	:type axis: tuple
 	"""
 
-	vertices = cmds.ls(cmds.polyListComponentConversion(components, toVertex=True), fl=True)
-	barycenters = []
-	barycenters.extend((cmds.xform(vertex, q=True, t=True, ws=True) for vertex in vertices))
-	barycenter = getAverageVector(barycenters)
-	for vertex in vertices:
-		xValue = "X" in axis and barycenter[0] or cmds.xform(vertex, q=True, t=True, ws=True)[0]
-		yValue = "Y" in axis and barycenter[1] or cmds.xform(vertex, q=True, t=True, ws=True)[1]
-		zValue = "Z" in axis and barycenter[2] or cmds.xform(vertex, q=True, t=True, ws=True)[2]
+	componentsPoints = meshPoints.getComponentsPoints(components)
+	if not componentsPoints:
+		return
 
-		cmds.xform(vertex, ws=True, t=(xValue, yValue, zValue))
+	barycenter = vectors.getCentroid(vectors.concatenate([mesh.getPoints(indices) for mesh, indices in componentsPoints]))
+	mask = [float(value in axis) for value in ("X", "Y", "Z")]
+	matrix = [1 - mask[0], 0, 0, 0, 0, 1 - mask[1], 0, 0, 0, 0, 1 - mask[2], 0,
+			barycenter[0] * mask[0], barycenter[1] * mask[1], barycenter[2] * mask[2], 1]
+	for mesh, indices in componentsPoints:
+		mesh.setPoints(indices, vectors.transform(mesh.getPoints(indices), matrix, points=True))
+		mesh.write()
 
 @stacksHandler
 def ICollapseComponents():
@@ -0,0 +1,411 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**meshPoints.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`MeshPoints` class reading and writing a mesh world space points in bulk.
+
+**Others:**
+	The points are read with a single **xform** query and written back with a single undoable **setAttr** command
+	on the mesh tweaks spanning the modified vertices, **MFnMesh.setPoints** is not undoable outside of a plugin
+	command. The tweaks are the same attribute **cmds.xform** and **cmds.move** write on components, the deformed
+	meshes points are written with **cmds.xform** so that Maya routes the tweaks through the deformers history.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import maya.cmds as cmds
+import maya.OpenMaya as OpenMaya
+import re
+from collections import OrderedDict
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+from snippets.libraries.core import vectors
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["VERTICES_PATTERN",
+			"getDagPath",
+			"getIndices",
+			"MeshPoints",
+			"getComponentsPoints"]
+
+VERTICES_PATTERN = re.compile(r"^(?P<node>.+)\.vtx\[(?P<first>\d+)(?::(?P<last>\d+))?\]$")
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getDagPath(node):
+	"""
+	Returns given node mesh shape dag path, the node is either a mesh transform or a mesh shape.
+
+	:param node: Node.
+	:type node: unicode
+	:return: Mesh dag path.
+	:rtype: MDagPath
+	"""
+
+	selectionList = OpenMaya.MSelectionList()
+	selectionList.add(node)
+	dagPath = OpenMaya.MDagPath()
+	selectionList.getDagPath(0, dagPath)
+	dagPath.extendToShape()
+	return dagPath
+
+def getIndices(components):
+	"""
+	Returns given vertices components indices grouped by node, the components can be flattened or ranges.
+
+	:param components: Vertices components.
+	:type components: list
+	:return: Nodes indices, sorted and unique.
+	:rtype: OrderedDict
+	"""
+
+	ranges = OrderedDict()
+	for component in components:
+		match = VERTICES_PATTERN.match(component)
+		if not match:
+			continue
+
+		first = int(match.group("first"))
+		last = int(match.group("last")) if match.group("last") is not None else first
+		ranges.setdefault(match.group("node"), []).append((first, last))
+
+	indices = OrderedDict()
+	for node, nodeRanges in ranges.iteritems():
+		if numpy is not None:
+			indices[node] = numpy.unique(numpy.concatenate([numpy.arange(first, last + 1)
+															for first, last in nodeRanges]))
+		else:
+			indices[node] = sorted(set(index for first, last in nodeRanges for index in range(first, last + 1)))
+	return indices
+
+class MeshPoints(object):
+	"""
+	Defines the **MeshPoints** class giving access to a mesh world space points as a whole (N, 3) array.
+
+	The points are modified in memory with the :meth:`MeshPoints.setPoints` and :meth:`MeshPoints.movePoints` methods
+	and the modified ones are written back to the mesh with the :meth:`MeshPoints.write` method.
+	"""
+
+	def __init__(self, mesh):
+		"""
+		Initializes the class.
+
+		:param mesh: Mesh transform or shape.
+		:type mesh: unicode
+		"""
+
+		# --- Setting class attributes. ---
+		self.__dagPath = getDagPath(mesh)
+		self.__mesh = self.__dagPath.fullPathName()
+		self.__fnMesh = OpenMaya.MFnMesh(self.__dagPath)
+
+		history = cmds.listHistory(self.__mesh, pruneDagObjects=True) or []
+		self.__deformed = bool(history and cmds.ls(history, type="geometryFilter"))
+
+		self.__points = None
+		self.__writtenPoints = None
+		self.__modified = []
+
+		self.read()
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def mesh(self):
+		"""
+		Property for **self.__mesh** attribute.
+
+		:return: self.__mesh.
+		:rtype: unicode
+		"""
+
+		return self.__mesh
+
+	@mesh.setter
+	def mesh(self, value):
+		"""
+		Setter for **self.__mesh** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		raise ValueError("{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "mesh"))
+
+	@mesh.deleter
+	def mesh(self):
+		"""
+		Deleter for **self.__mesh** attribute.
+		"""
+
+		raise ValueError("{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "mesh"))
+
+	@property
+	def points(self):
+		"""
+		Property for **self.__points** attribute.
+
+		:return: self.__points.
+		:rtype: ndarray or list
+		"""
+
+		return self.__points
+
+	@points.setter
+	def points(self, value):
+		"""
+		Setter for **self.__points** attribute.
+
+		:param value: Attribute value.
+		:type value: ndarray or list
+		"""
+
+		raise ValueError("{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "points"))
+
+	@points.deleter
+	def points(self):
+		"""
+		Deleter for **self.__points** attribute.
+		"""
+
+		raise ValueError("{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "points"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def read(self):
+		"""
+		Reads the mesh world space points, discarding the points modified since the last write.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.__points = vectors.getVectors(cmds.xform("{0}.vtx[*]".format(self.__mesh),
+													query=True, translation=True, worldSpace=True))
+		self.__writtenPoints = numpy.array(self.__points) if numpy is not None else list(self.__points)
+		self.__modified = []
+		return True
+
+	def getIndices(self, components):
+		"""
+		Returns the mesh vertices indices of given components, other meshes components are ignored.
+
+		:param components: Components.
+		:type components: list
+		:return: Vertices indices.
+		:rtype: ndarray or list
+		"""
+
+		indices = [nodeIndices for node, nodeIndices in getIndices(
+					cmds.polyListComponentConversion(components, toVertex=True) or []).iteritems()
+					if getDagPath(node).fullPathName() == self.__mesh]
+		if numpy is not None:
+			return numpy.unique(numpy.concatenate(indices)) if indices else numpy.array([], dtype=numpy.int64)
+		return sorted(set(index for nodeIndices in indices for index in nodeIndices))
+
+	def getPoints(self, indices=None):
+		"""
+		Returns given indices points, all the points by default.
+
+		:param indices: Vertices indices.
+		:type indices: ndarray or list
+		:return: Points.
+		:rtype: ndarray or list
+		"""
+
+		if indices is None:
+			return self.__points
+
+		if numpy is not None:
+			return self.__points[indices]
+		return [self.__points[index] for index in indices]
+
+	def setPoints(self, indices, points):
+		"""
+		Sets given indices points.
+
+		:param indices: Vertices indices.
+		:type indices: ndarray or list
+		:param points: Points.
+		:type points: ndarray or list
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if numpy is not None:
+			self.__points[indices] = points
+		else:
+			for index, point in zip(indices, points):
+				self.__points[index] = tuple(point)
+		self.__modified.append(indices)
+		return True
+
+	def movePoints(self, indices, offsets):
+		"""
+		Moves given indices points by given offsets.
+
+		:param indices: Vertices indices.
+		:type indices: ndarray or list
+		:param offsets: Offsets.
+		:type offsets: ndarray or list
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if numpy is not None:
+			self.__points[indices] += offsets
+		else:
+			for index, offset in zip(indices, offsets):
+				point = self.__points[index]
+				self.__points[index] = (point[0] + offset[0], point[1] + offset[1], point[2] + offset[2])
+		self.__modified.append(indices)
+		return True
+
+	def getFaceVertices(self, index):
+		"""
+		Returns given face vertices indices.
+
+		:param index: Face index.
+		:type index: int
+		:return: Vertices indices.
+		:rtype: list
+		"""
+
+		vertices = OpenMaya.MIntArray()
+		self.__fnMesh.getPolygonVertices(index, vertices)
+		return [vertices[i] for i in range(vertices.length())]
+
+	def getClosestFace(self, point):
+		"""
+		Returns the face closest to given world space point.
+
+		:param point: Point.
+		:type point: tuple or ndarray
+		:return: Face index.
+		:rtype: int
+		"""
+
+		scriptUtil = OpenMaya.MScriptUtil()
+		scriptUtil.createFromInt(0)
+		pointer = scriptUtil.asIntPtr()
+		self.__fnMesh.getClosestPoint(OpenMaya.MPoint(float(point[0]), float(point[1]), float(point[2])),
+									OpenMaya.MPoint(), OpenMaya.MSpace.kWorld, pointer)
+		return OpenMaya.MScriptUtil.getInt(pointer)
+
+	def write(self):
+		"""
+		Writes the modified points to the mesh with a single undoable command.
+
+		The world space offsets are converted to object space and added to the tweaks of the vertices range
+		spanning the modified ones, the tweaks are single precision values.
+
+		:return: Modified points were written.
+		:rtype: bool
+		"""
+
+		if not self.__modified:
+			return False
+
+		if numpy is not None:
+			indices = numpy.unique(numpy.concatenate([numpy.asarray(indices, dtype=numpy.int64).ravel()
+													for indices in self.__modified]))
+		else:
+			indices = sorted(set(index for indices in self.__modified for index in indices))
+		self.__modified = []
+
+		if not len(indices):
+			return False
+
+		cmds.undoInfo(openChunk=True)
+		try:
+			if self.__deformed:
+				for index in indices:
+					cmds.xform("{0}.vtx[{1}]".format(self.__mesh, index),
+								translation=[float(value) for value in self.__points[index]], worldSpace=True)
+					self.__writtenPoints[index] = self.__points[index]
+				return True
+
+			matrix = self.__dagPath.inclusiveMatrixInverse()
+			matrix = [matrix(i, j) for i in range(4) for j in range(4)]
+			first, last = int(indices[0]), int(indices[-1])
+			attribute = "{0}.pnts[{1}:{2}]".format(self.__mesh, first, last)
+			if numpy is not None:
+				offsets = vectors.transform(self.__points[indices] - self.__writtenPoints[indices], matrix)
+				tweaks = numpy.asarray(cmds.getAttr(attribute), dtype=numpy.float64).reshape(-1, 3)
+				tweaks[indices - first] += offsets
+				self.__writtenPoints[indices] = self.__points[indices]
+				values = tweaks.ravel().tolist()
+			else:
+				offsets = vectors.transform([tuple(self.__points[index][i] - self.__writtenPoints[index][i]
+												for i in range(3)) for index in indices], matrix)
+				tweaks = [list(tweak) for tweak in cmds.getAttr(attribute)]
+				for index, offset in zip(indices, offsets):
+					tweak = tweaks[index - first]
+					tweak[0], tweak[1], tweak[2] = tweak[0] + offset[0], tweak[1] + offset[1], tweak[2] + offset[2]
+					self.__writtenPoints[index] = self.__points[index]
+				values = [value for tweak in tweaks for value in tweak]
+			cmds.setAttr(attribute, *values, size=last - first + 1, type="float3")
+		finally:
+			cmds.undoInfo(closeChunk=True)
+		return True
+
+def getComponentsPoints(components):
+	"""
+	Returns given components vertices points grouped by mesh.
+
+	:param components: Components.
+	:type components: list
+	:return: Meshes points, vertices indices.
+	:rtype: list
+	"""
+
+	meshesIndices = OrderedDict()
+	for node, indices in getIndices(cmds.polyListComponentConversion(components, toVertex=True) or []).iteritems():
+		meshesIndices.setdefault(getDagPath(node).fullPathName(), []).append(indices)
+
+	componentsPoints = []
+	for mesh, indices in meshesIndices.iteritems():
+		if numpy is not None:
+			indices = numpy.unique(numpy.concatenate(indices))
+		else:
+			indices = sorted(set(index for nodeIndices in indices for index in nodeIndices))
+		componentsPoints.append((MeshPoints(mesh), indices))
+	return componentsPoints
@@ -0,0 +1,361 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**vectors.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Vectors maths Module operating on whole (N, 3) vectors arrays instead of per point Maya api objects.
+
+**Others:**
+	The definitions are vectorized with NumPy when available and fallback to pure Python otherwise,
+	they accept any (N, 3) sequence, e.g. a list of **cmds.xform** queried positions, or a single vector.
+
+	Returned arrays are NumPy arrays or lists of tuples, both can be iterated and indexed the same way.
+	Matrices are 16 values lists or 4x4 sequences using Maya row vectors convention.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import math
+import numbers
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["isVector",
+			"getVectors",
+			"concatenate",
+			"getNorms",
+			"normalize",
+			"getDots",
+			"getDistances",
+			"getClosest",
+			"transform",
+			"getCentroid",
+			"fitPlane",
+			"getPlaneOffsets",
+			"getLineOffsets"]
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def isVector(value):
+	"""
+	Returns if given value is a single vector rather than a vectors array.
+
+	:param value: Value.
+	:type value: object
+	:return: Is single vector.
+	:rtype: bool
+	"""
+
+	if numpy is not None and isinstance(value, numpy.ndarray):
+		return value.ndim == 1
+	return isinstance(value[0], numbers.Number)
+
+def _getMatrix(matrix):
+	"""
+	Returns given matrix as a 4x4 rows list.
+
+	:param matrix: Matrix.
+	:type matrix: list
+	:return: Matrix rows.
+	:rtype: list
+	"""
+
+	if isVector(matrix):
+		return [list(matrix[i:i + 4]) for i in range(0, 16, 4)]
+	return [list(row) for row in matrix]
+
+def _map(function, vectorsA, vectorsB):
+	"""
+	Maps given function over given vectors pairs, a single vector is broadcasted.
+
+	:param function: Function.
+	:type function: object
+	:param vectorsA: Vectors A.
+	:type vectorsA: list
+	:param vectorsB: Vectors B.
+	:type vectorsB: list
+	:return: Function values.
+	:rtype: object
+	"""
+
+	vectorA, vectorB = isVector(vectorsA), isVector(vectorsB)
+	if vectorA and vectorB:
+		return function(vectorsA, vectorsB)
+	elif vectorA:
+		return [function(vectorsA, vector) for vector in vectorsB]
+	elif vectorB:
+		return [function(vector, vectorsB) for vector in vectorsA]
+	return [function(a, b) for a, b in zip(vectorsA, vectorsB)]
+
+def getVectors(values):
+	"""
+	Returns given flat values list, e.g. from a **cmds.xform** query, as (N, 3) vectors.
+
+	:param values: Flat values.
+	:type values: list
+	:return: Vectors.
+	:rtype: ndarray or list
+	"""
+
+	if numpy is not None:
+		return numpy.asarray(values, dtype=numpy.float64).reshape(-1, 3)
+	return [(values[i], values[i + 1], values[i + 2]) for i in range(0, len(values), 3)]
+
+def concatenate(vectorsList):
+	"""
+	Returns given vectors arrays concatenated.
+
+	:param vectorsList: Vectors arrays.
+	:type vectorsList: tuple or list
+	:return: Vectors.
+	:rtype: ndarray or list
+	"""
+
+	if numpy is not None:
+		return numpy.concatenate([numpy.asarray(vectors, dtype=numpy.float64).reshape(-1, 3)
+								for vectors in vectorsList])
+	return [tuple(vector) for vectors in vectorsList for vector in vectors]
+
+def getNorms(vectors):
+	"""
+	Returns given vectors norms.
+
+	:param vectors: Vectors.
+	:type vectors: ndarray or list
+	:return: Norms.
+	:rtype: ndarray or list or float
+	"""
+
+	if numpy is not None:
+		vectors = numpy.asarray(vectors, dtype=numpy.float64)
+		return numpy.sqrt(numpy.einsum("...i,...i", vectors, vectors))
+
+	if isVector(vectors):
+		return math.sqrt(sum(value * value for value in vectors))
+	return [math.sqrt(x * x + y * y + z * z) for x, y, z in vectors]
+
+def normalize(vectors):
+	"""
+	Returns given vectors normalized, null vectors are left untouched.
+
+	:param vectors: Vectors.
+	:type vectors: ndarray or list
+	:return: Normalized vectors.
+	:rtype: ndarray or list or tuple
+	"""
+
+	if numpy is not None:
+		vectors = numpy.asarray(vectors, dtype=numpy.float64)
+		norms = getNorms(vectors)[..., numpy.newaxis]
+		return numpy.divide(vectors, norms, out=numpy.array(vectors), where=norms != 0)
+
+	def normalizeVector(vector):
+		norm = math.sqrt(sum(value * value for value in vector))
+		return tuple(value / norm for value in vector) if norm else tuple(vector)
+
+	return normalizeVector(vectors) if isVector(vectors) else [normalizeVector(vector) for vector in vectors]
+
+def getDots(vectorsA, vectorsB):
+	"""
+	Returns the dot products between given vectors, a single vector is broadcasted.
+
+	:param vectorsA: Vectors A.
+	:type vectorsA: ndarray or list
+	:param vectorsB: Vectors B.
+	:type vectorsB: ndarray or list
+	:return: Dot products.
+	:rtype: ndarray or list or float
+	"""
+
+	if numpy is not None:
+		return numpy.einsum("...i,...i",
+							numpy.asarray(vectorsA, dtype=numpy.float64),
+							numpy.asarray(vectorsB, dtype=numpy.float64))
+
+	return _map(lambda a, b: a[0] * b[0] + a[1] * b[1] + a[2] * b[2], vectorsA, vectorsB)
+
+def getDistances(pointsA, pointsB):
+	"""
+	Returns the distances between given points, a single point is broadcasted.
+
+	:param pointsA: Points A.
+	:type pointsA: ndarray or list
+	:param pointsB: Points B.
+	:type pointsB: ndarray or list
+	:return: Distances.
+	:rtype: ndarray or list or float
+	"""
+
+	if numpy is not None:
+		return getNorms(numpy.subtract(pointsA, pointsB, dtype=numpy.float64))
+
+	return _map(lambda a, b: math.sqrt((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2),
+				pointsA, pointsB)
+
+def getClosest(point, points):
+	"""
+	Returns the index of the closest point to given point.
+
+	:param point: Point.
+	:type point: ndarray or list
+	:param points: Points.
+	:type points: ndarray or list
+	:return: Closest point index.
+	:rtype: int
+	"""
+
+	distances = getDistances(points, point)
+	if numpy is not None:
+		return int(numpy.argmin(distances))
+	return min(range(len(distances)), key=distances.__getitem__)
+
+def transform(vectors, matrix, points=False):
+	"""
+	Returns given vectors transformed by given matrix.
+
+	:param vectors: Vectors.
+	:type vectors: ndarray or list
+	:param matrix: Matrix.
+	:type matrix: list
+	:param points: Vectors are points and are translated.
+	:type points: bool
+	:return: Transformed vectors.
+	:rtype: ndarray or list or tuple
+	"""
+
+	if numpy is not None:
+		matrix = numpy.asarray(matrix, dtype=numpy.float64).reshape(4, 4)
+		vectors = numpy.dot(numpy.asarray(vectors, dtype=numpy.float64), matrix[:3, :3])
+		return vectors + matrix[3, :3] if points else vectors
+
+	rows = _getMatrix(matrix)
+	translation = rows[3][:3] if points else (0, 0, 0)
+
+	def transformVector(vector):
+		return tuple(vector[0] * rows[0][i] + vector[1] * rows[1][i] + vector[2] * rows[2][i] + translation[i]
+					for i in range(3))
+
+	return transformVector(vectors) if isVector(vectors) else [transformVector(vector) for vector in vectors]
+
+def getCentroid(points):
+	"""
+	Returns given points centroid.
+
+	:param points: Points.
+	:type points: ndarray or list
+	:return: Centroid.
+	:rtype: tuple
+	"""
+
+	if numpy is not None:
+		return tuple(numpy.mean(numpy.asarray(points, dtype=numpy.float64), axis=0))
+
+	count = float(len(points))
+	return tuple(sum(point[i] for point in points) / count for i in range(3))
+
+def fitPlane(points):
+	"""
+	Returns the plane fitting given points, the fit minimizes the squared distances along the plane dominant axis
+	and is computed from the covariance matrix minor with the largest determinant.
+
+	:param points: Points.
+	:type points: ndarray or list
+	:return: Plane origin, plane normal, null if the points are colinear.
+	:rtype: tuple
+	"""
+
+	centroid = getCentroid(points)
+	if numpy is not None:
+		deltas = numpy.asarray(points, dtype=numpy.float64) - centroid
+		(xx, xy, xz), (yx, yy, yz), (zx, zy, zz) = numpy.dot(deltas.T, deltas).tolist()
+	else:
+		deltas = [(x - centroid[0], y - centroid[1], z - centroid[2]) for x, y, z in points]
+		xx, xy, xz, yy, yz, zz = (sum(delta[i] * delta[j] for delta in deltas)
+								for i, j in ((0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)))
+
+	determinants = (yy * zz - yz * yz, xx * zz - xz * xz, xx * yy - xy * xy)
+	normals = ((determinants[0], xz * yz - xy * zz, xy * yz - xz * yy),
+				(xz * yz - xy * zz, determinants[1], xy * xz - yz * xx),
+				(xy * yz - xz * yy, xy * xz - yz * xx, determinants[2]))
+	normal = normals[max(range(3), key=lambda i: abs(determinants[i]))]
+	return centroid, tuple(normalize(normal))
+
+def getPlaneOffsets(points, origin, normal):
+	"""
+	Returns the offsets projecting given points onto given plane.
+
+	:param points: Points.
+	:type points: ndarray or list
+	:param origin: Plane origin.
+	:type origin: tuple
+	:param normal: Plane unit normal.
+	:type normal: tuple
+	:return: Offsets.
+	:rtype: ndarray or list
+	"""
+
+	if numpy is not None:
+		normal = numpy.asarray(normal, dtype=numpy.float64)
+		distances = getDots(numpy.subtract(points, origin, dtype=numpy.float64), normal)
+		return -distances[..., numpy.newaxis] * normal
+
+	offsetOrigin = getDots(origin, normal)
+	return [tuple(-(distance - offsetOrigin) * value for value in normal) for distance in getDots(points, normal)]
+
+def getLineOffsets(points, origin, direction):
+	"""
+	Returns the offsets projecting given points onto given line.
+
+	:param points: Points.
+	:type points: ndarray or list
+	:param origin: Line origin.
+	:type origin: tuple
+	:param direction: Line unit direction.
+	:type direction: tuple
+	:return: Offsets.
+	:rtype: ndarray or list
+	"""
+
+	if numpy is not None:
+		direction = numpy.asarray(direction, dtype=numpy.float64)
+		deltas = numpy.subtract(points, origin, dtype=numpy.float64)
+		return getDots(deltas, direction)[..., numpy.newaxis] * direction - deltas
+
+	offsets = []
+	for point in points:
+		delta = (point[0] - origin[0], point[1] - origin[1], point[2] - origin[2])
+		dot = delta[0] * direction[0] + delta[1] * direction[1] + delta[2] * direction[2]
+		offsets.append(tuple(dot * direction[i] - delta[i] for i in range(3)))
+	return offsets
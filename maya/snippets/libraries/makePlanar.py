@@ -1,7 +1,9 @@
 # Credits: Fiend3d (Vlad Tagincev).
 import maya.cmds as cmds
 import maya.mel as mel
-import maya.OpenMaya as OpenMaya
+
+from snippets.libraries.core import meshPoints
+from snippets.libraries.core import vectors
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
@@ -12,12 +14,6 @@ __status__ = "Production"
 
 __all__ = ["stacksHandler",
 			"getTransform",
-			"getMVector",
-			"getMMatrix",
-			"normalize",
-			"vectorMatrixMultiplication",
-			"dot",
-			"getAverageVector",
 			"makePlanar",
 			"IMakePlanar"]
 
@@ -69,97 +65,6 @@ def getTransform(node, fullPath=True):
 		transform = parents[0]
 	return transform
 
-def getMVector(vector):
-	"""
-	Returns an MVector.
-
-	:param vector: Vector.
-	:type vector: list
-	:return: MVector
-	:rtype: MVector
-	"""
-
-	return OpenMaya.MVector(vector[0], vector[1], vector[2])
-
-def getMMatrix(matrix):
-	"""
-	Returns an MMatrix.
-
-	:param matrix: matrix.
-	:type matrix: list
-	:return: MMatrix
-	:rtype: MMatrix
-	"""
-
-	mMatrix = OpenMaya.MMatrix()
-	OpenMaya.MScriptUtil.createMatrixFromList(matrix, mMatrix)
-	return mMatrix
-
-def normalize(vector):
-	"""
-	Returns the normalized vector.
-
-	:param vector: Vector.
-	:type vector: list
-	:return: Normalized vector
-	:rtype: tuple
-	"""
-
-	mVector = getMVector(vector)
-	mVector.normalize()
-	return (mVector.x, mVector.y, mVector.z)
-
-def vectorMatrixMultiplication(vector, matrix):
-	"""
-	Returns the vector multiplication between a Vector And a matrix.
-
-	:param vector: Vector.
-	:type vector: list
-	:param matrix: matrix.
-	:type matrix: list
-	:return: Matrix multiplied vector.
-	:rtype: tuple
-	"""
-
-	mVector = getMVector(vector)
-	mMatrix = getMMatrix(matrix)
-	mVector = mVector * mMatrix
-	return (mVector.x, mVector.y, mVector.z)
-
-def dot(vectorA, vectorB):
-	"""
-	Returns the dot product between two vectors.
-
-	:param vectorA: Vector A.
-	:type vectorA: list
-	:param vectorB: Vector B.
-	:type vectorB: list
-	:return: Dot product.
-	:rtype: float
-	"""
-
-	mVectorA = getMVector(vectorA)
-	mVectorB = getMVector(vectorB)
-	return mVectorA * mVectorB
-
-def getAverageVector(vectors):
-	"""
-	Returns the average vector from a list of vectors.
-
-	:param vectors: Vectors to get the average one.
-	:type vectors: list
-	:return: Average vector.
-	:rtype: list
-	"""
-
-	averageVector = [0, 0, 0]
-	for vector in vectors:
-		for i in range(3):
-			averageVector[i] += vector[i]
-	for i in range(3):
-		averageVector[i] = averageVector[i] / len(vectors)
-	return averageVector
-
 def makePlanar(components):
 	"""
 	Planarizes the given Components.
@@ -171,21 +76,16 @@ def makePlanar(components):
 	object = cmds.ls(components, o=True)
 	if object:
 		transform = getTransform(object)
-		vertices = cmds.ls(cmds.polyListComponentConversion(components, toVertex=True), fl=True)
+		componentsPoints = meshPoints.getComponentsPoints(components)
 
-		barycenters = cmds.xform(vertices, q=True, t=True, ws=True)
-		barycenter = getAverageVector([(barycenters[i], barycenters[i + 1], barycenters[i + 2]) for i in range(0, len(barycenters), 3)])
+		barycenter = vectors.getCentroid(vectors.concatenate([mesh.getPoints(indices) for mesh, indices in componentsPoints]))
 
 		normals = [float(normal) for data in cmds.polyInfo(cmds.polyListComponentConversion(components, toFace=True), faceNormals=True) for normal in data.split()[2:5]]
-		normals = [(normals[i], normals[i + 1], normals[i + 2]) for i in range(0, len(normals), 3)]
-		averageNormal = vectorMatrixMultiplication(normalize(getAverageVector(normals)), cmds.xform(transform, query=True, matrix=True, worldSpace=True))
-
-		offset = -dot(averageNormal, barycenter)
+		averageNormal = vectors.transform(vectors.normalize(vectors.getCentroid(vectors.getVectors(normals))), cmds.xform(transform, query=True, matrix=True, worldSpace=True))
 
-		for vertex in vertices:
-			position = cmds.xform(vertex, q=True, t=True, ws=True)
-			distance = -(dot(averageNormal, position) + offset)
-			cmds.xform(vertex, r=True, t=(averageNormal[0] * distance, averageNormal[1] * distance, averageNormal[2] * distance))
+		for mesh, indices in componentsPoints:
+			mesh.movePoints(indices, vectors.getPlaneOffsets(mesh.getPoints(indices), barycenter, averageNormal))
+			mesh.write()
 
 @stacksHandler
 def IMakePlanar():
@@ -1,6 +1,7 @@
 # Rename from closest.
 import maya.cmds as cmds
-import maya.OpenMaya as OpenMaya
+
+from snippets.libraries.core import vectors
 
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
@@ -10,8 +11,6 @@ __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
 __all__ = ["stacksHandler",
-			"getMPoint",
-			"norme",
 			"renameTargetsFromClosestSources",
 			"pickSources_button_OnClicked",
 			"pickTargets_button_OnClicked",
@@ -50,35 +49,6 @@ def stacksHandler(object):
 
 	return stacksHandlerCall
 
-def getMPoint(point):
-	"""
-	Returns an MPoint.
-
-	:param point: Point.
-	:type point: list
-	:return: MPoint
-	:rtype: MVector
-	"""
-
-	return OpenMaya.MPoint(point[0], point[1], point[2])
-
-def norme(pointA, pointB):
-	"""
-	Returns the norme of a vector.
-
-	:param pointA: Point A.
-	:type pointA: list
-	:param pointB: Point B.
-	:type pointB: list
-	:return: Norme
-	:rtype: float
-	"""
-
-	mPointA = getMPoint(pointA)
-	mPointB = getMPoint(pointB)
-	mVector = mPointA - mPointB
-	return mVector.length()
-
 def renameTargetsFromClosestSources(sources, targets, suffixe="__"):
 	"""
 	Renames the targets from closest sources.
@@ -91,12 +61,9 @@ def renameTargetsFromClosestSources(sources, targets, suffixe="__"):
 	:type suffixe: str
 	"""
 
+	sourcesBarycenters = [cmds.objectCenter(source, gl=True) for source in sources]
 	for target in targets:
-		targetBarycenter = cmds.objectCenter(target, gl=True)
-		normes = {}
-		for source in sources:
-			normes[source] = norme(targetBarycenter, cmds.objectCenter(source, gl=True))
-		closest = min(normes, key=lambda item: normes[item])
+		closest = sources[vectors.getClosest(cmds.objectCenter(target, gl=True), sourcesBarycenters)]
 		cmds.rename(target, "%s%s" % (closest.split("|")[-1], suffixe))
 
 @stacksHandler
@@ -30,10 +30,16 @@ from __future__ import unicode_literals
 #**********************************************************************************************************************
 import math
 import maya.cmds as cmds
-import maya.OpenMaya as OpenMaya
 import maya.mel as mel
 import re
 import functools
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+from snippets.libraries.core import meshPoints
+from snippets.libraries.core import vectors
+
 #**********************************************************************************************************************
 #***	Module attributes.
 #**********************************************************************************************************************
@@ -45,13 +51,10 @@ __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
 __all__ = ["TOLERANCE",
-			"MAXIMUM_SEARCH_DISTANCE",
+			"PROGRESS_STEP",
 			"stacksHandler",
-			"getMPoint",
-			"norme",
 			"getShapes",
 			"getReferenceObject_button_OnClicked",
-			"loadPlugin",
 			"snapComponentsOnClosestVertex",
 			"snapIt_button_OnClicked",
 			"snapOnClosestVertex_window",
@@ -59,7 +62,7 @@ __all__ = ["TOLERANCE",
 			"ISnapOnClosestVertex"]
 
 TOLERANCE = 64
-MAXIMUM_SEARCH_DISTANCE = 2 ** 32 - 1
+PROGRESS_STEP = 256
 
 #**********************************************************************************************************************
 #***	Module classes and definitions.
@@ -94,35 +97,6 @@ def stacksHandler(object):
 
 	return stacksHandlerCall
 
-def getMPoint(point):
-	"""
-	Returns an MPoint.
-
-	:param point: Point.
-	:type point: list
-	:return: MPoint
-	:rtype: MVector
-	"""
-
-	return OpenMaya.MPoint(point[0], point[1], point[2])
-
-def norme(pointA, pointB):
-	"""
-	Returns the norme of a vector.
-
-	:param pointA: Point A.
-	:type pointA: list
-	:param pointB: Point B.
-	:type pointB: list
-	:return: Norme
-	:rtype: float
-	"""
-
-	mPointA = getMPoint(pointA)
-	mPointB = getMPoint(pointB)
-	mVector = mPointA - mPointB
-	return mVector.length()
-
 def getShapes(object, fullPathState=False, noIntermediateState=True):
 	"""
 	Returns shapes of the given object.
@@ -158,16 +132,6 @@ def getReferenceObject_button_OnClicked(state=None):
 	if selection :
 		cmds.textField("referenceObject_textField", edit=True, text=selection[0])
 
-def loadPlugin(plugin):
-	"""
-	This function loads a plugin.
-
-	:param plugin: Plugin to load.
-	:type plugin: str
-	"""
-
-	not cmds.pluginInfo(plugin, query=True, loaded=True) and cmds.loadPlugin(plugin)
-
 def snapComponentsOnClosestVertex(referenceObject, components, tolerance) :
 	"""
 	This function snaps vertices onto the reference object vertices.
@@ -178,47 +142,36 @@ def snapComponentsOnClosestVertex(referenceObject, components, tolerance) :
 	:type components: list
 	"""
 
-	vertices = cmds.ls(cmds.polyListComponentConversion(components, toVertex=True), fl=True)
+	componentsPoints = meshPoints.getComponentsPoints(components)
 
 	progressBar = mel.eval("$container=$gMainProgressBar");
 
-	cmds.progressBar(progressBar, edit=True, beginProgress=True, isInterruptable=True, status="Snapping vertices ...", maxValue=len(vertices))
-
-	loadPlugin("nearestPointOnMesh")
+	cmds.progressBar(progressBar, edit=True, beginProgress=True, isInterruptable=True, status="Snapping vertices ...", maxValue=sum(len(indices) for mesh, indices in componentsPoints))
 
-	nearestPointOnMeshNode = mel.eval("nearestPointOnMesh " + referenceObject)
+	reference = meshPoints.MeshPoints(referenceObject)
+	cancelled = False
+	for mesh, indices in componentsPoints :
+		for i, (index, position) in enumerate(zip(indices, mesh.getPoints(indices))) :
+			if not i % PROGRESS_STEP :
+				if cmds.progressBar(progressBar, query=True, isCancelled=True) :
+					cancelled = True
+					break
 
-	for vertex in vertices :
-		if cmds.progressBar(progressBar, query=True, isCancelled=True) :
-			break
-
-		closestDistance = MAXIMUM_SEARCH_DISTANCE
-
-		vertexPosition = cmds.pointPosition(vertex, world=True)
-		cmds.setAttr(nearestPointOnMeshNode + ".inPosition", vertexPosition[0], vertexPosition[1], vertexPosition[2])
-		associatedFaceId = cmds.getAttr(nearestPointOnMeshNode + ".nearestFaceIndex")
-		vtxsFaces = cmds.filterExpand(cmds.polyListComponentConversion((referenceObject + ".f[" + str(associatedFaceId) + "]"), fromFace=True, 	toVertexFace=True), sm=70, expand=True)
+				cmds.progressBar(progressBar, edit=True, step=min(PROGRESS_STEP, len(indices) - i))
 
-		closestPosition = []
-		for vtxsFace in vtxsFaces :
-			associatedVtx = cmds.polyListComponentConversion(vtxsFace, fromVertexFace=True, toVertex=True)
-			associatedVtxPosition = cmds.pointPosition(associatedVtx, world=True)
+			faceVerticesPositions = reference.getPoints(reference.getFaceVertices(reference.getClosestFace(position)))
 
-			distance = norme(vertexPosition, associatedVtxPosition)
+			closestPosition = faceVerticesPositions[vectors.getClosest(position, faceVerticesPositions)]
+			if vectors.getDistances(position, closestPosition) < tolerance :
+				mesh.setPoints([index], [closestPosition])
 
-			if distance < closestDistance :
-				closestDistance = distance
-				closestPosition = associatedVtxPosition
+		mesh.write()
 
-			if closestDistance < tolerance :
-				cmds.move(closestPosition[0], closestPosition[1], closestPosition[2], vertex, worldSpace=True)
-
-		cmds.progressBar(progressBar, edit=True, step=1)
+		if cancelled :
+			break
 
 	cmds.progressBar(progressBar, edit=True, endProgress=True)
 
-	cmds.delete(nearestPointOnMeshNode)
-
 @stacksHandler
 def snapIt_button_OnClicked(state=None):
 	"""
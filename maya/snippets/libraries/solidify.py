@@ -1,8 +1,9 @@
 import maya.cmds as cmds
 import maya.mel as mel
-import maya.OpenMaya as OpenMaya
 import math
 
+from snippets.libraries.core import vectors
+
 __author__ = "Thomas Mansencal"
 __copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
 __license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
@@ -12,12 +13,6 @@ __status__ = "Production"
 
 __all__ = ["stacksHandler",
 			"getTransform",
-			"getMVector",
-			"getMMatrix",
-			"normalize",
-			"vectorMatrixMultiplication",
-			"dot",
-			"getAverageVector",
 			"getAngle",
 			"hasBorderEdges",
 			"solidifyObject",
@@ -74,97 +69,6 @@ def getTransform(node, fullPath=True):
 		transform = parents[0]
 	return transform
 
-def getMVector(vector):
-	"""
-	Returns an MVector.
-
-	:param vector: Vector.
-	:type vector: list
-	:return: MVector
-	:rtype: MVector
-	"""
-
-	return OpenMaya.MVector(vector[0], vector[1], vector[2])
-
-def getMMatrix(matrix):
-	"""
-	Returns an MMatrix.
-
-	:param matrix: matrix.
-	:type matrix: list
-	:return: MMatrix
-	:rtype: MMatrix
-	"""
-
-	mMatrix = OpenMaya.MMatrix()
-	OpenMaya.MScriptUtil.createMatrixFromList(matrix, mMatrix)
-	return mMatrix
-
-def normalize(vector):
-	"""
-	Returns the normalized vector.
-
-	:param vector: Vector.
-	:type vector: list
-	:return: Normalized vector
-	:rtype: tuple
-	"""
-
-	mVector = getMVector(vector)
-	mVector.normalize()
-	return (mVector.x, mVector.y, mVector.z)
-
-def vectorMatrixMultiplication(vector, matrix):
-	"""
-	Returns the vector multiplication between a Vector And a matrix.
-
-	:param vector: Vector.
-	:type vector: list
-	:param matrix: matrix.
-	:type matrix: list
-	:return: Matrix multiplied vector.
-	:rtype: tuple
-	"""
-
-	mVector = getMVector(vector)
-	mMatrix = getMMatrix(matrix)
-	mVector = mVector * mMatrix
-	return (mVector.x, mVector.y, mVector.z)
-
-def dot(vectorA, vectorB):
-	"""
-	Returns the dot product between two vectors.
-
-	:param vectorA: Vector A.
-	:type vectorA: list
-	:param vectorB: Vector B.
-	:type vectorB: list
-	:return: Dot product.
-	:rtype: float
-	"""
-
-	mVectorA = getMVector(vectorA)
-	mVectorB = getMVector(vectorB)
-	return mVectorA * mVectorB
-
-def getAverageVector(vectors):
-	"""
-	Returns the average vector from a list of vectors.
-
-	:param vectors: Vectors to get the average one.
-	:type vectors: list
-	:return: Average vector.
-	:rtype: list
-	"""
-
-	averageVector = [0, 0, 0]
-	for vector in vectors:
-		for i in range(3):
-			averageVector[i] += vector[i]
-	for i in range(3):
-		averageVector[i] = averageVector[i] / len(vectors)
-	return averageVector
-
 def getAngle(vectorA, vectorB):
 	"""
 	Returns the angle between two vectors.
@@ -177,7 +81,7 @@ def getAngle(vectorA, vectorB):
 	:rtype: float
 	"""
 
-	return math.degrees(math.acos(dot(vectorA, vectorB)))
+	return math.degrees(math.acos(vectors.getDots(vectorA, vectorB)))
 
 def hasBorderEdges(object):
 	"""
@@ -213,12 +117,10 @@ def solidifyObject(object, height=1, divisions=2, history=True):
 		transform = getTransform(object)
 		vertices = cmds.ls(cmds.polyListComponentConversion(object, toVertex=True), fl=True)
 
-		barycenters = cmds.xform(vertices, q=True, t=True, ws=True)
-		barycenter = getAverageVector([(barycenters[i], barycenters[i + 1], barycenters[i + 2]) for i in range(0, len(barycenters), 3)])
+		barycenter = vectors.getCentroid(vectors.getVectors(cmds.xform(vertices, q=True, t=True, ws=True)))
 
 		normals = cmds.polyNormalPerVertex(cmds.polyListComponentConversion(object, toVertexFace=True), q=True, xyz=True)
-		normals = [(normals[i], normals[i + 1], normals[i + 2]) for i in range(0, len(normals), 3)]
-		averageNormal = vectorMatrixMultiplication(normalize(getAverageVector(normals)), cmds.xform(transform, query=True, matrix=True, worldSpace=True))
+		averageNormal = vectors.transform(vectors.normalize(vectors.getCentroid(vectors.getVectors(normals))), cmds.xform(transform, query=True, matrix=True, worldSpace=True))
 
 		facesCount = cmds.polyEvaluate(object, face=True)
 		faces = object + ".f[0:" + str(facesCount - 1) + "]"
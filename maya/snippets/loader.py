@@ -28,6 +28,7 @@ from __future__ import unicode_literals
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
+import functools
 import inspect
 import logging
 import maya.cmds as cmds
@@ -35,7 +36,6 @@ import maya.mel as mel
 import os
 import platform
 import re
-from PyQt4 import uic
 from PyQt4.QtCore import QProcess
 from PyQt4.QtCore import Qt
 from PyQt4.QtGui import QAction
@@ -49,11 +49,13 @@ import foundations.strings
 import foundations.verbose
 import snippets.ui.common
 from foundations.environment import Environment
-from snippets.globals.constants import Constants
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.globals.uiConstants import UiConstants
-from snippets.ui.models import Interface
+from snippets.managers.usage import UsageStore
+from snippets.profilers.startup import PROFILER
 from snippets.ui.models import InterfacesModel
+from snippets.ui.search import InterfacesIndex
+from snippets.ui.search import isLiteralPattern
 from snippets.ui.views import Interfaces_QListView
 from snippets.ui.widgets.search_QLineEdit import Search_QLineEdit
 
@@ -73,7 +75,8 @@ LOGGER = foundations.verbose.installLogger()
 
 RuntimeGlobals.loaderUiFile = snippets.ui.common.getResourcePath(UiConstants.loaderUiFile)
 if foundations.common.pathExists(RuntimeGlobals.loaderUiFile):
-	Ui_Loader_Setup, Ui_Loader_Type = uic.loadUiType(RuntimeGlobals.loaderUiFile)
+	with PROFILER.phase("loader | Ui file loading"):
+		Ui_Loader_Setup, Ui_Loader_Type = snippets.ui.common.loadUiType(RuntimeGlobals.loaderUiFile)
 else:
 	error = "'{0}' Ui file is not available!".format(RuntimeGlobals.loaderUiFile)
 	snippets.ui.common.messageBox("Error", "Error", error)
@@ -102,7 +105,8 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		Ui_Loader_Type.__init__(self, parent)
 		Ui_Loader_Setup.__init__(self)
 
-		self.setupUi(self)
+		with PROFILER.phase("loader | Ui setup"):
+			self.setupUi(self)
 
 		# --- Setting class attributes. ---
 		self.__container = parent
@@ -110,6 +114,8 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 
 		self.__model = None
 		self.__view = None
+		self.__index = None
+		self.__informations = {}
 
 		self.__defaultText = "<center><br/><br/><h4>* * *</h4>Select a Snippet to display related informations!<h4>* * *</h4></center>"
 
@@ -117,7 +123,9 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		self.__linuxBrowsers = ("nautilus", "dolphin", "konqueror", "thunar")
 
 		# --- Initialize Ui. ---
-		self.__initializeUI()
+		with PROFILER.phase("loader | Ui initialization"):
+			self.__initializeUI()
+		PROFILER.report()
 
 	#******************************************************************************************************************
 	#***	Attributes properties.
@@ -366,6 +374,9 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		self.Search_horizontalLayout.addWidget(self.Search_lineEdit)
 
 		self.__model = InterfacesModel(self)
+		self.__index = InterfacesIndex(
+		lambda attribute: foundations.strings.getNiceName(self.getMethodName(attribute)), self.getFrecency)
+		self.__index.build(self.__modulesManager)
 
 		self.Interfaces_listView.setParent(None)
 		self.Interfaces_listView = Interfaces_QListView(self, self.__model)
@@ -382,7 +393,12 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 
 		self.Interfaces_frame_splitter.setSizes([16777215, 0])
 
-		self.setInterfaces("")
+		self.searchInterfaces("")
+
+		if RuntimeGlobals.librariesWatcher is not None:
+			RuntimeGlobals.librariesWatcher.registerListener(self.updateInterfaces)
+			self.destroyed.connect(functools.partial(RuntimeGlobals.librariesWatcher.unregisterListener,
+													self.updateInterfaces))
 
 		# Signals / Slots.
 		self.Execute_Snippet_pushButton.clicked.connect(self.__Execute_Snippet_pushButton__clicked)
@@ -391,6 +407,40 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		self.__view.doubleClicked.connect(self.__view__doubleClicked)
 		self.Search_lineEdit.textChanged.connect(self.__Search_lineEdit__textChanged)
 
+	def showEvent(self, event):
+		"""
+		Reimplements the :meth:`QWidget.showEvent` method.
+
+		The Loader listens to the libraries watcher again and catches up with the changes missed while closed.
+
+		:param event: QEvent.
+		:type event: QEvent
+		"""
+
+		watcher = RuntimeGlobals.librariesWatcher
+		if watcher is not None and not self.updateInterfaces in watcher.listeners:
+			self.__index.build(self.__modulesManager)
+			self.__informations = {}
+			watcher.registerListener(self.updateInterfaces)
+			self.searchInterfaces(foundations.strings.toString(self.Search_lineEdit.text()))
+
+		Ui_Loader_Type.showEvent(self, event)
+
+	def closeEvent(self, event):
+		"""
+		Reimplements the :meth:`QWidget.closeEvent` method.
+
+		The closed Loader stops listening to the libraries watcher.
+
+		:param event: QEvent.
+		:type event: QEvent
+		"""
+
+		if RuntimeGlobals.librariesWatcher is not None:
+			RuntimeGlobals.librariesWatcher.unregisterListener(self.updateInterfaces)
+
+		Ui_Loader_Type.closeEvent(self, event)
+
 	def __view_addActions(self):
 		"""
 		Sets the View actions.
@@ -416,8 +466,7 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		if not interface:
 			return
 
-		self.editFile(interface.module.import_.__file__.replace(
-		Constants.libraryCompiledExtension, Constants.libraryExtension))
+		self.editFile(interface.module.file)
 
 	def __view_exploreSnippetFolderAction(self, checked):
 		"""
@@ -431,7 +480,7 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		if not interface:
 			return
 
-		self.exploreDirectory(os.path.dirname(interface.module.import_.__file__))
+		self.exploreDirectory(interface.module.path)
 
 	def __Execute_Snippet_pushButton__clicked(self, checked):
 		"""
@@ -451,8 +500,8 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		:type checked: bool
 		"""
 
-		self.__modulesManager.reloadAll()
-		self.setInterfaces()
+		registered, unregistered = self.__modulesManager.reloadAll()
+		self.updateInterfaces(registered, unregistered)
 
 	def __view_selectionModel__selectionChanged(self, selectedItems, deselectedItems):
 		"""
@@ -468,43 +517,7 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		if not interface:
 			return
 
-		if hasattr(interface, "attribute"):
-			arguments = inspect.getargspec(interface.module.import_.__dict__[interface.attribute])
-			content = """
-					<h4><center>{0}</center></h4>
-					<p>
-					<b>Module:</b> {1}
-					<br/>
-					<b>Path:</b> {2}
-					</p>
-					<p>
-					<b>Method:</b> {3}
-					<br/>
-					<b>Interface:</b> {4}
-					<br/>
-					<b>Arguments:</b> {5}
-					<br/>
-					<b>Defaults:</b> {6}
-					<br/>
-					<b>Variable arguments:</b> {7}
-					<br/>
-					<b>Keywords:</b> {8}
-					</p>
-					<p>
-					<b>Documentation:</b> {9}
-					</p>
-					""".format(interface.name,
-						interface.module.name,
-						os.path.normpath(interface.module.import_.__file__),
-						self.getMethodName(interface.attribute),
-						interface.attribute,
-						arguments.args,
-						arguments.defaults,
-						arguments.varargs,
-						arguments.keywords,
-						interface.module.import_.__dict__[interface.attribute].__doc__)
-		else:
-			content = self.__defaultText
+		content = self.getInformations(interface) if hasattr(interface, "attribute") else self.__defaultText
 
 		LOGGER.debug("> Update 'Informations_textBrowser' Widget content: '{0}'.".format(content))
 		self.Informations_textBrowser.setText(content)
@@ -527,7 +540,7 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		:type text: QString
 		"""
 
-		self.setInterfaces(foundations.strings.toString(text))
+		self.searchInterfaces(foundations.strings.toString(text))
 
 	def getMethodName(self, name):
 		"""
@@ -541,6 +554,136 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 
 		return "{0}{1}".format(name[1].lower(), name[2:])
 
+	def getArguments(self, interface):
+		"""
+		Returns the arguments of given interface from its module discovered data,
+		the module is only imported if the data is not available.
+
+		:param interface: Interface.
+		:type interface: Interface
+		:return: Arguments, see :func:`snippets.managers.modulesManager.getArguments` definition.
+		:rtype: dict
+		"""
+
+		module = interface.module
+		if module.arguments is not None:
+			return module.arguments.get(interface.attribute, {})
+
+		try:
+			arguments = inspect.getargspec(module.import_.__dict__[interface.attribute])
+		except TypeError:
+			return {}
+
+		return {"args": arguments.args,
+				"defaults": arguments.defaults and [repr(default) for default in arguments.defaults],
+				"varargs": arguments.varargs,
+				"keywords": arguments.keywords}
+
+	def getDocumentation(self, interface):
+		"""
+		Returns the documentation of given interface from its module discovered data,
+		the module is only imported if the data is not available.
+
+		:param interface: Interface.
+		:type interface: Interface
+		:return: Documentation.
+		:rtype: unicode
+		"""
+
+		module = interface.module
+		if module.documentations is not None:
+			return module.documentations.get(interface.attribute)
+
+		return module.import_.__dict__[interface.attribute].__doc__
+
+	def getInformations(self, interface):
+		"""
+		Returns the informations content of given interface.
+
+		The content is cached per interface until its module file changes so that browsing
+		the interfaces doesn't import their modules nor format the content again,
+		only the executions statistics are formatted on each call.
+
+		:param interface: Interface.
+		:type interface: Interface
+		:return: Informations content.
+		:rtype: unicode
+		"""
+
+		key = (interface.module.name, interface.attribute)
+		statistics, content = self.__informations.get(key, (None, None))
+		if content is not None and statistics == interface.module.statistics:
+			return content + self.getExecutionsInformations(interface)
+
+		arguments = self.getArguments(interface)
+		join = lambda x: x is not None and ", ".join(x) or None
+		content = """
+					<h4><center>{0}</center></h4>
+					<p>
+					<b>Module:</b> {1}
+					<br/>
+					<b>Path:</b> {2}
+					</p>
+					<p>
+					<b>Method:</b> {3}
+					<br/>
+					<b>Interface:</b> {4}
+					<br/>
+					<b>Arguments:</b> {5}
+					<br/>
+					<b>Defaults:</b> {6}
+					<br/>
+					<b>Variable arguments:</b> {7}
+					<br/>
+					<b>Keywords:</b> {8}
+					</p>
+					<p>
+					<b>Documentation:</b> {9}
+					</p>
+					""".format(interface.name,
+						interface.module.name,
+						os.path.normpath(interface.module.file),
+						self.getMethodName(interface.attribute),
+						interface.attribute,
+						join(arguments.get("args")),
+						join(arguments.get("defaults")),
+						arguments.get("varargs"),
+						arguments.get("keywords"),
+						self.getDocumentation(interface))
+		self.__informations[key] = (interface.module.statistics, content)
+		return content + self.getExecutionsInformations(interface)
+
+	def getExecutionsInformations(self, interface):
+		"""
+		Returns the executions statistics content of given interface,
+		see :class:`snippets.profilers.execution.ExecutionProfiler` class.
+
+		:param interface: Interface.
+		:type interface: Interface
+		:return: Executions statistics content.
+		:rtype: unicode
+		"""
+
+		if RuntimeGlobals.executionProfiler is None:
+			return ""
+
+		statistics = RuntimeGlobals.executionProfiler.getStatistics(
+		UsageStore.getKey(interface.module.name, interface.attribute))
+		if not statistics:
+			return ""
+
+		return """
+				<p>
+				<b>Executions:</b> {0}
+				<br/>
+				<b>Wall time (ms):</b> p50 {1:.1f}, p95 {2:.1f}, max {3:.1f}
+				<br/>
+				<b>Cpu time (ms):</b> p50 {4:.1f}, p95 {5:.1f}, max {6:.1f}
+				</p>
+				""".format(statistics["count"],
+							*[statistics[name][percentile] * 1000
+							for name in ("wall", "cpu") for percentile in ("p50", "p95", "max")])
+
 	def setInterfaces(self, pattern=".*", flags=re.IGNORECASE):
 		"""
 		Sets the Model interfaces.
@@ -553,21 +696,55 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		:rtype: bool
 		"""
 
-		try:
-			pattern = re.compile(pattern, flags)
-		except Exception:
-			return
+		with PROFILER.phase("loader | Model population"):
+			interfaces = self.__index.filter(pattern, flags)
+			if interfaces is None:
+				return
 
-		self.__model.clear()
+			self.__model.updateInterfaces(interfaces)
+		return True
+
+	def searchInterfaces(self, query):
+		"""
+		Sets the Model interfaces fuzzy matching given query, see :class:`snippets.ui.search.FuzzyMatcher` class.
 
-		for name, module in self.__modulesManager:
-			if not module.interfaces:
-				continue
+		An empty query lists all the interfaces and a regex query filters them,
+		see :meth:`Loader.setInterfaces` method.
 
-			for interface in module.interfaces:
-				name = foundations.strings.getNiceName(self.getMethodName(interface))
-				if re.search(pattern, name):
-					self.__model.registerInterface(Interface(name=name, attribute=interface, module=module))
+		:param query: Query.
+		:type query: unicode
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not query.strip() or not isLiteralPattern(query):
+			return self.setInterfaces(query if query.strip() else "")
+
+		with PROFILER.phase("loader | Model population"):
+			# The Model lists the interfaces in ranking order.
+			self.__model.updateInterfaces(self.__index.search(query), categories=False)
+		return True
+
+	def updateInterfaces(self, registered, unregistered):
+		"""
+		Updates the Model with given registered and unregistered interfaces.
+
+		:param registered: Registered interfaces as ( Module, Interface name ) tuples.
+		:type registered: list
+		:param unregistered: Unregistered interfaces as ( Module, Interface name ) tuples.
+		:type unregistered: list
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		for module, interface in unregistered:
+			self.__index.unregisterInterface(interface, module)
+			self.__informations.pop((module.name, interface), None)
+
+		for module, interface in registered:
+			self.__index.registerInterface(interface, module)
+
+		self.searchInterfaces(foundations.strings.toString(self.Search_lineEdit.text()))
 		return True
 
 	def getSelectedInterface(self):
@@ -599,9 +776,31 @@ class Loader(Ui_Loader_Type, Ui_Loader_Setup):
 		LOGGER.info("{0} | Executing '{1}' Interface from '{2}' Module!".format(self.__class__.__name__,
 																			method,
 																			module.name))
-		module.import_.__dict__[method]()
+		key = UsageStore.getKey(module.name, method)
+		if RuntimeGlobals.usageStore is not None:
+			RuntimeGlobals.usageStore.record(key)
+		if RuntimeGlobals.executionProfiler is not None:
+			RuntimeGlobals.executionProfiler.execute(key, module.import_.__dict__[method])
+			self.Informations_textBrowser.setText(self.getInformations(interface))
+		else:
+			module.import_.__dict__[method]()
 		return True
 
+	def getFrecency(self, interface):
+		"""
+		Returns the frecency of given interface.
+
+		:param interface: Interface.
+		:type interface: Interface
+		:return: Frecency.
+		:rtype: float
+		"""
+
+		if RuntimeGlobals.usageStore is None:
+			return 0.
+
+		return RuntimeGlobals.usageStore.getFrecency(UsageStore.getKey(interface.module.name, interface.attribute))
+
 	def editFile(self, file):
 		"""
 		Provides editing capability.
@@ -0,0 +1,396 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**bundle.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`Bundle` class reading the libraries modules from a zip bundle and the
+	:func:`buildBundle` definition building such bundle from libraries directories.
+
+**Others:**
+	A bundle stores the modules sources and bytecode at its root along an embedded manifest of their interfaces,
+	the modules are loaded through :mod:`zipimport` and registering a bundle doesn't access the modules files.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import imp
+import json
+import logging
+import marshal
+import os
+import re
+import struct
+import time
+import zipfile
+import zipimport
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.exceptions
+import foundations.io
+import foundations.strings
+import foundations.verbose
+from snippets.globals.constants import Constants
+from snippets.managers.manifest import getFileStatistics
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "isBundle", "Bundle", "buildBundle"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def isBundle(path):
+	"""
+	Returns if given path is a libraries bundle.
+
+	:param path: Path.
+	:type path: unicode
+	:return: Is bundle.
+	:rtype: bool
+	"""
+
+	return bool(path) and re.search(r"\.{0}$".format(Constants.bundleExtension), path, re.IGNORECASE) is not None
+
+class Bundle(object):
+	"""
+	Defines the **Bundle** class giving access to a libraries bundle modules.
+	"""
+
+	def __init__(self, file=None):
+		"""
+		Initializes the class.
+
+		:param file: Bundle file.
+		:type file: unicode
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__file = None
+		self.file = file
+
+		self.__version = None
+		self.__modules = {}
+		self.__statistics = None
+		self.__importer = None
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def file(self):
+		"""
+		Property for **self.__file** attribute.
+
+		:return: self.__file.
+		:rtype: unicode
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def file(self, value):
+		"""
+		Setter for **self.__file** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		Deleter for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
+	@property
+	def version(self):
+		"""
+		Property for **self.__version** attribute.
+
+		:return: self.__version.
+		:rtype: unicode
+		"""
+
+		return self.__version
+
+	@version.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def version(self, value):
+		"""
+		Setter for **self.__version** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "version"))
+
+	@version.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def version(self):
+		"""
+		Deleter for **self.__version** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "version"))
+
+	@property
+	def modules(self):
+		"""
+		Property for **self.__modules** attribute.
+
+		:return: self.__modules.
+		:rtype: dict
+		"""
+
+		return self.__modules
+
+	@modules.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self, value):
+		"""
+		Setter for **self.__modules** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modules"))
+
+	@modules.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self):
+		"""
+		Deleter for **self.__modules** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modules"))
+
+	@property
+	def statistics(self):
+		"""
+		Property for **self.__statistics** attribute.
+
+		:return: self.__statistics.
+		:rtype: tuple
+		"""
+
+		return self.__statistics
+
+	@statistics.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def statistics(self, value):
+		"""
+		Setter for **self.__statistics** attribute.
+
+		:param value: Attribute value.
+		:type value: tuple
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "statistics"))
+
+	@statistics.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def statistics(self):
+		"""
+		Deleter for **self.__statistics** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "statistics"))
+
+	@property
+	def importer(self):
+		"""
+		Property for **self.__importer** attribute.
+
+		:return: self.__importer.
+		:rtype: zipimporter
+		"""
+
+		return self.__importer
+
+	@importer.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def importer(self, value):
+		"""
+		Setter for **self.__importer** attribute.
+
+		:param value: Attribute value.
+		:type value: zipimporter
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "importer"))
+
+	@importer.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def importer(self):
+		"""
+		Deleter for **self.__importer** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "importer"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def read(self):
+		"""
+		Reads the bundle embedded manifest, a bundle built for another manifest version is discarded.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.__version = None
+		self.__modules = {}
+
+		try:
+			self.__statistics = getFileStatistics(self.__file)
+			# Dropping the cached zip directory so that a redeployed bundle with the same name is read again.
+			zipimport._zip_directory_cache.pop(self.__file, None)
+			self.__importer = zipimport.zipimporter(self.__file)
+			content = json.loads(self.__importer.get_data(Constants.manifestFile))
+		except (IOError, OSError, ValueError, zipimport.ZipImportError) as error:
+			LOGGER.warning("!> {0} | Cannot read '{1}' bundle: '{2}'!".format(self.__class__.__name__, self.__file, error))
+			return False
+
+		if content.get("version") != Constants.manifestVersion:
+			LOGGER.warning("!> {0} | '{1}' bundle manifest version is not supported!".format(
+			self.__class__.__name__, self.__file))
+			return False
+
+		self.__version = content.get("bundleVersion")
+		self.__modules = content.get("modules", {})
+		LOGGER.debug("> Read '{0}' modules from '{1}' bundle version '{2}'.".format(
+		len(self.__modules), self.__file, self.__version))
+		return True
+
+	def getModuleFile(self, name):
+		"""
+		Returns given module file path inside the bundle.
+
+		:param name: Module name.
+		:type name: unicode
+		:return: Module file.
+		:rtype: unicode
+		"""
+
+		return "{0}/{1}.{2}".format(foundations.strings.toForwardSlashes(self.__file), name, Constants.libraryExtension)
+
+	def listModulesFiles(self):
+		"""
+		Lists the bundle modules files sorted by path.
+
+		:return: Modules files.
+		:rtype: list
+		"""
+
+		return sorted(self.getModuleFile(name) for name in self.__modules)
+
+	def getModule(self, name):
+		"""
+		Returns given module embedded manifest entry.
+
+		:param name: Module name.
+		:type name: unicode
+		:return: Manifest entry.
+		:rtype: dict
+		"""
+
+		return self.__modules.get(name)
+
+def buildBundle(directories, file, version):
+	"""
+	Builds a libraries bundle from given directories, given by decreasing priority.
+
+	The modules sources are stored along their bytecode so that :mod:`zipimport` doesn't need to compile them,
+	the bytecode is only valid for the Python version building the bundle, other versions compile the sources.
+
+	:param directories: Libraries directories.
+	:type directories: tuple or list
+	:param file: Bundle file.
+	:type file: unicode
+	:param version: Bundle version.
+	:type version: unicode
+	:return: Bundled modules count.
+	:rtype: int
+	"""
+
+	# Avoiding a circular import, the modules manager imports this module.
+	from snippets.managers.modulesManager import ModulesManager, parseModule
+
+	foundations.io.setDirectory(os.path.dirname(os.path.abspath(file)))
+
+	modules = {}
+	# The modules are written with the bundle build time, :mod:`zipimport` checks the bytecode against it.
+	dateTime = time.localtime()[:5] + (time.localtime()[5] // 2 * 2,)
+	mtime = int(time.mktime(dateTime + (0, 0, -1)))
+	with zipfile.ZipFile(file, "w", zipfile.ZIP_DEFLATED) as bundle:
+		for name, path in ModulesManager(directories).listModulesFiles():
+			LOGGER.info("{0} | Bundling '{1}' Module from '{2}'.".format(buildBundle.__name__, name, path))
+
+			with open(path, "rU") as source:
+				source = source.read()
+
+			member = "{0}.{1}".format(name, Constants.libraryExtension)
+			bundle.writestr(zipfile.ZipInfo(member, dateTime), source)
+
+			code = compile(source, "{0}/{1}".format(os.path.basename(file), member), "exec", 0, True)
+			bundle.writestr(zipfile.ZipInfo("{0}.{1}".format(name, Constants.libraryCompiledExtension), dateTime),
+							imp.get_magic() + struct.pack(b"<I", mtime) + marshal.dumps(code))
+
+			modules[name] = dict(parseModule(path), name=name)
+
+		bundle.writestr(zipfile.ZipInfo(Constants.manifestFile, dateTime),
+						json.dumps({"version": Constants.manifestVersion,
+									"bundleVersion": version,
+									"modules": modules}, indent=4, sort_keys=True))
+	return len(modules)
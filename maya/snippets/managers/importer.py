@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**importer.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`LibrariesImporter` class importing the libraries modules under an isolated namespace
+	without modifying :attr:`sys.path`.
+
+**Others:**
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import imp
+import logging
+import sys
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.exceptions
+import foundations.verbose
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "LibrariesImporter", "installImporter"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class LibrariesImporter(object):
+	"""
+	Defines a `PEP 302 <http://www.python.org/dev/peps/pep-0302/>`_ finder / loader importing the registered
+	libraries modules as **namespace.module** modules.
+	"""
+
+	def __init__(self, namespace=Constants.librariesNamespace):
+		"""
+		Initializes the class.
+
+		:param namespace: Namespace the modules are imported into.
+		:type namespace: unicode
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__namespace = namespace
+
+		self.__modules = {}
+		self.__loaders = {}
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def namespace(self):
+		"""
+		Property for **self.__namespace** attribute.
+
+		:return: self.__namespace.
+		:rtype: unicode
+		"""
+
+		return self.__namespace
+
+	@namespace.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def namespace(self, value):
+		"""
+		Setter for **self.__namespace** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "namespace"))
+
+	@namespace.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def namespace(self):
+		"""
+		Deleter for **self.__namespace** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "namespace"))
+
+	@property
+	def modules(self):
+		"""
+		Property for **self.__modules** attribute.
+
+		:return: self.__modules.
+		:rtype: dict
+		"""
+
+		return self.__modules
+
+	@modules.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self, value):
+		"""
+		Setter for **self.__modules** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modules"))
+
+	@modules.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self):
+		"""
+		Deleter for **self.__modules** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modules"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def getFullName(self, name):
+		"""
+		Returns the fully qualified name of given module.
+
+		:param name: Module name.
+		:type name: unicode
+		:return: Fully qualified module name.
+		:rtype: unicode
+		"""
+
+		return "{0}.{1}".format(self.__namespace, name)
+
+	def registerModule(self, name, file, loader=None):
+		"""
+		Registers given module file.
+
+		:param name: Module name.
+		:type name: unicode
+		:param file: Module file.
+		:type file: unicode
+		:param loader: Loader providing the module code, e.g. a bundle :class:`zipimport.zipimporter`.
+		:type loader: object
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.__modules[name] = file
+		if loader is None:
+			self.__loaders.pop(name, None)
+		else:
+			self.__loaders[name] = loader
+		return True
+
+	def unregisterModule(self, name):
+		"""
+		Unregisters given module.
+
+		:param name: Module name.
+		:type name: unicode
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.__modules.pop(name, None)
+		self.__loaders.pop(name, None)
+		sys.modules.pop(self.getFullName(name), None)
+		return True
+
+	def find_module(self, fullname, path=None):
+		"""
+		Returns the importer if it can import given module.
+
+		:param fullname: Fully qualified module name.
+		:type fullname: str
+		:param path: Parent package path.
+		:type path: list
+		:return: Loader.
+		:rtype: LibrariesImporter
+		"""
+
+		if fullname == self.__namespace:
+			return self
+
+		namespace, _, name = fullname.rpartition(".")
+		if namespace == self.__namespace and name in self.__modules:
+			return self
+
+	def load_module(self, fullname):
+		"""
+		Imports given module.
+
+		:param fullname: Fully qualified module name.
+		:type fullname: str
+		:return: Module.
+		:rtype: ModuleType
+		"""
+
+		if fullname == self.__namespace:
+			module = sys.modules.setdefault(fullname, imp.new_module(fullname))
+			module.__file__ = str("<{0}>".format(self.__class__.__name__))
+			module.__path__ = []
+			module.__loader__ = self
+			return module
+
+		name = fullname.rpartition(".")[-1]
+		file = self.__modules[name]
+		loader = self.__loaders.get(name)
+		if loader is not None:
+			code = loader.get_code(str(name))
+		else:
+			with open(file, "rU") as source:
+				# Compiling without inheriting this module future flags.
+				code = compile(source.read(), file, "exec", 0, True)
+
+		module = sys.modules.setdefault(fullname, imp.new_module(fullname))
+		# Python 2 expects byte strings for those attributes.
+		module.__file__ = file.encode(sys.getfilesystemencoding()) if type(file) is unicode else file
+		module.__loader__ = self
+		module.__package__ = str(self.__namespace)
+		try:
+			exec code in module.__dict__
+		except:
+			del(sys.modules[fullname])
+			raise
+
+		setattr(sys.modules[self.__namespace], name, module)
+		return module
+
+def installImporter(namespace=Constants.librariesNamespace):
+	"""
+	Installs a :class:`LibrariesImporter` class instance for given namespace into :attr:`sys.meta_path`
+	or returns the one already installed.
+
+	:param namespace: Namespace the modules are imported into.
+	:type namespace: unicode
+	:return: Importer.
+	:rtype: LibrariesImporter
+	"""
+
+	for finder in sys.meta_path:
+		# Comparing namespaces so that an importer installed before a reload of this module is still found.
+		if getattr(finder, "namespace", None) == namespace and hasattr(finder, "registerModule"):
+			return finder
+
+	importer = LibrariesImporter(namespace)
+	sys.meta_path.append(importer)
+	LOGGER.debug("> Installed '{0}' importer for '{1}' namespace.".format(importer, namespace))
+	return importer
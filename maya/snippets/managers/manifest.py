@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**manifest.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`Manifest` class persisting discovered modules interfaces on disk.
+
+**Others:**
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import json
+import logging
+import os
+import platform
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.common
+import foundations.exceptions
+import foundations.io
+import foundations.verbose
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "getFileStatistics", "Manifest"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getFileStatistics(path):
+	"""
+	Returns the statistics used to detect given file changes.
+
+	:param path: File path.
+	:type path: unicode
+	:return: Modification time, size.
+	:rtype: tuple
+	"""
+
+	statistics = os.stat(path)
+	return statistics.st_mtime, statistics.st_size
+
+class Manifest(object):
+	"""
+	Defines the **Manifest** class mapping modules files to their discovered interfaces.
+	"""
+
+	def __init__(self, file=None):
+		"""
+		Initializes the class.
+
+		:param file: Manifest file.
+		:type file: unicode
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__file = None
+		self.file = file
+
+		self.__modules = {}
+		self.__modified = False
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def file(self):
+		"""
+		Property for **self.__file** attribute.
+
+		:return: self.__file.
+		:rtype: unicode
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def file(self, value):
+		"""
+		Setter for **self.__file** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		Deleter for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
+	@property
+	def modules(self):
+		"""
+		Property for **self.__modules** attribute.
+
+		:return: self.__modules.
+		:rtype: dict
+		"""
+
+		return self.__modules
+
+	@modules.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self, value):
+		"""
+		Setter for **self.__modules** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modules"))
+
+	@modules.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self):
+		"""
+		Deleter for **self.__modules** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modules"))
+
+	@property
+	def modified(self):
+		"""
+		Property for **self.__modified** attribute.
+
+		:return: self.__modified.
+		:rtype: bool
+		"""
+
+		return self.__modified
+
+	@modified.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modified(self, value):
+		"""
+		Setter for **self.__modified** attribute.
+
+		:param value: Attribute value.
+		:type value: bool
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modified"))
+
+	@modified.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modified(self):
+		"""
+		Deleter for **self.__modified** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modified"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def __contains__(self, path):
+		"""
+		Reimplements the :meth:`object.__contains__` method.
+
+		:param path: Module file path.
+		:type path: unicode
+		:return: Module existence.
+		:rtype: bool
+		"""
+
+		return path in self.__modules
+
+	def __len__(self):
+		"""
+		Reimplements the :meth:`object.__len__` method.
+
+		:return: Modules count.
+		:rtype: int
+		"""
+
+		return len(self.__modules)
+
+	def read(self):
+		"""
+		Reads the manifest file, a manifest written by another version is discarded.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.__modules = {}
+		self.__modified = False
+
+		if not foundations.common.pathExists(self.__file):
+			return False
+
+		try:
+			with open(self.__file, "r") as file:
+				content = json.load(file)
+		except (IOError, ValueError) as error:
+			LOGGER.warning("!> {0} | Cannot read '{1}' manifest file: '{2}'!".format(
+			self.__class__.__name__, self.__file, error))
+			return False
+
+		if content.get("version") != Constants.manifestVersion:
+			LOGGER.info("{0} | Discarding outdated '{1}' manifest file!".format(self.__class__.__name__, self.__file))
+			return False
+
+		self.__modules = content.get("modules", {})
+		LOGGER.debug("> Read '{0}' modules from '{1}' manifest file.".format(len(self.__modules), self.__file))
+		return True
+
+	def write(self):
+		"""
+		Writes the manifest file if it has been modified.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not self.__modified:
+			return True
+
+		foundations.io.setDirectory(os.path.dirname(self.__file))
+
+		# Writing to a temporary file first so that concurrent sessions never read a partial manifest.
+		temporaryFile = "{0}.{1}".format(self.__file, os.getpid())
+		try:
+			with open(temporaryFile, "w") as file:
+				json.dump({"version": Constants.manifestVersion, "modules": self.__modules}, file)
+			# Renaming over an existing file is atomic on POSIX, Windows needs the file removed first.
+			if (platform.system() == "Windows" or platform.system() == "Microsoft") and \
+				foundations.common.pathExists(self.__file):
+				os.remove(self.__file)
+			os.rename(temporaryFile, self.__file)
+		except (IOError, OSError) as error:
+			LOGGER.warning("!> {0} | Cannot write '{1}' manifest file: '{2}'!".format(
+			self.__class__.__name__, self.__file, error))
+			return False
+
+		self.__modified = False
+		return True
+
+	def getModule(self, path, statistics):
+		"""
+		Returns the manifest entry of given module file if it is still valid for given file statistics.
+
+		:param path: Module file path.
+		:type path: unicode
+		:param statistics: Module file modification time and size.
+		:type statistics: tuple
+		:return: Manifest entry.
+		:rtype: dict
+		"""
+
+		entry = self.__modules.get(path)
+		if entry is None:
+			return
+
+		if (entry["mtime"], entry["size"]) != tuple(statistics):
+			return
+
+		return entry
+
+	def setModule(self, path, statistics, **kwargs):
+		"""
+		Sets the manifest entry of given module file.
+
+		:param path: Module file path.
+		:type path: unicode
+		:param statistics: Module file modification time and size.
+		:type statistics: tuple
+		:param \*\*kwargs: Module discovered data, name, interfaces, documentation, documentations.
+		:type \*\*kwargs: dict
+		:return: Manifest entry.
+		:rtype: dict
+		"""
+
+		mtime, size = statistics
+		entry = self.__modules[path] = dict(kwargs, mtime=mtime, size=size)
+		self.__modified = True
+		return entry
+
+	def removeModule(self, path):
+		"""
+		Removes the manifest entry of given module file.
+
+		:param path: Module file path.
+		:type path: unicode
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not path in self.__modules:
+			return False
+
+		del(self.__modules[path])
+		self.__modified = True
+		return True
+
+	def prune(self, paths, directories):
+		"""
+		Removes the entries from given directories whose files are not in given paths anymore.
+
+		:param paths: Existing modules files paths.
+		:type paths: set
+		:param directories: Directories the modules files have been gathered from.
+		:type directories: tuple or list
+		:return: Removed entries count.
+		:rtype: int
+		"""
+
+		# The paths are forward slashes paths, the trailing separator prevents sibling directories matching.
+		directories = ["{0}/".format(directory.rstrip("/")) for directory in directories]
+		count = 0
+		for path in self.__modules.keys():
+			if path in paths:
+				continue
+
+			if any(path.startswith(directory) for directory in directories):
+				self.removeModule(path)
+				count += 1
+		return count
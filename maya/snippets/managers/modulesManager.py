@@ -28,10 +28,12 @@ from __future__ import unicode_literals
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
+import ast
 import logging
 import os
 import re
 import sys
+from multiprocessing.pool import ThreadPool
 
 #**********************************************************************************************************************
 #***	Internal imports.
@@ -44,6 +46,11 @@ import foundations.walkers
 from snippets.globals.constants import Constants
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.globals.uiConstants import UiConstants
+from snippets.managers.bundle import Bundle
+from snippets.managers.bundle import isBundle
+from snippets.managers.importer import installImporter
+from snippets.managers.manifest import getFileStatistics
+from snippets.profilers.startup import PROFILER
 
 #**********************************************************************************************************************
 #***	Module attributes.
@@ -55,19 +62,204 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Module", "ModulesManager"]
+__all__ = ["LOGGER",
+			"mapConcurrently",
+			"getNodeNames",
+			"getTokens",
+			"getNodeSource",
+			"getArguments",
+			"parseModule",
+			"parseModuleInterfaces",
+			"isPackageFile",
+			"Module",
+			"ModulesManager"]
 
 LOGGER = foundations.verbose.installLogger()
 
 #**********************************************************************************************************************
 #***	Module classes and definitions.
 #**********************************************************************************************************************
+def mapConcurrently(function, iterable, threads=Constants.scanningThreads):
+	"""
+	Maps given function on given iterable items using a threads pool so that I/O latency overlaps.
+
+	:param function: Function to map.
+	:type function: object
+	:param iterable: Items.
+	:type iterable: iterable
+	:param threads: Maximum threads count.
+	:type threads: int
+	:return: Results in items order.
+	:rtype: list
+	"""
+
+	items = list(iterable)
+	if len(items) < 2 or threads < 2:
+		return map(function, items)
+
+	pool = ThreadPool(min(threads, len(items)))
+	try:
+		return pool.map(function, items)
+	finally:
+		pool.close()
+		pool.join()
+
+def getNodeNames(node):
+	"""
+	Returns the names the given module level ast node binds in the module namespace.
+
+	:param node: Ast node.
+	:type node: Node
+	:return: Names.
+	:rtype: list
+	"""
+
+	if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+		return [node.name]
+	elif isinstance(node, ast.Assign):
+		return [target.id for target in node.targets if isinstance(target, ast.Name)]
+	elif isinstance(node, (ast.Import, ast.ImportFrom)):
+		return [alias.asname or alias.name.split(".")[0] for alias in node.names]
+	return []
+
+def getTokens(text):
+	"""
+	Returns the lowercase search tokens of given text, the words and their camelCase parts are returned.
+
+	:param text: Text.
+	:type text: unicode
+	:return: Tokens.
+	:rtype: list
+	"""
+
+	tokens = set()
+	for word in re.findall(r"[^\W_]+", text or "", re.UNICODE):
+		tokens.add(word.lower())
+		for part in re.findall(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+", word):
+			tokens.add(part.lower())
+	return sorted(token for token in tokens if len(token) >= Constants.minimumTokenLength)
+
+def getNodeSource(node):
+	"""
+	Returns the source representation of given ast expression node, literals are evaluated.
+
+	:param node: Ast node.
+	:type node: Node
+	:return: Source representation.
+	:rtype: unicode
+	"""
+
+	if isinstance(node, ast.Name):
+		return foundations.strings.toString(node.id)
+	elif isinstance(node, ast.Attribute):
+		return "{0}.{1}".format(getNodeSource(node.value), node.attr)
+
+	try:
+		return foundations.strings.toString(repr(ast.literal_eval(node)))
+	except ValueError:
+		return "..."
+
+def getArguments(node):
+	"""
+	Returns the arguments of given function ast node like :func:`inspect.getargspec` definition does.
+
+	:param node: Ast function node.
+	:type node: FunctionDef
+	:return: Arguments names, defaults representations, variable arguments and keywords names.
+	:rtype: dict
+	"""
+
+	return {"args": [foundations.strings.toString(argument.id)
+					for argument in node.args.args if isinstance(argument, ast.Name)],
+			"defaults": [getNodeSource(default) for default in node.args.defaults] or None,
+			"varargs": node.args.vararg and foundations.strings.toString(node.args.vararg),
+			"keywords": node.args.kwarg and foundations.strings.toString(node.args.kwarg)}
+
+def parseModule(path):
+	"""
+	Parses given module file and returns its interfaces and documentation without importing it.
+
+	The interfaces search tokens are gathered from the module name and documentation, the interfaces names,
+	documentations and arguments names.
+
+	:param path: Module file path.
+	:type path: unicode
+	:return: Interfaces, module documentation, interfaces documentations, arguments and tokens.
+	:rtype: dict
+	"""
+
+	data = {"interfaces": [], "documentation": None, "documentations": {}, "arguments": {}, "tokens": {}}
+
+	with open(path, "rb") as file:
+		source = file.read()
+
+	try:
+		tree = ast.parse(source, path)
+	except SyntaxError as error:
+		LOGGER.warning("!> Exception raised while parsing '{0}' Module: '{1}'!".format(path, error))
+		return data
+
+	documentation = ast.get_docstring(tree)
+	data["documentation"] = documentation and foundations.strings.toString(documentation)
+	for node in tree.body:
+		for name in getNodeNames(node):
+			if not re.search(Constants.interfacesPattern, name) or name in data["interfaces"]:
+				continue
+
+			data["interfaces"].append(name)
+			if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+				documentation = ast.get_docstring(node)
+				data["documentations"][name] = documentation and foundations.strings.toString(documentation)
+			if isinstance(node, ast.FunctionDef):
+				data["arguments"][name] = getArguments(node)
+
+	moduleText = " ".join((foundations.strings.getSplitextBasename(path), data["documentation"] or ""))
+	for name in data["interfaces"]:
+		data["tokens"][name] = getTokens(" ".join([moduleText,
+													name,
+													data["documentations"].get(name) or ""] +
+													data["arguments"].get(name, {}).get("args", [])))
+	return data
+
+def parseModuleInterfaces(path):
+	"""
+	Parses given module file and returns its interfaces without importing it.
+
+	:param path: Module file path.
+	:type path: unicode
+	:return: Interfaces.
+	:rtype: list
+	"""
+
+	return parseModule(path)["interfaces"]
+
+def isPackageFile(path, directory):
+	"""
+	Returns if given module file belongs to a package below given libraries directory, e.g. **libraries/core**.
+	The libraries directory itself being a package doesn't matter.
+
+	:param path: Module file path.
+	:type path: unicode
+	:param directory: Libraries directory.
+	:type directory: unicode
+	:return: Is package file.
+	:rtype: bool
+	"""
+
+	directory = foundations.strings.toForwardSlashes(os.path.normpath(directory))
+	path = os.path.dirname(foundations.strings.toForwardSlashes(os.path.normpath(path)))
+	while path.startswith("{0}/".format(directory)):
+		if os.path.exists(os.path.join(path, Constants.libraryPackageFile)):
+			return True
+		path = os.path.dirname(path)
+	return False
+
 class Module(object):
 	"""
 	Defines the **Module** class.
 	"""
 
-	def __init__(self, name=None, path=None):
+	def __init__(self, name=None, path=None, file=None):
 		"""
 		Initializes the class.
 
@@ -75,6 +267,8 @@ class Module(object):
 		:type name: str
 		:param path: Path of the Component.
 		:type path: str
+		:param file: File of the Component.
+		:type file: str
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -84,9 +278,16 @@ class Module(object):
 		self.name = name
 		self.paths = None
 		self.__paths = path
+		self.__file = None
+		self.file = file
 
 		self.__import = None
 		self.__interfaces = None
+		self.__documentation = None
+		self.__documentations = None
+		self.__arguments = None
+		self.__tokens = None
+		self.__statistics = None
 
 	#******************************************************************************************************************
 	#***	Attributes properties.
@@ -162,15 +363,58 @@ class Module(object):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("path"))
 
+	@property
+	def file(self):
+		"""
+		Property for **self.__file** attribute.
+
+		:return: self.__file.
+		:rtype: str
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def file(self, value):
+		"""
+		Setter for **self.__file** attribute.
+
+		:param value: Attribute value.
+		:type value: str
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format("file",
+																												value)
+			# Bundled modules files are inside their bundle and are not stated.
+			assert isBundle(os.path.dirname(value)) or os.path.exists(value), \
+			"'{0}' Attribute: '{1}' file doesn't exists!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		Deleter for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
 	@property
 	def import_(self):
 		"""
 		Property for **self.___import_** attribute.
 
+		The module is imported on first access if it has not been imported yet.
+
 		:return: self.__import.
 		:rtype: ModuleType
 		"""
 
+		if self.__import is None and self.__paths is not None:
+			self.load()
+
 		return self.__import
 
 	@import_.setter
@@ -227,17 +471,211 @@ class Module(object):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("interfaces"))
 
+	@property
+	def documentation(self):
+		"""
+		Property for **self.__documentation** attribute.
+
+		:return: self.__documentation.
+		:rtype: unicode
+		"""
+
+		return self.__documentation
+
+	@documentation.setter
+	def documentation(self, value):
+		"""
+		Setter for **self.__documentation** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		self.__documentation = value
+
+	@documentation.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def documentation(self):
+		"""
+		Deleter for **self.__documentation** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("documentation"))
+
+	@property
+	def documentations(self):
+		"""
+		Property for **self.__documentations** attribute.
+
+		:return: self.__documentations.
+		:rtype: dict
+		"""
+
+		return self.__documentations
+
+	@documentations.setter
+	def documentations(self, value):
+		"""
+		Setter for **self.__documentations** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		self.__documentations = value
+
+	@documentations.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def documentations(self):
+		"""
+		Deleter for **self.__documentations** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("documentations"))
+
+	@property
+	def arguments(self):
+		"""
+		Property for **self.__arguments** attribute.
+
+		:return: self.__arguments.
+		:rtype: dict
+		"""
+
+		return self.__arguments
+
+	@arguments.setter
+	def arguments(self, value):
+		"""
+		Setter for **self.__arguments** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		self.__arguments = value
+
+	@arguments.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def arguments(self):
+		"""
+		Deleter for **self.__arguments** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("arguments"))
+
+	@property
+	def tokens(self):
+		"""
+		Property for **self.__tokens** attribute.
+
+		:return: self.__tokens.
+		:rtype: dict
+		"""
+
+		return self.__tokens
+
+	@tokens.setter
+	def tokens(self, value):
+		"""
+		Setter for **self.__tokens** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		self.__tokens = value
+
+	@tokens.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def tokens(self):
+		"""
+		Deleter for **self.__tokens** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("tokens"))
+
+	@property
+	def statistics(self):
+		"""
+		Property for **self.__statistics** attribute.
+
+		:return: self.__statistics.
+		:rtype: tuple
+		"""
+
+		return self.__statistics
+
+	@statistics.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def statistics(self, value):
+		"""
+		Setter for **self.__statistics** attribute.
+
+		:param value: Attribute value.
+		:type value: tuple
+		"""
+
+		if value is not None:
+			assert type(value) is tuple, "'{0}' Attribute: '{1}' type is not 'tuple'!".format("statistics", value)
+		self.__statistics = value
+
+	@statistics.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def statistics(self):
+		"""
+		Deleter for **self.__statistics** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("statistics"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def load(self):
+		"""
+		Imports the module.
+
+		:return: Module.
+		:rtype: ModuleType
+		"""
+
+		LOGGER.debug("> Importing '{0}' Module.".format(self.__name))
+
+		name = "{0}.{1}".format(Constants.librariesNamespace, self.__name)
+		if name in sys.modules:
+			del(sys.modules[name])
+
+		with PROFILER.phase("modulesManager | Module import"):
+			__import__(name)
+		self.__import = sys.modules[name]
+		return self.__import
+
+	def isLoaded(self):
+		"""
+		Returns if the module has been imported.
+
+		:return: Is module imported.
+		:rtype: bool
+		"""
+
+		return self.__import is not None
+
 class ModulesManager(object):
 	"""
 	Defines the **ModulesManager** class.
 	"""
 
-	def __init__(self, paths=None):
+	def __init__(self, paths=None, lazy=True, manifest=None):
 		"""
 		Initializes the class.
 
 		:param path: Paths of the modules.
 		:type path: tuple or list
+		:param lazy: Modules interfaces are discovered by parsing instead of importing the modules.
+		:type lazy: bool
+		:param manifest: Manifest caching the discovered interfaces across sessions.
+		:type manifest: Manifest
 		"""
 
 		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
@@ -245,9 +683,17 @@ class ModulesManager(object):
 		# --- Setting class attributes. ---
 		self.paths = None
 		self.__paths = paths
+		self.__lazy = None
+		self.lazy = lazy
+		self.__manifest = manifest
 
 		self.__modules = {}
+		self.__interfaces = {}
+		self.__bundles = {}
 		self.__libraryExtension = Constants.libraryExtension
+		self.__version = 0
+
+		self.__importer = installImporter()
 
 	#******************************************************************************************************************
 	#***	Attributes properties.
@@ -288,6 +734,74 @@ class ModulesManager(object):
 
 		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("paths"))
 
+	@property
+	def lazy(self):
+		"""
+		Property for **self.__lazy** attribute.
+
+		:return: self.__lazy.
+		:rtype: bool
+		"""
+
+		return self.__lazy
+
+	@lazy.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def lazy(self, value):
+		"""
+		Setter for **self.__lazy** attribute.
+
+		:param value: Attribute value.
+		:type value: bool
+		"""
+
+		if value is not None:
+			assert type(value) is bool, "'{0}' Attribute: '{1}' type is not 'bool'!".format("lazy", value)
+		self.__lazy = value
+
+	@lazy.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def lazy(self):
+		"""
+		Deleter for **self.__lazy** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("lazy"))
+
+	@property
+	def manifest(self):
+		"""
+		Property for **self.__manifest** attribute.
+
+		:return: self.__manifest.
+		:rtype: Manifest
+		"""
+
+		return self.__manifest
+
+	@manifest.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def manifest(self, value):
+		"""
+		Setter for **self.__manifest** attribute.
+
+		:param value: Attribute value.
+		:type value: Manifest
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "manifest"))
+
+	@manifest.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def manifest(self):
+		"""
+		Deleter for **self.__manifest** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "manifest"))
+
 	@property
 	def modules(self):
 		"""
@@ -312,6 +826,11 @@ class ModulesManager(object):
 		if value is not None:
 			assert type(value) is dict, "'{0}' Attribute: '{1}' type is not 'dict'!".format("modules", value)
 		self.__modules = value
+		self.__interfaces = {}
+		self.__version += 1
+		for module in (value or {}).itervalues():
+			self.__indexInterfaces(module)
+			self.__importer.registerModule(module.name, module.file)
 
 	@modules.deleter
 	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
@@ -356,6 +875,42 @@ class ModulesManager(object):
 		raise foundations.exceptions.ProgrammingError(
 		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "libraryExtension"))
 
+	@property
+	def version(self):
+		"""
+		Property for **self.__version** attribute.
+
+		The version is incremented each time the registered interfaces change.
+
+		:return: self.__version.
+		:rtype: int
+		"""
+
+		return self.__version
+
+	@version.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def version(self, value):
+		"""
+		Setter for **self.__version** attribute.
+
+		:param value: Attribute value.
+		:type value: int
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "version"))
+
+	@version.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def version(self):
+		"""
+		Deleter for **self.__version** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "version"))
+
 	#******************************************************************************************************************
 	#***	Class methods.
 	#******************************************************************************************************************
@@ -369,9 +924,7 @@ class ModulesManager(object):
 		:rtype: ModuleType
 		"""
 
-		for module in self.__modules.itervalues():
-			if module.name == name:
-				return module
+		return self.__modules.get(name)
 
 	def __iter__(self):
 		"""
@@ -393,7 +946,7 @@ class ModulesManager(object):
 		:rtype: bool
 		"""
 
-		return self[name] and True or False
+		return name in self.__modules
 
 	def __len__(self):
 		"""
@@ -413,7 +966,57 @@ class ModulesManager(object):
 		:rtype: list
 		"""
 
-		return [module.name for module in self.iterkeys()]
+		return [module.name for module in self.__modules.itervalues()]
+
+	def listInterfaces(self):
+		"""
+		Lists the registered interfaces.
+
+		:return: Interfaces list.
+		:rtype: list
+		"""
+
+		return self.__interfaces.keys()
+
+	def getInterfaceModule(self, interface):
+		"""
+		Returns the module providing given interface.
+
+		:param interface: Interface name.
+		:type interface: str
+		:return: Module.
+		:rtype: Module
+		"""
+
+		return self.__interfaces.get(interface)
+
+	def __indexInterfaces(self, module):
+		"""
+		Indexes given module interfaces.
+
+		:param module: Module.
+		:type module: Module
+		"""
+
+		self.__version += 1
+		for interface in module.interfaces or ():
+			if interface in self.__interfaces and self.__interfaces[interface] is not module:
+				LOGGER.warning("!> {0} | '{1}' Interface from '{2}' Module overrides the one from '{3}' Module!".format(
+				self.__class__.__name__, interface, module.name, self.__interfaces[interface].name))
+			self.__interfaces[interface] = module
+
+	def __unindexInterfaces(self, module):
+		"""
+		Removes given module interfaces from the index.
+
+		:param module: Module.
+		:type module: Module
+		"""
+
+		self.__version += 1
+		for interface in module.interfaces or ():
+			if self.__interfaces.get(interface) is module:
+				del(self.__interfaces[interface])
 
 	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
 	def registerModule(self, name, path):
@@ -432,7 +1035,8 @@ class ModulesManager(object):
 			raise foundations.exceptions.ProgrammingError("{0} | '{1}' module is already registered!".format(
 			self.__class__.__name__, name))
 
-		self.__modules[name] = Module(name=name, path=os.path.dirname(path))
+		self.__modules[name] = Module(name=name, path=os.path.dirname(path), file=path)
+		self.__importer.registerModule(name, path, self.__getModuleLoader(path))
 		return True
 
 	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
@@ -450,9 +1054,118 @@ class ModulesManager(object):
 			raise foundations.exceptions.ProgrammingError("{0} | '{1}' module is not registered!".format(
 			self.__class__.__name__, name))
 
+		self.__unindexInterfaces(self.__modules[name])
 		del(self.__modules[name])
+		self.__importer.unregisterModule(name)
 		return True
 
+	def getBundle(self, file):
+		"""
+		Returns given bundle, the bundle is read again if its file changed since it was read.
+
+		:param file: Bundle file.
+		:type file: unicode
+		:return: Bundle.
+		:rtype: Bundle
+		"""
+
+		file = foundations.strings.toForwardSlashes(file)
+		bundle = self.__bundles.get(file)
+		try:
+			statistics = getFileStatistics(file)
+		except OSError:
+			statistics = None
+
+		if bundle is None or bundle.statistics != statistics:
+			bundle = Bundle(file)
+			bundle.read()
+			self.__bundles[file] = bundle
+		return bundle
+
+	def getModuleBundle(self, path):
+		"""
+		Returns the bundle providing given module file if any.
+
+		:param path: Module file.
+		:type path: unicode
+		:return: Bundle.
+		:rtype: Bundle
+		"""
+
+		return self.__bundles.get(os.path.dirname(path))
+
+	def __getModuleLoader(self, path):
+		"""
+		Returns the loader of given module file, bundled modules are loaded through their bundle importer.
+
+		:param path: Module file.
+		:type path: unicode
+		:return: Loader.
+		:rtype: zipimporter
+		"""
+
+		bundle = self.getModuleBundle(path)
+		return bundle.importer if bundle is not None else None
+
+	def getModuleStatistics(self, path):
+		"""
+		Returns given module file statistics, bundled modules share their bundle file statistics.
+
+		:param path: Module file.
+		:type path: unicode
+		:return: Modification time, size.
+		:rtype: tuple
+		"""
+
+		bundle = self.getModuleBundle(path)
+		return bundle.statistics if bundle is not None else getFileStatistics(path)
+
+	def listDirectoryFiles(self, directory):
+		"""
+		Lists the modules files available in given directory or bundle sorted by path, the packages files below
+		the directory are skipped.
+
+		:param directory: Directory or bundle file.
+		:type directory: unicode
+		:return: Modules files.
+		:rtype: list
+		"""
+
+		if isBundle(directory):
+			return self.getBundle(directory).listModulesFiles()
+
+		# Packages, e.g. **libraries/core**, hold the libraries support code and are imported, not registered.
+		return sorted(path for path in foundations.walkers.filesWalker(
+			directory, filtersIn=(r"\.{0}$".format(self.__libraryExtension),))
+			if not isPackageFile(path, directory))
+
+	def listModulesFiles(self):
+		"""
+		Lists the modules files available in the paths, the paths are walked concurrently.
+
+		The paths are given by decreasing priority: when several files define a module with the same name,
+		the file from the first path wins, within a path the first file by sorted path wins.
+
+		:return: Modules names, modules files.
+		:rtype: list
+		"""
+
+		with PROFILER.phase("modulesManager | Directories walk"):
+			directoriesFiles = mapConcurrently(self.listDirectoryFiles, self.__paths)
+
+		files, names = [], {}
+		for directory, paths in zip(self.__paths, directoriesFiles):
+			for path in paths:
+				name = foundations.strings.getSplitextBasename(path)
+				if name in names:
+					LOGGER.info("{0} | '{1}' Module from '{2}' is overridden by '{3}'!".format(
+					self.__class__.__name__, name, path, names[name]))
+					continue
+
+				names[name] = path
+				files.append((name, path))
+		return files
+
 	def registerModules(self):
 		"""
 		Gathers the modules.
@@ -460,46 +1173,89 @@ class ModulesManager(object):
 		:rtype: bool
 		"""
 
-		for directory in self.__paths:
-			for path in foundations.walkers.filesWalker(directory, filtersIn=(r"\.{0}$".format(self.__libraryExtension),)):
-				self.registerModule(foundations.strings.getSplitextBasename(path), path)
+		for name, path in self.listModulesFiles():
+			self.registerModule(name, path)
 		return True
 
-	def registerModuleInterfaces(self, module):
+	def scanModule(self, module):
+		"""
+		Stats and in lazy mode parses given module file, the manifest entry is used if the file is unchanged.
+		Bundled modules use their bundle embedded manifest entry.
+
+		The method doesn't modify any state and can be called concurrently.
+
+		:param module: Module.
+		:type module: Module
+		:return: Module file statistics, discovered data, data comes from the manifest.
+		:rtype: tuple
+		"""
+
+		bundle = self.getModuleBundle(module.file)
+		if bundle is not None:
+			return bundle.statistics, bundle.getModule(module.name), True
+
+		statistics = getFileStatistics(module.file)
+		if not self.__lazy:
+			return statistics, None, False
+
+		data = self.__manifest.getModule(module.file, statistics) if self.__manifest is not None else None
+		if data is not None:
+			return statistics, data, True
+
+		LOGGER.debug("> Parsing changed '{0}' Module.".format(module.name))
+		return statistics, parseModule(module.file), False
+
+	def registerModuleInterfaces(self, module, scan=None):
 		"""
 		Instantiates given module interfaces.
 
+		In lazy mode the module file is parsed and the module is only imported
+		the first time one of its interfaces is accessed.
+
 		:param module: Module.
 		:type module: ModuleType
+		:param scan: Module scan as returned by :meth:`ModulesManager.scanModule` method.
+		:type scan: tuple
 		:return: Method success.
 		:rtype: bool
 		"""
 
-		if module.path not in sys.path:
-			sys.path.append(module.path)
-
-		if module.name in sys.modules:
-			del(sys.modules[module.name])
-
-		module.import_ = __import__(module.name)
-
-		interfaces = [attribute for attribute in module.import_.__dict__ if re.search(r"^I[A-Z]\w+", attribute)]
+		statistics, data, cached = scan or self.scanModule(module)
+		module.statistics = statistics
+		if self.__lazy:
+			if not cached and self.__manifest is not None:
+				data = self.__manifest.setModule(module.file, statistics, name=module.name, **data)
+			interfaces = data["interfaces"]
+			module.documentation = data["documentation"]
+			module.documentations = data["documentations"]
+			module.arguments = data.get("arguments")
+			module.tokens = data.get("tokens")
+		else:
+			interfaces = [attribute for attribute in module.load().__dict__
+						if re.search(Constants.interfacesPattern, attribute)]
+
+		self.__unindexInterfaces(module)
+		module.interfaces = interfaces or None
+		self.__indexInterfaces(module)
 		if interfaces:
 			LOGGER.info("{0} | Registering '{1}' Interfaces from '{2}' Module!".format(self.__class__.__name__,
 																						interfaces, module.name))
-			module.interfaces = interfaces
 			return True
 
 	def registerInterfaces(self):
 		"""
-		Registers modules interfaces.
+		Registers modules interfaces, in lazy mode the modules files are scanned concurrently.
 
 		:return: Method success.
 		:rtype: bool
 		"""
 
-		for name, module in self:
-			self.registerModuleInterfaces(module)
+		modules = [module for name, module in sorted(self.__modules.iteritems())]
+		with PROFILER.phase("modulesManager | Modules scan"):
+			scans = mapConcurrently(self.scanModule, modules) if self.__lazy else [None] * len(modules)
+		with PROFILER.phase("modulesManager | Interfaces registration"):
+			for module, scan in zip(modules, scans):
+				self.registerModuleInterfaces(module, scan)
 		return True
 
 	def unregisterAll(self):
@@ -510,7 +1266,11 @@ class ModulesManager(object):
 		:rtype: bool
 		"""
 
+		for name in self.__modules:
+			self.__importer.unregisterModule(name)
 		self.__modules = {}
+		self.__interfaces = {}
+		self.__version += 1
 		return True
 
 	def registerAll(self):
@@ -521,18 +1281,112 @@ class ModulesManager(object):
 		:rtype: bool
 		"""
 
+		if self.__manifest is not None:
+			self.__manifest.read()
+
 		self.registerModules()
 		self.registerInterfaces()
+		self.__writeManifest()
 		return True
 
+	def __writeManifest(self):
+		"""
+		Prunes the manifest from the unregistered modules and writes it.
+		"""
+
+		if self.__manifest is None:
+			return
+
+		self.__manifest.prune(set(module.file for module in self.__modules.itervalues()),
+							[foundations.strings.toForwardSlashes(path) for path in self.__paths])
+		self.__manifest.write()
+
+	def reloadModule(self, name, path=None, scan=None):
+		"""
+		Reloads given module from given file, registers the module if it is not registered
+		and unregisters it if no file is given.
+
+		Modified modules are re-imported, on first access in lazy mode, and all their interfaces are reported
+		as unregistered then registered again.
+
+		:param name: Module name.
+		:type name: unicode
+		:param path: Module file.
+		:type path: unicode
+		:param scan: Module scan as returned by :meth:`ModulesManager.scanModule` method.
+		:type scan: tuple
+		:return: Registered interfaces, unregistered interfaces as ( Module, Interface name ) tuples.
+		:rtype: tuple
+		"""
+
+		module = self[name]
+		if path is None:
+			if module is None:
+				return [], []
+
+			LOGGER.info("{0} | Unregistering deleted '{1}' Module!".format(self.__class__.__name__, name))
+			unregistered = [(module, interface) for interface in module.interfaces or ()]
+			self.unregisterModule(name)
+			return [], unregistered
+
+		if module is None:
+			self.registerModule(name, path)
+			module = self[name]
+			self.registerModuleInterfaces(module, scan)
+			return [(module, interface) for interface in module.interfaces or ()], []
+
+		LOGGER.info("{0} | Reloading modified '{1}' Module!".format(self.__class__.__name__, name))
+		interfaces = module.interfaces or ()
+		module.file = path
+		module.path = os.path.dirname(path)
+		module.import_ = None
+		self.__importer.registerModule(name, path, self.__getModuleLoader(path))
+		self.registerModuleInterfaces(module, scan)
+		# The kept interfaces are reported too, their documentation and tokens may have changed.
+		return ([(module, interface) for interface in module.interfaces or ()],
+				[(module, interface) for interface in interfaces])
+
+	def reloadModules(self, changes):
+		"""
+		Reloads given modules changes.
+
+		:param changes: Changes as ( Module name, Module file, Module scan ) tuples, see
+			:meth:`ModulesManager.reloadModule` method.
+		:type changes: list
+		:return: Registered interfaces, unregistered interfaces as ( Module, Interface name ) tuples.
+		:rtype: tuple
+		"""
+
+		registered, unregistered = [], []
+		for change in changes:
+			moduleRegistered, moduleUnregistered = self.reloadModule(*change)
+			registered.extend(moduleRegistered)
+			unregistered.extend(moduleUnregistered)
+
+		self.__writeManifest()
+		return registered, unregistered
+
 	def reloadAll(self):
 		"""
-		Reloads all modules and their interfaces.
+		Reloads the modules whose files changed since their registration, registers the new modules
+		and unregisters the modules whose files were deleted.
 
-		:return: Method success.
-		:rtype: bool
+		:return: Registered interfaces, unregistered interfaces as ( Module, Interface name ) tuples.
+		:rtype: tuple
 		"""
 
-		self.unregisterAll()
-		self.registerAll()
-		return True
+		files = dict(self.listModulesFiles())
+
+		modules = [module for name, module in sorted(self.__modules.iteritems())]
+		statistics = mapConcurrently(lambda module: module.name in files and self.getModuleStatistics(files[module.name]),
+									modules)
+
+		changes = []
+		for module, moduleStatistics in zip(modules, statistics):
+			path = files.get(module.name)
+			if path == module.file and moduleStatistics == module.statistics:
+				continue
+
+			changes.append((module.name, path, None))
+		changes.extend((name, path, None) for name, path in sorted(files.iteritems()) if not name in self)
+		return self.reloadModules(changes)
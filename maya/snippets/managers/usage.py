@@ -0,0 +1,428 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**usage.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`UsageStore` class persisting the interfaces executions across sessions.
+
+**Others:**
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import atexit
+import json
+import logging
+import os
+import platform
+import threading
+import time
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.common
+import foundations.exceptions
+import foundations.io
+import foundations.verbose
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "UsageStore"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class UsageStore(object):
+	"""
+	Defines the **UsageStore** class recording the interfaces executions counts and times.
+
+	The frecency of an interface is its executions count decayed with
+	:attr:`snippets.globals.constants.Constants.usageHalfLife` attribute half life, the store is written
+	by a background thread so that recording an execution never waits on the disk.
+	"""
+
+	def __init__(self, file=None, halfLife=Constants.usageHalfLife):
+		"""
+		Initializes the class.
+
+		:param file: Usage file.
+		:type file: unicode
+		:param halfLife: Frecency half life in seconds.
+		:type halfLife: float
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__file = None
+		self.file = file
+		self.__halfLife = halfLife
+
+		self.__usages = {}
+		self.__records = {}
+
+		self.__lock = threading.Lock()
+		self.__writeLock = threading.Lock()
+		self.__writeEvent = threading.Event()
+		self.__writer = None
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def file(self):
+		"""
+		Property for **self.__file** attribute.
+
+		:return: self.__file.
+		:rtype: unicode
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def file(self, value):
+		"""
+		Setter for **self.__file** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		Deleter for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
+	@property
+	def halfLife(self):
+		"""
+		Property for **self.__halfLife** attribute.
+
+		:return: self.__halfLife.
+		:rtype: float
+		"""
+
+		return self.__halfLife
+
+	@halfLife.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def halfLife(self, value):
+		"""
+		Setter for **self.__halfLife** attribute.
+
+		:param value: Attribute value.
+		:type value: float
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "halfLife"))
+
+	@halfLife.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def halfLife(self):
+		"""
+		Deleter for **self.__halfLife** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "halfLife"))
+
+	@property
+	def usages(self):
+		"""
+		Property for **self.__usages** attribute.
+
+		:return: self.__usages.
+		:rtype: dict
+		"""
+
+		return self.__usages
+
+	@usages.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def usages(self, value):
+		"""
+		Setter for **self.__usages** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "usages"))
+
+	@usages.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def usages(self):
+		"""
+		Deleter for **self.__usages** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "usages"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	@staticmethod
+	def getKey(module, attribute):
+		"""
+		Returns the usage key of given module interface.
+
+		:param module: Module name.
+		:type module: unicode
+		:param attribute: Interface attribute.
+		:type attribute: unicode
+		:return: Usage key.
+		:rtype: unicode
+		"""
+
+		return "{0}.{1}".format(module, attribute)
+
+	def __readUsages(self):
+		"""
+		Reads the usage file usages.
+
+		:return: Usages, None if the file cannot be read.
+		:rtype: dict
+		"""
+
+		if not foundations.common.pathExists(self.__file):
+			return
+
+		try:
+			with open(self.__file, "r") as file:
+				content = json.load(file)
+		except (IOError, ValueError) as error:
+			LOGGER.warning("!> {0} | Cannot read '{1}' usage file: '{2}'!".format(
+			self.__class__.__name__, self.__file, error))
+			return
+
+		return content.get("usages", {})
+
+	def read(self):
+		"""
+		Reads the usage file, the executions recorded since the last write are kept.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		usages = self.__readUsages()
+		if usages is None:
+			return False
+
+		with self.__lock:
+			self.__usages = self.__merge(usages, self.__records)
+		return True
+
+	def write(self):
+		"""
+		Writes the usage file.
+
+		The executions recorded since the last write are merged into the file usages read again,
+		so that concurrent sessions don't override each other executions.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		with self.__writeLock:
+			usages = self.__readUsages()
+			with self.__lock:
+				if usages is not None:
+					self.__usages = self.__merge(usages, self.__records)
+				records, self.__records = self.__records, {}
+				content = json.dumps({"usages": self.__usages})
+
+			# Writing to a temporary file first so that concurrent sessions never read a partial file.
+			temporaryFile = "{0}.{1}".format(self.__file, os.getpid())
+			try:
+				foundations.io.setDirectory(os.path.dirname(self.__file))
+				with open(temporaryFile, "w") as file:
+					file.write(content)
+				# Renaming over an existing file is atomic on POSIX, Windows needs the file removed first.
+				if (platform.system() == "Windows" or platform.system() == "Microsoft") and \
+					foundations.common.pathExists(self.__file):
+					os.remove(self.__file)
+				os.rename(temporaryFile, self.__file)
+			except (IOError, OSError) as error:
+				LOGGER.warning("!> {0} | Cannot write '{1}' usage file: '{2}'!".format(
+				self.__class__.__name__, self.__file, error))
+				with self.__lock:
+					self.__records = self.__merge(self.__records, records)
+				return False
+			return True
+
+	def __decay(self, usage, now):
+		"""
+		Returns given usage score decayed to given time.
+
+		:param usage: Usage.
+		:type usage: dict
+		:param now: Time.
+		:type now: float
+		:return: Decayed score.
+		:rtype: float
+		"""
+
+		return usage["score"] * 0.5 ** (max(now - usage["time"], 0) / self.__halfLife)
+
+	def __combine(self, usage, other):
+		"""
+		Returns given usages combined, the counts are summed and the scores are decayed to the latest time and summed.
+
+		:param usage: Usage.
+		:type usage: dict
+		:param other: Other usage.
+		:type other: dict
+		:return: Combined usage.
+		:rtype: dict
+		"""
+
+		if other is None:
+			return dict(usage)
+
+		now = max(usage["time"], other["time"])
+		return {"count": usage["count"] + other["count"],
+				"score": self.__decay(usage, now) + self.__decay(other, now),
+				"time": now}
+
+	def __merge(self, usages, records):
+		"""
+		Returns given usages with given executions records merged.
+
+		:param usages: Usages.
+		:type usages: dict
+		:param records: Executions records.
+		:type records: dict
+		:return: Merged usages.
+		:rtype: dict
+		"""
+
+		usages = dict(usages)
+		for key, record in records.iteritems():
+			usages[key] = self.__combine(record, usages.get(key))
+		return usages
+
+	def record(self, key):
+		"""
+		Records an execution of given key and schedules the usage file writing.
+
+		:param key: Usage key.
+		:type key: unicode
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		now = time.time()
+		with self.__lock:
+			usage = self.__usages.get(key)
+			if usage is None:
+				usage = self.__usages[key] = {"count": 0, "score": 0., "time": now}
+			usage["score"] = self.__decay(usage, now) + 1
+			usage["count"] += 1
+			usage["time"] = now
+
+			record = self.__records.get(key) or {"count": 0, "score": 0., "time": now}
+			self.__records[key] = {"count": record["count"] + 1, "score": self.__decay(record, now) + 1, "time": now}
+
+		self.__scheduleWrite()
+		return True
+
+	def getFrecency(self, key, now=None):
+		"""
+		Returns the frecency of given key.
+
+		:param key: Usage key.
+		:type key: unicode
+		:param now: Time.
+		:type now: float
+		:return: Frecency.
+		:rtype: float
+		"""
+
+		usage = self.__usages.get(key)
+		if usage is None:
+			return 0.
+
+		return self.__decay(usage, now or time.time())
+
+	def __scheduleWrite(self):
+		"""
+		Wakes up the writer thread, starting it on first call.
+		"""
+
+		if self.__file is None:
+			return
+
+		if self.__writer is None:
+			self.__writer = threading.Thread(target=self.__write, name="{0}Writer".format(self.__class__.__name__))
+			self.__writer.daemon = True
+			self.__writer.start()
+			atexit.register(self.flush)
+		self.__writeEvent.set()
+
+	def __write(self):
+		"""
+		Runs the writer thread loop, executions recorded while writing are coalesced into the next write.
+		"""
+
+		while True:
+			self.__writeEvent.wait()
+			self.__writeEvent.clear()
+			self.write()
+
+	def flush(self):
+		"""
+		Writes the usage file if executions were recorded since the last write.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not self.__writeEvent.is_set():
+			return True
+
+		self.__writeEvent.clear()
+		return self.write()
@@ -0,0 +1,500 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**watcher.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`LibrariesWatcher` class hot reloading the modified libraries modules.
+
+**Others:**
+	The watcher polls the libraries files statistics unless `pyinotify <https://github.com/seb-m/pyinotify>`_
+	is available, in which case inotify events are used on Linux.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import functools
+import logging
+import os
+import threading
+import maya.utils
+
+try:
+	import pyinotify
+except ImportError:
+	pyinotify = None
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.exceptions
+import foundations.strings
+import foundations.verbose
+from snippets.globals.constants import Constants
+from snippets.managers.manifest import getFileStatistics
+from snippets.managers.modulesManager import Module
+from snippets.managers.modulesManager import isPackageFile
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "LibrariesWatcher"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class LibrariesWatcher(object):
+	"""
+	Defines the **LibrariesWatcher** class watching the libraries files from a background thread.
+
+	Modified files are parsed on the background thread and a single update of the affected modules is then
+	deferred to the main thread, the registered listeners are finally called with the registered and
+	unregistered interfaces.
+	"""
+
+	def __init__(self, modulesManager, interval=Constants.watcherInterval, deferrer=maya.utils.executeDeferred):
+		"""
+		Initializes the class.
+
+		:param modulesManager: Modules Manager.
+		:type modulesManager: ModulesManager
+		:param interval: Polling interval in seconds.
+		:type interval: float
+		:param deferrer: Callable executing given callable on the main thread.
+		:type deferrer: object
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__modulesManager = modulesManager
+		self.__interval = interval
+		self.__deferrer = deferrer
+
+		self.__listeners = []
+
+		self.__statistics = {}
+		self.__directories = {}
+		self.__events = set()
+
+		self.__thread = None
+		self.__stopEvent = threading.Event()
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def modulesManager(self):
+		"""
+		Property for **self.__modulesManager** attribute.
+
+		:return: self.__modulesManager.
+		:rtype: ModulesManager
+		"""
+
+		return self.__modulesManager
+
+	@modulesManager.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modulesManager(self, value):
+		"""
+		Setter for **self.__modulesManager** attribute.
+
+		:param value: Attribute value.
+		:type value: ModulesManager
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "modulesManager"))
+
+	@modulesManager.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modulesManager(self):
+		"""
+		Deleter for **self.__modulesManager** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "modulesManager"))
+
+	@property
+	def interval(self):
+		"""
+		Property for **self.__interval** attribute.
+
+		:return: self.__interval.
+		:rtype: float
+		"""
+
+		return self.__interval
+
+	@interval.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def interval(self, value):
+		"""
+		Setter for **self.__interval** attribute.
+
+		:param value: Attribute value.
+		:type value: float
+		"""
+
+		if value is not None:
+			assert type(value) in (int, float), "'{0}' Attribute: '{1}' type is not 'int' or 'float'!".format(
+			"interval", value)
+			assert value > 0, "'{0}' Attribute: '{1}' need to be exactly positive!".format("interval", value)
+		self.__interval = value
+
+	@interval.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def interval(self):
+		"""
+		Deleter for **self.__interval** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "interval"))
+
+	@property
+	def listeners(self):
+		"""
+		Property for **self.__listeners** attribute.
+
+		:return: self.__listeners.
+		:rtype: list
+		"""
+
+		return self.__listeners
+
+	@listeners.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def listeners(self, value):
+		"""
+		Setter for **self.__listeners** attribute.
+
+		:param value: Attribute value.
+		:type value: list
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "listeners"))
+
+	@listeners.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def listeners(self):
+		"""
+		Deleter for **self.__listeners** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "listeners"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def registerListener(self, listener):
+		"""
+		Registers given listener called on the main thread with the registered and unregistered interfaces.
+
+		:param listener: Listener.
+		:type listener: object
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not listener in self.__listeners:
+			self.__listeners.append(listener)
+		return True
+
+	def unregisterListener(self, listener):
+		"""
+		Unregisters given listener.
+
+		:param listener: Listener.
+		:type listener: object
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if listener in self.__listeners:
+			self.__listeners.remove(listener)
+		return True
+
+	def isRunning(self):
+		"""
+		Returns if the watcher is running.
+
+		:return: Is watcher running.
+		:rtype: bool
+		"""
+
+		return self.__thread is not None and self.__thread.is_alive()
+
+	def start(self):
+		"""
+		Starts the watcher thread.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if self.isRunning():
+			return False
+
+		self.__stopEvent.clear()
+		self.__thread = threading.Thread(target=self.__run, name=self.__class__.__name__)
+		self.__thread.daemon = True
+		self.__thread.start()
+		LOGGER.debug("> '{0}' watcher started.".format(self.__class__.__name__))
+		return True
+
+	def stop(self):
+		"""
+		Stops the watcher thread.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not self.isRunning():
+			return False
+
+		self.__stopEvent.set()
+		self.__thread.join()
+		self.__thread = None
+		LOGGER.debug("> '{0}' watcher stopped.".format(self.__class__.__name__))
+		return True
+
+	def __run(self):
+		"""
+		Runs the watcher loop.
+		"""
+
+		notifier = pyinotify is not None and self.__getNotifier()
+		if not notifier:
+			self.__initializeDirectories()
+
+		while not self.__stopEvent.is_set():
+			if notifier:
+				if notifier.check_events(int(self.__interval * 1000)):
+					notifier.read_events()
+					notifier.process_events()
+				paths = set(self.__events)
+				self.__events.clear()
+			else:
+				self.__stopEvent.wait(self.__interval)
+				paths = self.__getChangedPaths()
+
+			if self.__stopEvent.is_set():
+				break
+
+			changes = paths and self.__getChanges(paths)
+			if changes:
+				self.__deferrer(functools.partial(self.__applyChanges, changes))
+
+		if notifier:
+			notifier.stop()
+
+	def __getNotifier(self):
+		"""
+		Returns an inotify notifier watching the libraries directories.
+
+		:return: Notifier.
+		:rtype: Notifier
+		"""
+
+		events = self.__events
+		isPackageFile = self.__isPackageFile
+
+		class EventsHandler(pyinotify.ProcessEvent):
+			"""
+			Defines the inotify events handler.
+			"""
+
+			def process_default(self, event):
+				"""
+				Collects the modules files events.
+
+				:param event: Event.
+				:type event: Event
+				"""
+
+				if not event.pathname.endswith(".{0}".format(Constants.libraryExtension)):
+					return
+
+				path = foundations.strings.toForwardSlashes(foundations.strings.toString(event.pathname))
+				if not isPackageFile(path):
+					events.add(path)
+
+		try:
+			manager = pyinotify.WatchManager()
+			notifier = pyinotify.Notifier(manager, EventsHandler(), timeout=0)
+			mask = pyinotify.IN_CLOSE_WRITE | pyinotify.IN_MOVED_TO | pyinotify.IN_MOVED_FROM | pyinotify.IN_DELETE
+			for path in self.__modulesManager.paths:
+				manager.add_watch(path, mask, rec=True, auto_add=True)
+		except Exception as error:
+			LOGGER.warning("!> {0} | Cannot use inotify, falling back to polling: '{1}'!".format(
+			self.__class__.__name__, error))
+			return
+
+		LOGGER.debug("> '{0}' watcher uses inotify.".format(self.__class__.__name__))
+		return notifier
+
+	def __initializeDirectories(self):
+		"""
+		Initializes the watched directories modification times.
+		"""
+
+		for path in self.__modulesManager.paths:
+			for directory, directories, files in os.walk(path):
+				self.__directories[foundations.strings.toForwardSlashes(directory)] = os.stat(directory).st_mtime
+
+	def __getChangedPaths(self):
+		"""
+		Returns the modules files changed since the previous call, the registered modules files are stated
+		and only the directories whose modification time changed are listed.
+
+		:return: Changed paths.
+		:rtype: set
+		"""
+
+		paths = set()
+		for module in self.__modulesManager.modules.values():
+			# Bundles are read-only deployments, they are only read again by the modules manager reload.
+			if self.__modulesManager.getModuleBundle(module.file) is not None:
+				continue
+
+			statistics = self.__statistics.setdefault(module.file, module.statistics)
+			try:
+				currentStatistics = getFileStatistics(module.file)
+			except OSError:
+				currentStatistics = None
+
+			if currentStatistics != statistics:
+				self.__statistics[module.file] = currentStatistics
+				paths.add(module.file)
+
+		for directory, mtime in self.__directories.items():
+			try:
+				currentMtime = os.stat(directory).st_mtime
+			except OSError:
+				del(self.__directories[directory])
+				continue
+
+			if currentMtime == mtime:
+				continue
+
+			self.__directories[directory] = currentMtime
+			for item in os.listdir(directory):
+				path = foundations.strings.toForwardSlashes(os.path.join(directory, item))
+				if os.path.isdir(path):
+					self.__directories.setdefault(path, None)
+				elif path.endswith(".{0}".format(Constants.libraryExtension)) and self.__statistics.get(path) is None \
+					and not self.__isPackageFile(path):
+					self.__statistics[path] = getFileStatistics(path)
+					paths.add(path)
+		return paths
+
+	def __isPackageFile(self, path):
+		"""
+		Returns if given path belongs to a package below the libraries directory containing it.
+
+		:param path: Path.
+		:type path: unicode
+		:return: Is package file.
+		:rtype: bool
+		"""
+
+		for directory in self.__modulesManager.paths:
+			if path.startswith(foundations.strings.toForwardSlashes(directory)):
+				return isPackageFile(path, directory)
+		return False
+
+	def __getPriority(self, path):
+		"""
+		Returns the priority of given path, lower values have higher priority.
+
+		:param path: Path.
+		:type path: unicode
+		:return: Priority.
+		:rtype: int
+		"""
+
+		for i, directory in enumerate(self.__modulesManager.paths):
+			if path.startswith(foundations.strings.toForwardSlashes(directory)):
+				return i
+		return len(self.__modulesManager.paths)
+
+	def __getChanges(self, paths):
+		"""
+		Returns the modules changes for given changed paths, the modified files are parsed.
+
+		:param paths: Changed paths.
+		:type paths: set
+		:return: Changes as ( Module name, Module file, Module scan ) tuples.
+		:rtype: list
+		"""
+
+		modules = dict(self.__modulesManager.modules)
+
+		changes = []
+		for path in sorted(paths):
+			name = foundations.strings.getSplitextBasename(path)
+			module = modules.get(name)
+			exists = os.path.exists(path)
+			if module is not None and module.file != path:
+				if not exists or self.__getPriority(path) >= self.__getPriority(module.file):
+					continue
+
+			if not exists:
+				module is not None and changes.append((name, None, None))
+				continue
+
+			changes.append((name, path, self.__modulesManager.scanModule(
+			Module(name=name, path=os.path.dirname(path), file=path))))
+		return changes
+
+	def __applyChanges(self, changes):
+		"""
+		Applies given changes to the modules manager and notifies the listeners, this is called on the main thread.
+
+		:param changes: Changes as ( Module name, Module file, Module scan ) tuples.
+		:type changes: list
+		"""
+
+		registered, unregistered = self.__modulesManager.reloadModules(changes)
+		if not registered and not unregistered:
+			return
+
+		for listener in self.__listeners[:]:
+			try:
+				listener(registered, unregistered)
+			except Exception as error:
+				LOGGER.warning("!> {0} | Exception raised by '{1}' listener, unregistering it: '{2}'!".format(
+				self.__class__.__name__, listener, error))
+				self.unregisterListener(listener)
@@ -32,7 +32,6 @@ import logging
 import maya.cmds as cmds
 import maya.mel as mel
 import re
-from PyQt4 import uic
 from PyQt4.QtCore import QString
 from PyQt4.QtCore import Qt
 from PyQt4.QtGui import QStringListModel
@@ -49,8 +48,10 @@ import snippets.ui.common
 from snippets.globals.constants import Constants
 from snippets.globals.runtimeGlobals import RuntimeGlobals
 from snippets.globals.uiConstants import UiConstants
-from snippets.ui.models import Interface
+from snippets.managers.usage import UsageStore
+from snippets.profilers.startup import PROFILER
 from snippets.ui.models import InterfacesModel
+from snippets.ui.search import InterfacesIndex
 from snippets.ui.widgets.search_QLineEdit import Search_QLineEdit
 
 #**********************************************************************************************************************
@@ -63,13 +64,14 @@ __maintainer__ = "Thomas Mansencal"
 __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
-__all__ = ["LOGGER", "Ui_Popup_Type", "Ui_Popup_Setup", "Popup"]
+__all__ = ["LOGGER", "Ui_Popup_Type", "Ui_Popup_Setup", "Popup", "getPopup", "showPopup"]
 
 LOGGER = foundations.verbose.installLogger()
 
 RuntimeGlobals.popupUiFile = snippets.ui.common.getResourcePath(UiConstants.popupUiFile)
 if foundations.common.pathExists(RuntimeGlobals.popupUiFile):
-	Ui_Popup_Setup, Ui_Popup_Type = uic.loadUiType(RuntimeGlobals.popupUiFile)
+	with PROFILER.phase("popup | Ui file loading"):
+		Ui_Popup_Setup, Ui_Popup_Type = snippets.ui.common.loadUiType(RuntimeGlobals.popupUiFile)
 else:
 	error = "'{0}' Ui file is not available!".format(RuntimeGlobals.popupUiFile)
 	snippets.ui.common.messageBox("Error", "Error", error)
@@ -98,7 +100,8 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		Ui_Popup_Type.__init__(self, parent)
 		Ui_Popup_Setup.__init__(self)
 
-		self.setupUi(self)
+		with PROFILER.phase("popup | Ui setup"):
+			self.setupUi(self)
 
 		# --- Setting class attributes. ---
 		self.__container = parent
@@ -106,9 +109,13 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 
 		self.__model = None
 		self.__view = None
+		self.__index = None
+		self.__version = None
 
 		# --- Initialize Ui. ---
-		self.__initializeUI()
+		with PROFILER.phase("popup | Ui initialization"):
+			self.__initializeUI()
+		PROFILER.report()
 
 	#******************************************************************************************************************
 	#***	Attributes properties.
@@ -219,6 +226,8 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		Reimplements the :meth:`QWidget.show` method.
 		"""
 
+		self.refresh()
+
 		self.move(QCursor.pos().x() - self.width() / 2, QCursor.pos().y() - self.height() / 2)
 		self.Interfaces_lineEdit.setText(RuntimeGlobals.popupPattern or QString())
 		self.Interfaces_lineEdit.setFocus()
@@ -232,6 +241,8 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		self.setWindowFlags(Qt.Popup)
 
 		self.__model = InterfacesModel(self)
+		self.__index = InterfacesIndex(
+		lambda attribute: foundations.strings.getNiceName(self.getMethodName(attribute)), self.getFrecency)
 
 		self.Interfaces_lineEdit.setParent(None)
 		self.Interfaces_lineEdit = Search_QLineEdit(self)
@@ -239,10 +250,11 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		# self.Interfaces_lineEdit.setPlaceholderText("Enter Interface Name...")
 		self.Popup_Form_gridLayout.addWidget(self.Interfaces_lineEdit)
 
-		self.setInterfaces()
+		self.refresh()
 
 		# Signals / Slots.
 		self.Interfaces_lineEdit.returnPressed.connect(self.__Interfaces_lineEdit__returnPressed)
+		self.Interfaces_lineEdit.textEdited.connect(self.__Interfaces_lineEdit__textEdited)
 
 	def __Interfaces_lineEdit__returnPressed(self):
 		"""
@@ -251,6 +263,16 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 
 		self.__triggerInterface(self.Interfaces_lineEdit.text())
 
+	def __Interfaces_lineEdit__textEdited(self, text):
+		"""
+		Defines the slot triggered by **Interfaces_lineEdit** Widget when text edited.
+
+		:param text: Current text value.
+		:type text: QString
+		"""
+
+		self.searchInterfaces(foundations.strings.toString(text))
+
 	def __triggerInterface(self, name):
 		"""
 		Triggers the Interface with given name execution.
@@ -259,14 +281,31 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		:type name: str
 		"""
 
-		pattern = RuntimeGlobals.popupPattern = name
-		interface = self.getInterface(foundations.strings.toString("^{0}$".format(pattern)))
+		RuntimeGlobals.popupPattern = name
+		interface = self.getInterface(foundations.strings.toString(name))
 		if not interface:
 			return
 
 		self.executeInterface(interface)
 		self.close()
 
+	def refresh(self):
+		"""
+		Rebuilds the index and sets the Model interfaces if the Modules Manager interfaces changed since last refresh.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if self.__version == self.__modulesManager.version:
+			return False
+
+		LOGGER.debug("> Refreshing '{0}' interfaces to version '{1}'.".format(self.__class__.__name__,
+																			self.__modulesManager.version))
+		self.__index.build(self.__modulesManager)
+		self.__version = self.__modulesManager.version
+		return self.setInterfaces()
+
 	def setInterfaces(self, pattern=".*", flags=re.IGNORECASE):
 		"""
 		Sets the Model interfaces.
@@ -279,24 +318,30 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		:rtype: bool
 		"""
 
-		try:
-			pattern = re.compile(pattern, flags)
-		except Exception:
-			return
+		with PROFILER.phase("popup | Model population"):
+			interfaces = self.__index.filter(pattern, flags)
+			if interfaces is None:
+				return
 
-		self.__model.clear()
+			self.__model.clear()
+			self.__model.registerInterfaces(interfaces)
+			self.Interfaces_lineEdit.completer.setModel(QStringListModel([interface.name for interface in interfaces]))
+		return True
+
+	def searchInterfaces(self, query):
+		"""
+		Feeds the completer with the interfaces fuzzy matching given query ranked by relevance,
+		see :class:`snippets.ui.search.FuzzyMatcher` class.
 
-		interfaces = []
-		for name, module in self.__modulesManager:
-			if not module.interfaces:
-				continue
+		:param query: Query.
+		:type query: unicode
+		:return: Method success.
+		:rtype: bool
+		"""
 
-			for interface in module.interfaces:
-				name = foundations.strings.getNiceName(self.getMethodName(interface))
-				if re.search(pattern, name):
-					interfaces.append(name)
-					self.__model.registerInterface(Interface(name=name, attribute=interface, module=module))
-		self.Interfaces_lineEdit.completer.setModel(QStringListModel(sorted(interfaces)))
+		completer = self.Interfaces_lineEdit.completer
+		completer.setModel(QStringListModel([interface.name for interface in self.__index.search(query)]))
+		completer.complete()
 		return True
 
 	def getMethodName(self, name):
@@ -311,24 +356,24 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 
 		return "{0}{1}".format(name[1].lower(), name[2:])
 
-	def getInterface(self, pattern):
+	def getInterface(self, name):
 		"""
-		Returns the Interface with given name.
+		Returns the Interface with given name, the best fuzzy match is returned if no interface has that name.
 
-		:param pattern: Interface name.
-		:type pattern: str
-		:param flags: Regex filtering flags.
-		:type flags: int
-		:return: Method success.
-		:rtype: bool
+		:param name: Interface name.
+		:type name: unicode
+		:return: Interface.
+		:rtype: Interface
 		"""
 
-		for interface in self.__model:
-			if not hasattr(interface, "attribute"):
-				continue
+		interface = self.__model.getInterfaceByName(name)
+		if interface is not None:
+			return interface
 
-			if re.search(pattern, interface.name):
-				return interface
+		interfaces = self.__index.search(name)
+		if interfaces:
+			LOGGER.debug("> No '{0}' Interface, using '{1}' best match.".format(name, interfaces[0].name))
+			return interfaces[0]
 
 	def executeInterface(self, interface):
 		"""
@@ -349,5 +394,58 @@ class Popup(Ui_Popup_Type, Ui_Popup_Setup):
 		LOGGER.info("{0} | Executing '{1}' Interface from '{2}' Module!".format(self.__class__.__name__,
 																			method,
 																			module.name))
-		module.import_.__dict__[method]()
+		key = UsageStore.getKey(module.name, method)
+		if RuntimeGlobals.usageStore is not None:
+			RuntimeGlobals.usageStore.record(key)
+		if RuntimeGlobals.executionProfiler is not None:
+			RuntimeGlobals.executionProfiler.execute(key, module.import_.__dict__[method])
+		else:
+			module.import_.__dict__[method]()
 		return True
+
+	def getFrecency(self, interface):
+		"""
+		Returns the frecency of given interface.
+
+		:param interface: Interface.
+		:type interface: Interface
+		:return: Frecency.
+		:rtype: float
+		"""
+
+		if RuntimeGlobals.usageStore is None:
+			return 0.
+
+		return RuntimeGlobals.usageStore.getFrecency(UsageStore.getKey(interface.module.name, interface.attribute))
+
+def getPopup(parent=None, modulesManager=None):
+	"""
+	Returns the session :class:`Popup` class instance, building it on first call.
+
+	The instance is kept hidden between invocations, calling this definition
+	after :func:`snippets.engine.run` definition builds it ahead of the first invocation.
+
+	:param parent: Parent object.
+	:type parent: QObject
+	:param modulesManager: Modules Manager.
+	:type modulesManager: ModulesManager
+	:return: Popup.
+	:rtype: Popup
+	"""
+
+	if RuntimeGlobals.popup is None:
+		with PROFILER.phase("popup | Instantiation"):
+			RuntimeGlobals.popup = Popup(parent, modulesManager or RuntimeGlobals.modulesManager)
+	return RuntimeGlobals.popup
+
+def showPopup():
+	"""
+	Shows the session :class:`Popup` class instance, its interfaces are refreshed
+	only if the Modules Manager interfaces changed since it was last shown.
+
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	getPopup().show()
+	return True
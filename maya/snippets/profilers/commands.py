@@ -0,0 +1,263 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**commands.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`CommandsProfiler` class counting the Maya commands calls issued by the interfaces.
+
+**Others:**
+	The commands are instrumented by replacing the instrumented modules functions for the duration of a call,
+	the libraries resolve them on the module on each call, e.g. **cmds.xform(...)**, and are thus counted.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import contextlib
+import logging
+import maya.cmds
+import maya.mel
+import sys
+import timeit
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.exceptions
+import foundations.verbose
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "CommandsProfiler"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class CommandsProfiler(object):
+	"""
+	Defines the **CommandsProfiler** class counting the calls and the time spent per command and per calling function.
+	"""
+
+	def __init__(self, modules=None):
+		"""
+		Initializes the class.
+
+		:param modules: Instrumented modules, :mod:`maya.cmds` and :mod:`maya.mel` modules by default.
+		:type modules: tuple or list
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__modules = None
+		self.modules = modules or (maya.cmds, maya.mel)
+
+		self.__calls = {}
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def modules(self):
+		"""
+		Property for **self.__modules** attribute.
+
+		:return: self.__modules.
+		:rtype: tuple or list
+		"""
+
+		return self.__modules
+
+	@modules.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def modules(self, value):
+		"""
+		Setter for **self.__modules** attribute.
+
+		:param value: Attribute value.
+		:type value: tuple or list
+		"""
+
+		if value is not None:
+			assert type(value) in (tuple, list), "'{0}' Attribute: '{1}' type is not 'tuple' or 'list'!".format(
+			"modules", value)
+		self.__modules = value
+
+	@modules.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def modules(self):
+		"""
+		Deleter for **self.__modules** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("modules"))
+
+	@property
+	def calls(self):
+		"""
+		Property for **self.__calls** attribute.
+
+		:return: self.__calls.
+		:rtype: dict
+		"""
+
+		return self.__calls
+
+	@calls.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def calls(self, value):
+		"""
+		Setter for **self.__calls** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "calls"))
+
+	@calls.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def calls(self):
+		"""
+		Deleter for **self.__calls** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "calls"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def __getWrapper(self, command, function):
+		"""
+		Returns a wrapper of given command function recording its calls.
+
+		:param command: Command name.
+		:type command: unicode
+		:param function: Command function.
+		:type function: object
+		:return: Wrapper.
+		:rtype: object
+		"""
+
+		def wrapper(*args, **kwargs):
+			frame = sys._getframe(1)
+			key = (command, "{0}.{1}".format(frame.f_globals.get("__name__"), frame.f_code.co_name))
+			start = timeit.default_timer()
+			try:
+				return function(*args, **kwargs)
+			finally:
+				call = self.__calls.get(key)
+				if call is None:
+					call = self.__calls[key] = [0, 0.]
+				call[0] += 1
+				call[1] += timeit.default_timer() - start
+
+		wrapper.__name__ = function.__name__
+		wrapper.__doc__ = function.__doc__
+		return wrapper
+
+	@contextlib.contextmanager
+	def instrument(self):
+		"""
+		Records the instrumented modules functions calls issued in the managed context.
+		"""
+
+		originals = []
+		for module in self.__modules:
+			for name, value in module.__dict__.items():
+				if name.startswith("_") or not callable(value):
+					continue
+
+				originals.append((module, name, value))
+				setattr(module, name, self.__getWrapper("{0}.{1}".format(module.__name__, name), value))
+		try:
+			yield
+		finally:
+			for module, name, value in originals:
+				setattr(module, name, value)
+
+	def runcall(self, callable, *args, **kwargs):
+		"""
+		Executes given callable recording the instrumented modules functions calls it issues.
+
+		:param callable: Callable.
+		:type callable: object
+		:param \*args: Arguments.
+		:type \*args: \*
+		:param \*\*kwargs: Keywords arguments.
+		:type \*\*kwargs: \*\*
+		:return: Callable return value.
+		:rtype: object
+		"""
+
+		with self.instrument():
+			return callable(*args, **kwargs)
+
+	def getStatistics(self, index=0):
+		"""
+		Returns the calls count and cumulative time aggregated by command or by calling function.
+
+		:param index: Aggregation key index, 0 for commands, 1 for calling functions.
+		:type index: int
+		:return: Calls count and time per key sorted by decreasing time.
+		:rtype: list
+		"""
+
+		statistics = {}
+		for key, (count, time) in self.__calls.iteritems():
+			statistic = statistics.setdefault(key[index], [0, 0.])
+			statistic[0] += count
+			statistic[1] += time
+		return sorted(statistics.iteritems(), key=lambda x: x[1][1], reverse=True)
+
+	def getReport(self, count=Constants.commandsReportCount):
+		"""
+		Returns the report of given count of most expensive commands, calling functions and their pairs.
+
+		:param count: Report lines count per section.
+		:type count: int
+		:return: Report.
+		:rtype: unicode
+		"""
+
+		lines = []
+		for title, statistics in (("Command", self.getStatistics(0)),
+								("Caller", self.getStatistics(1)),
+								("Caller | Command", sorted(((" | ".join(reversed(key)), call)
+															for key, call in self.__calls.iteritems()),
+															key=lambda x: x[1][1], reverse=True))):
+			lines.append("{0:<80} {1:>10} {2:>12}".format(title, "Calls", "Time (ms)"))
+			for name, (calls, time) in statistics[:count]:
+				lines.append("{0:<80} {1:>10} {2:>12.3f}".format(name, calls, time * 1000))
+			lines.append("")
+		return "\n".join(lines)
@@ -0,0 +1,548 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**execution.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`ExecutionProfiler` class recording the interfaces executions wall and cpu times.
+
+**Others:**
+	The executions are always timed, setting the **SNIPPETS_PROFILE_EXECUTIONS** environment variable
+	additionally captures a :mod:`cProfile` profile of each execution and setting the **SNIPPETS_PROFILE_COMMANDS**
+	environment variable logs the Maya commands calls issued by each execution.
+	The instrumented executions times are logged but not recorded in the executions statistics.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import atexit
+import cProfile
+import json
+import logging
+import math
+import os
+import platform
+import re
+import threading
+import time
+import timeit
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.common
+import foundations.exceptions
+import foundations.io
+import foundations.verbose
+from foundations.environment import Environment
+from snippets.globals.constants import Constants
+from snippets.profilers.commands import CommandsProfiler
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "getCpuTime", "getPercentile", "ExecutionProfiler"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def getCpuTime():
+	"""
+	Returns the process user and system cpu time.
+
+	:return: Cpu time in seconds.
+	:rtype: float
+	"""
+
+	times = os.times()
+	return times[0] + times[1]
+
+def getPercentile(samples, percentile):
+	"""
+	Returns given percentile of given sorted samples using the nearest rank method.
+
+	:param samples: Sorted samples.
+	:type samples: list
+	:param percentile: Percentile in [0, 100] range.
+	:type percentile: float
+	:return: Percentile value.
+	:rtype: float
+	"""
+
+	if not samples:
+		return
+
+	return samples[min(max(int(math.ceil(percentile / 100. * len(samples))) - 1, 0), len(samples) - 1)]
+
+class ExecutionProfiler(object):
+	"""
+	Defines the **ExecutionProfiler** class timing the interfaces executions.
+
+	The last :attr:`snippets.globals.constants.Constants.executionsSamples` attribute executions
+	of each interface are persisted so that their latency statistics span sessions, the executions file is written
+	by a background thread at most every :attr:`snippets.globals.constants.Constants.executionsWriteInterval`
+	attribute seconds so that the timed executions never wait on the disk.
+	"""
+
+	def __init__(self, file=None, profilesDirectory=None, profiling=False, commandsProfiling=False):
+		"""
+		Initializes the class.
+
+		:param file: Executions file.
+		:type file: unicode
+		:param profilesDirectory: Directory the :mod:`cProfile` profiles are written to.
+		:type profilesDirectory: unicode
+		:param profiling: Executions are profiled with :mod:`cProfile`.
+		:type profiling: bool
+		:param commandsProfiling: Executions Maya commands calls are profiled,
+			see :class:`snippets.profilers.commands.CommandsProfiler` class.
+		:type commandsProfiling: bool
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__file = None
+		self.file = file
+		self.__profilesDirectory = None
+		self.profilesDirectory = profilesDirectory
+		self.__profiling = None
+		self.profiling = profiling
+		self.__commandsProfiling = None
+		self.commandsProfiling = commandsProfiling
+
+		self.__executions = {}
+		self.__profiles = {}
+
+		self.__lock = threading.Lock()
+		self.__writeLock = threading.Lock()
+		self.__writeEvent = threading.Event()
+		self.__writer = None
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def file(self):
+		"""
+		Property for **self.__file** attribute.
+
+		:return: self.__file.
+		:rtype: unicode
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def file(self, value):
+		"""
+		Setter for **self.__file** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		Deleter for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
+	@property
+	def profilesDirectory(self):
+		"""
+		Property for **self.__profilesDirectory** attribute.
+
+		:return: self.__profilesDirectory.
+		:rtype: unicode
+		"""
+
+		return self.__profilesDirectory
+
+	@profilesDirectory.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def profilesDirectory(self, value):
+		"""
+		Setter for **self.__profilesDirectory** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format(
+			"profilesDirectory", value)
+		self.__profilesDirectory = value
+
+	@profilesDirectory.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def profilesDirectory(self):
+		"""
+		Deleter for **self.__profilesDirectory** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("profilesDirectory"))
+
+	@property
+	def profiling(self):
+		"""
+		Property for **self.__profiling** attribute.
+
+		:return: self.__profiling.
+		:rtype: bool
+		"""
+
+		return self.__profiling
+
+	@profiling.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def profiling(self, value):
+		"""
+		Setter for **self.__profiling** attribute.
+
+		:param value: Attribute value.
+		:type value: bool
+		"""
+
+		if value is not None:
+			assert type(value) is bool, "'{0}' Attribute: '{1}' type is not 'bool'!".format("profiling", value)
+		self.__profiling = value
+
+	@profiling.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def profiling(self):
+		"""
+		Deleter for **self.__profiling** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("profiling"))
+
+	@property
+	def commandsProfiling(self):
+		"""
+		Property for **self.__commandsProfiling** attribute.
+
+		:return: self.__commandsProfiling.
+		:rtype: bool
+		"""
+
+		return self.__commandsProfiling
+
+	@commandsProfiling.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def commandsProfiling(self, value):
+		"""
+		Setter for **self.__commandsProfiling** attribute.
+
+		:param value: Attribute value.
+		:type value: bool
+		"""
+
+		if value is not None:
+			assert type(value) is bool, "'{0}' Attribute: '{1}' type is not 'bool'!".format("commandsProfiling", value)
+		self.__commandsProfiling = value
+
+	@commandsProfiling.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def commandsProfiling(self):
+		"""
+		Deleter for **self.__commandsProfiling** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("commandsProfiling"))
+
+	@property
+	def executions(self):
+		"""
+		Property for **self.__executions** attribute.
+
+		:return: self.__executions.
+		:rtype: dict
+		"""
+
+		return self.__executions
+
+	@executions.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def executions(self, value):
+		"""
+		Setter for **self.__executions** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "executions"))
+
+	@executions.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def executions(self):
+		"""
+		Deleter for **self.__executions** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "executions"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def read(self):
+		"""
+		Reads the executions file.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not foundations.common.pathExists(self.__file):
+			return False
+
+		try:
+			with open(self.__file, "r") as file:
+				content = json.load(file)
+		except (IOError, ValueError) as error:
+			LOGGER.warning("!> {0} | Cannot read '{1}' executions file: '{2}'!".format(
+			self.__class__.__name__, self.__file, error))
+			return False
+
+		self.__executions = content.get("executions", {})
+		return True
+
+	def write(self):
+		"""
+		Writes the executions file.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if self.__file is None:
+			return False
+
+		with self.__writeLock:
+			with self.__lock:
+				content = json.dumps({"executions": self.__executions})
+
+			# Writing to a temporary file first so that concurrent sessions never read a partial file.
+			temporaryFile = "{0}.{1}".format(self.__file, os.getpid())
+			try:
+				foundations.io.setDirectory(os.path.dirname(self.__file))
+				with open(temporaryFile, "w") as file:
+					file.write(content)
+				# Renaming over an existing file is atomic on POSIX, Windows needs the file removed first.
+				if (platform.system() == "Windows" or platform.system() == "Microsoft") and \
+					foundations.common.pathExists(self.__file):
+					os.remove(self.__file)
+				os.rename(temporaryFile, self.__file)
+			except (IOError, OSError) as error:
+				LOGGER.warning("!> {0} | Cannot write '{1}' executions file: '{2}'!".format(
+				self.__class__.__name__, self.__file, error))
+				return False
+			return True
+
+	def record(self, key, wallTime, cpuTime):
+		"""
+		Records an execution of given key, the oldest samples beyond
+		:attr:`snippets.globals.constants.Constants.executionsSamples` attribute are discarded.
+
+		:param key: Execution key.
+		:type key: unicode
+		:param wallTime: Wall time in seconds.
+		:type wallTime: float
+		:param cpuTime: Cpu time in seconds.
+		:type cpuTime: float
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		with self.__lock:
+			execution = self.__executions.setdefault(key, {"count": 0, "wall": [], "cpu": []})
+			execution["count"] += 1
+			execution["time"] = time.time()
+			for samples, value in ((execution["wall"], wallTime), (execution["cpu"], cpuTime)):
+				samples.append(value)
+				del(samples[:-Constants.executionsSamples])
+		return True
+
+	def __scheduleWrite(self):
+		"""
+		Wakes up the writer thread, starting it on first call.
+		"""
+
+		if self.__file is None:
+			return
+
+		if self.__writer is None:
+			self.__writer = threading.Thread(target=self.__write, name="{0}Writer".format(self.__class__.__name__))
+			self.__writer.daemon = True
+			self.__writer.start()
+			atexit.register(self.flush)
+		self.__writeEvent.set()
+
+	def __write(self):
+		"""
+		Runs the writer thread loop, executions recorded while waiting or writing are coalesced into the next write.
+		"""
+
+		while True:
+			self.__writeEvent.wait()
+			time.sleep(Constants.executionsWriteInterval)
+			self.__writeEvent.clear()
+			self.write()
+
+	def flush(self):
+		"""
+		Writes the executions file if executions were recorded since the last write.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not self.__writeEvent.is_set():
+			return True
+
+		self.__writeEvent.clear()
+		return self.write()
+
+	def getProfileFile(self, key):
+		"""
+		Returns a new :mod:`cProfile` profile file for given key, named after the key profiles count.
+
+		:param key: Execution key.
+		:type key: unicode
+		:return: Profile file.
+		:rtype: unicode
+		"""
+
+		self.__profiles[key] = self.__profiles.get(key, 0) + 1
+		return os.path.join(self.__profilesDirectory, "{0}_{1}_{2}.prof".format(
+		re.sub(r"[^\w.-]", "_", key), time.strftime("%Y%m%d_%H%M%S"), self.__profiles[key]))
+
+	def execute(self, key, callable, *args, **kwargs):
+		"""
+		Executes given callable, records its wall and cpu times for given key and schedules the executions file writing.
+
+		The execution is profiled with :mod:`cProfile` if profiling is enabled and its Maya commands calls
+		are reported if commands profiling is enabled, the times are recorded even if the callable raises an exception
+		but only for the executions that are not instrumented.
+
+		:param key: Execution key.
+		:type key: unicode
+		:param callable: Callable.
+		:type callable: object
+		:param \*args: Arguments.
+		:type \*args: \*
+		:param \*\*kwargs: Keywords arguments.
+		:type \*\*kwargs: \*\*
+		:return: Callable return value.
+		:rtype: object
+		"""
+
+		profile = cProfile.Profile() if self.__profiling and self.__profilesDirectory else None
+		commandsProfiler = CommandsProfiler() if self.__commandsProfiling else None
+
+		execute = callable
+		if commandsProfiler is not None:
+			execute = lambda *args, **kwargs: commandsProfiler.runcall(callable, *args, **kwargs)
+
+		cpuStart = getCpuTime()
+		wallStart = timeit.default_timer()
+		try:
+			if profile is not None:
+				return profile.runcall(execute, *args, **kwargs)
+			else:
+				return execute(*args, **kwargs)
+		finally:
+			wallTime = timeit.default_timer() - wallStart
+			cpuTime = getCpuTime() - cpuStart
+
+			LOGGER.info("{0} | '{1}' executed in {2:.3f} ms wall time, {3:.3f} ms cpu time.".format(
+			self.__class__.__name__, key, wallTime * 1000, cpuTime * 1000))
+			# The instrumentation overhead would skew the statistics.
+			if profile is None and commandsProfiler is None:
+				self.record(key, wallTime, cpuTime)
+				self.__scheduleWrite()
+
+			if profile is not None:
+				file = self.getProfileFile(key)
+				foundations.io.setDirectory(self.__profilesDirectory)
+				profile.dump_stats(file)
+				LOGGER.info("{0} | '{1}' profile written to '{2}'.".format(self.__class__.__name__, key, file))
+
+			if commandsProfiler is not None:
+				LOGGER.info("{0} | '{1}' Maya commands calls:\n{2}".format(
+				self.__class__.__name__, key, commandsProfiler.getReport()))
+
+	def getStatistics(self, key):
+		"""
+		Returns the executions statistics of given key: count, p50, p95 and max wall and cpu times.
+
+		:param key: Execution key.
+		:type key: unicode
+		:return: Statistics.
+		:rtype: dict
+		"""
+
+		with self.__lock:
+			execution = self.__executions.get(key)
+			if not execution:
+				return
+
+			statistics = {"count": execution["count"]}
+			executionSamples = dict((name, sorted(execution[name])) for name in ("wall", "cpu"))
+
+		for name, samples in executionSamples.iteritems():
+			statistics[name] = {"p50": getPercentile(samples, 50),
+								"p95": getPercentile(samples, 95),
+								"max": getPercentile(samples, 100)}
+		return statistics
+
+	@staticmethod
+	def isProfilingRequested(variable=Constants.executionProfilerVariable):
+		"""
+		Returns if a profiling is requested by given environment variable.
+
+		:param variable: Environment variable.
+		:type variable: unicode
+		:return: Profiling requested.
+		:rtype: bool
+		"""
+
+		value = Environment(variable).getValue()
+		return bool(value) and value.lower() not in ("0", "false", "no", "off")
@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**startup.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`StartupProfiler` class recording the wall time spent in the startup phases.
+
+**Others:**
+	The profiler is enabled by setting the **SNIPPETS_PROFILE_STARTUP** environment variable to a true value,
+	e.g. **1**, or to a path the json report is written to, **0**, **false**, **no** and **off** disable it.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import contextlib
+import datetime
+import json
+import logging
+import os
+import platform
+import sys
+import timeit
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.exceptions
+import foundations.io
+import foundations.strings
+import foundations.verbose
+from foundations.environment import Environment
+from snippets.globals.constants import Constants
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "StartupProfiler", "PROFILER"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+class StartupProfiler(object):
+	"""
+	Defines the **StartupProfiler** class accumulating the wall time spent per named phase.
+	"""
+
+	def __init__(self, enabled=False, file=None):
+		"""
+		Initializes the class.
+
+		:param enabled: Profiler is enabled.
+		:type enabled: bool
+		:param file: Json report file.
+		:type file: unicode
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__enabled = enabled
+		self.__file = file
+
+		self.__phases = {}
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def enabled(self):
+		"""
+		Property for **self.__enabled** attribute.
+
+		:return: self.__enabled.
+		:rtype: bool
+		"""
+
+		return self.__enabled
+
+	@enabled.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def enabled(self, value):
+		"""
+		Setter for **self.__enabled** attribute.
+
+		:param value: Attribute value.
+		:type value: bool
+		"""
+
+		if value is not None:
+			assert type(value) is bool, "'{0}' Attribute: '{1}' type is not 'bool'!".format("enabled", value)
+		self.__enabled = value
+
+	@enabled.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def enabled(self):
+		"""
+		Deleter for **self.__enabled** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("enabled"))
+
+	@property
+	def file(self):
+		"""
+		Property for **self.__file** attribute.
+
+		:return: self.__file.
+		:rtype: unicode
+		"""
+
+		return self.__file
+
+	@file.setter
+	@foundations.exceptions.handleExceptions(AssertionError)
+	def file(self, value):
+		"""
+		Setter for **self.__file** attribute.
+
+		:param value: Attribute value.
+		:type value: unicode
+		"""
+
+		if value is not None:
+			assert type(value) is unicode, "'{0}' Attribute: '{1}' type is not 'unicode'!".format("file", value)
+		self.__file = value
+
+	@file.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def file(self):
+		"""
+		Deleter for **self.__file** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError("'{0}' Attribute is not deletable!".format("file"))
+
+	@property
+	def phases(self):
+		"""
+		Property for **self.__phases** attribute.
+
+		:return: self.__phases.
+		:rtype: dict
+		"""
+
+		return self.__phases
+
+	@phases.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def phases(self, value):
+		"""
+		Setter for **self.__phases** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "phases"))
+
+	@phases.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def phases(self):
+		"""
+		Deleter for **self.__phases** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "phases"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def record(self, name, duration):
+		"""
+		Records given duration for given phase.
+
+		:param name: Phase name.
+		:type name: unicode
+		:param duration: Duration in seconds.
+		:type duration: float
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not self.__enabled:
+			return False
+
+		phase = self.__phases.setdefault(name, {"time": 0., "count": 0})
+		phase["time"] += duration
+		phase["count"] += 1
+		return True
+
+	@contextlib.contextmanager
+	def phase(self, name):
+		"""
+		Records the wall time spent in the managed context for given phase.
+
+		:param name: Phase name.
+		:type name: unicode
+		"""
+
+		if not self.__enabled:
+			yield
+			return
+
+		start = timeit.default_timer()
+		try:
+			yield
+		finally:
+			self.record(name, timeit.default_timer() - start)
+
+	def getReport(self):
+		"""
+		Returns the phases report sorted by decreasing time.
+
+		:return: Report.
+		:rtype: unicode
+		"""
+
+		lines = ["{0:<64} {1:>12} {2:>8}".format("Phase", "Time (ms)", "Count")]
+		for name, phase in sorted(self.__phases.iteritems(), key=lambda x: x[1]["time"], reverse=True):
+			lines.append("{0:<64} {1:>12.3f} {2:>8}".format(name, phase["time"] * 1000, phase["count"]))
+		return "\n".join(lines)
+
+	def write(self, file=None):
+		"""
+		Writes the phases json report.
+
+		:param file: Json report file.
+		:type file: unicode
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		file = file or self.__file
+		if not file:
+			return False
+
+		try:
+			foundations.io.setDirectory(os.path.dirname(file))
+			with open(file, "w") as output:
+				json.dump({"date": datetime.datetime.now().isoformat(),
+							"platform": platform.platform(),
+							"python": sys.version,
+							"phases": self.__phases}, output, indent=4, sort_keys=True)
+		except (IOError, OSError) as error:
+			LOGGER.warning("!> {0} | Cannot write '{1}' startup report file: '{2}'!".format(
+			self.__class__.__name__, file, error))
+			return False
+		return True
+
+	def report(self):
+		"""
+		Logs the phases report and writes the json report.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if not self.__enabled:
+			return False
+
+		LOGGER.info("{0} | Startup phases:\n{1}".format(self.__class__.__name__, self.getReport()))
+		return self.write()
+
+def _getStartupProfiler():
+	"""
+	Returns the startup profiler configured from the environment.
+
+	:return: Startup profiler.
+	:rtype: StartupProfiler
+	"""
+
+	value = Environment(Constants.startupProfilerVariable).getValue()
+	if not value or value.lower() in ("0", "false", "no", "off"):
+		return StartupProfiler()
+
+	file = None
+	if value.lower() not in ("1", "true", "yes", "on"):
+		file = os.path.abspath(value)
+	return StartupProfiler(True, file and foundations.strings.toString(file))
+
+PROFILER = _getStartupProfiler()
@@ -28,10 +28,16 @@ from __future__ import unicode_literals
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
+import hashlib
 import logging
 import os
 import platform
+import re
+import sys
 import maya.OpenMayaUI as OpenMayaUI
+import PyQt4.QtGui
+from PyQt4 import uic
+from PyQt4.uic.Compiler import compiler
 from PyQt4.QtCore import *
 from PyQt4.QtGui import *
 import sip
@@ -40,6 +46,8 @@ import sip
 #***	Internal imports.
 #**********************************************************************************************************************
 import foundations.common
+import foundations.io
+import foundations.strings
 import foundations.verbose
 from snippets.globals.constants import Constants
 from snippets.globals.runtimeGlobals import RuntimeGlobals
@@ -166,3 +174,98 @@ def resizeWidget(widget, sizeX, sizeY):
 	"""
 
 	widget.resize(int(sizeX), int(sizeY))
+
+def getUiCacheFile(uiFile):
+	"""
+	Returns the compiled Python module cache file of given Ui file.
+
+	The cache file is keyed by the Ui file content and the PyQt version hash.
+
+	:param uiFile: Ui file.
+	:type uiFile: unicode
+	:return: Cache file.
+	:rtype: unicode
+	"""
+
+	with open(uiFile, "rb") as file:
+		digest = hashlib.sha1(file.read())
+	digest.update(PYQT_VERSION_STR)
+
+	return os.path.join(RuntimeGlobals.cacheDirectory,
+						Constants.uiCacheDirectory,
+						"{0}_{1}.py".format(foundations.strings.getSplitextBasename(uiFile), digest.hexdigest()))
+
+def compileUiFile(uiFile, cacheFile):
+	"""
+	Compiles given Ui file into given cache file, the stale cache files of the Ui file are removed.
+
+	:param uiFile: Ui file.
+	:type uiFile: unicode
+	:param cacheFile: Cache file.
+	:type cacheFile: unicode
+	:return: Method success.
+	:rtype: bool
+	"""
+
+	LOGGER.debug("> Compiling '{0}' Ui file to '{1}'.".format(uiFile, cacheFile))
+
+	directory = os.path.dirname(cacheFile)
+	foundations.io.setDirectory(directory)
+
+	# Writing to a temporary file first so that concurrent sessions never import a partial module.
+	temporaryFile = "{0}.{1}".format(cacheFile, os.getpid())
+	try:
+		with open(uiFile, "r") as input:
+			with open(temporaryFile, "w") as output:
+				# :func:`PyQt4.uic.compileUi` definition doesn't return the compiled widget information.
+				output.write("# -*- coding: utf-8 -*-\n")
+				information = compiler.UICompiler().compileUi(input, output, False, "_rc")
+				output.write("\n__uiClass__ = \"{0}\"\n__baseClass__ = \"{1}\"\n".format(information["uiclass"],
+																					information["baseclass"]))
+		# Renaming over an existing file is atomic on POSIX, Windows needs the file removed first.
+		if (platform.system() == "Windows" or platform.system() == "Microsoft") and \
+			foundations.common.pathExists(cacheFile):
+			os.remove(cacheFile)
+		os.rename(temporaryFile, cacheFile)
+	except:
+		if foundations.common.pathExists(temporaryFile):
+			os.remove(temporaryFile)
+		raise
+
+	pattern = r"^{0}_[0-9a-f]{{40}}\.py$".format(re.escape(foundations.strings.getSplitextBasename(uiFile)))
+	for file in os.listdir(directory):
+		path = os.path.join(directory, file)
+		if re.search(pattern, file) and path != cacheFile:
+			LOGGER.debug("> Removing stale '{0}' Ui cache file.".format(path))
+			os.remove(path)
+	return True
+
+def loadUiType(uiFile):
+	"""
+	Returns the form and base classes of given Ui file like :func:`PyQt4.uic.loadUiType` definition does,
+	the Ui file is compiled once into the user cache directory so that its xml is not parsed on each session.
+
+	:param uiFile: Ui file.
+	:type uiFile: unicode
+	:return: Form class, base class.
+	:rtype: tuple
+	"""
+
+	if not RuntimeGlobals.cacheDirectory:
+		return uic.loadUiType(uiFile)
+
+	try:
+		cacheFile = getUiCacheFile(uiFile)
+		if not foundations.common.pathExists(cacheFile):
+			compileUiFile(uiFile, cacheFile)
+
+		with open(cacheFile, "rU") as file:
+			code = compile(file.read(), cacheFile, "exec", 0, True)
+
+		namespace = {"__name__": foundations.strings.getSplitextBasename(uiFile),
+					 "__file__": cacheFile.encode(sys.getfilesystemencoding()) if type(cacheFile) is unicode else cacheFile}
+		exec code in namespace
+		return namespace[namespace["__uiClass__"]], getattr(PyQt4.QtGui, namespace["__baseClass__"])
+	except Exception as error:
+		LOGGER.warning("!> Cannot use '{0}' Ui file cache: '{1}'!".format(uiFile, error))
+		return uic.loadUiType(uiFile)
@@ -22,6 +22,7 @@ from __future__ import unicode_literals
 #**********************************************************************************************************************
 #***	External imports.
 #**********************************************************************************************************************
+import bisect
 import logging
 from PyQt4.QtCore import QAbstractListModel
 from PyQt4.QtCore import QModelIndex
@@ -47,6 +48,8 @@ __email__ = "thomas.mansencal@gmail.com"
 __status__ = "Production"
 
 __all__ = ["LOGGER",
+			"getNormalizedName",
+			"getIncreasingSubsequence",
 			"Categorie",
 			"Interface",
 			"InterfacesModel"]
@@ -56,6 +59,46 @@ LOGGER = foundations.verbose.installLogger()
 #**********************************************************************************************************************
 #***	Module classes and definitions.
 #**********************************************************************************************************************
+def getNormalizedName(name):
+	"""
+	Returns given interface name normalized for exact lookups, the case and the whitespaces are ignored.
+
+	:param name: Interface name.
+	:type name: unicode
+	:return: Normalized name.
+	:rtype: unicode
+	"""
+
+	return " ".join(name.lower().split())
+
+def getIncreasingSubsequence(values):
+	"""
+	Returns the indexes of a longest strictly increasing subsequence of given values.
+
+	:param values: Values.
+	:type values: list
+	:return: Subsequence values indexes.
+	:rtype: list
+	"""
+
+	tails, tailsIndexes, previous = [], [], [None] * len(values)
+	for i, value in enumerate(values):
+		position = bisect.bisect_left(tails, value)
+		if position == len(tails):
+			tails.append(value)
+			tailsIndexes.append(i)
+		else:
+			tails[position] = value
+			tailsIndexes[position] = i
+		previous[i] = tailsIndexes[position - 1] if position else None
+
+	indexes = []
+	i = tailsIndexes[-1] if tailsIndexes else None
+	while i is not None:
+		indexes.append(i)
+		i = previous[i]
+	return indexes[::-1]
+
 class Categorie(foundations.dataStructures.Structure):
 	"""
 	This is the **Interface** class.
@@ -106,9 +149,15 @@ class InterfacesModel(QAbstractListModel):
 		QAbstractListModel.__init__(self, parent)
 
 		# --- Setting class attributes. ---
+		self.__items = {}
+		self.__names = {}
+		self.__displays = []
+		self.__flags = []
 		self.__interfaces = []
 		self.interfaces = interfaces or self.__interfaces
 
+		self.__categories = {}
+
 	#******************************************************************************************************************
 	#***	Attributes properties.
 	#******************************************************************************************************************
@@ -140,6 +189,7 @@ class InterfacesModel(QAbstractListModel):
 		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.	
 		self.modelAboutToBeReset.emit()
 		self.__interfaces = value
+		self.__indexItems()
 		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
 		self.modelReset.emit()
 
@@ -166,9 +216,7 @@ class InterfacesModel(QAbstractListModel):
 		:rtype: Interface
 		"""
 
-		for item in self.__interfaces:
-			if item.name == name:
-				return item
+		return self.__items.get(name)
 
 	def __iter__(self):
 		"""
@@ -240,9 +288,23 @@ class InterfacesModel(QAbstractListModel):
 			return QVariant()
 
 		if role == Qt.DisplayRole:
-			return QVariant(self.__interfaces[index.row()].name)
+			return self.__displays[index.row()]
 		return QVariant()
 
+	def flags(self, index):
+		"""
+		Reimplements the :meth:`QAbstractListModel.flags` method, categories are not selectable.
+
+		:param index: Index.
+		:type index: QModelIndex
+		:return: Flags. ( Qt.ItemFlags )
+		"""
+
+		if not index.isValid():
+			return Qt.NoItemFlags
+
+		return self.__flags[index.row()]
+
 	def clear(self):
 		"""
 		Clears the Model.
@@ -254,6 +316,7 @@ class InterfacesModel(QAbstractListModel):
 		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.
 		self.modelAboutToBeReset.emit()
 		self.__interfaces = []
+		self.__indexItems()
 		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
 		self.modelReset.emit()
 
@@ -269,9 +332,159 @@ class InterfacesModel(QAbstractListModel):
 		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.
 		self.modelAboutToBeReset.emit()
 		self.__interfaces = sorted(self.__interfaces, key=lambda x: (x.name), reverse=order)
+		self.__cacheItems()
 		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
 		self.modelReset.emit()
 
+	def updateInterfaces(self, interfaces, categories=True):
+		"""
+		Updates the Model to given interfaces sorted by name along their categories,
+		or in given order without categories, e.g. ranked search results.
+
+		Only the removed and inserted rows are notified to the views instead of resetting the Model.
+
+		:param interfaces: Interfaces.
+		:type interfaces: list
+		:param categories: Interfaces are sorted by name along their categories.
+		:type categories: bool
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		if categories:
+			categories = {}
+			for interface in interfaces:
+				name = interface.name[0]
+				if not name in categories:
+					categories[name] = self.__categories.setdefault(name, Categorie(name=name))
+			items = sorted(interfaces + categories.values(), key=lambda x: (x.name))
+		else:
+			items = list(interfaces)
+
+		# The kept items are a longest subsequence of the current items already in the new items order,
+		# the other items are removed and inserted again.
+		positions = dict((id(item), i) for i, item in enumerate(items))
+		current = [item for item in self.__interfaces if id(item) in positions]
+		identities = set(id(current[i]) for i in getIncreasingSubsequence([positions[id(item)] for item in current]))
+		last = len(self.__interfaces)
+		while last:
+			last -= 1
+			if id(self.__interfaces[last]) in identities:
+				continue
+
+			first = last
+			while first and not id(self.__interfaces[first - 1]) in identities:
+				first -= 1
+			self.beginRemoveRows(QModelIndex(), first, last)
+			for item in self.__interfaces[first:last + 1]:
+				self.__unindexItem(item)
+			del(self.__interfaces[first:last + 1])
+			del(self.__displays[first:last + 1])
+			del(self.__flags[first:last + 1])
+			self.endRemoveRows()
+			last = first
+
+		# The remaining items are a subsequence of the new items.
+		first = 0
+		while first < len(items):
+			if first < len(self.__interfaces) and self.__interfaces[first] is items[first]:
+				first += 1
+				continue
+
+			item = self.__interfaces[first] if first < len(self.__interfaces) else None
+			last = first
+			while last < len(items) and items[last] is not item:
+				last += 1
+			self.beginInsertRows(QModelIndex(), first, last - 1)
+			self.__interfaces[first:first] = items[first:last]
+			self.__displays[first:first] = [self.__getItemDisplay(item) for item in items[first:last]]
+			self.__flags[first:first] = [self.__getItemFlags(item) for item in items[first:last]]
+			for item in items[first:last]:
+				self.__indexItem(item)
+			self.endInsertRows()
+			first = last
+		return True
+
+	def __indexItem(self, item):
+		"""
+		Indexes given item by name, interfaces are also indexed by normalized name.
+
+		:param item: Item.
+		:type item: Interface or Categorie
+		"""
+
+		self.__items[item.name] = item
+		if type(item) is Interface:
+			self.__names[getNormalizedName(item.name)] = item
+
+	def __unindexItem(self, item):
+		"""
+		Removes given item from the names indexes.
+
+		:param item: Item.
+		:type item: Interface or Categorie
+		"""
+
+		if self.__items.get(item.name) is item:
+			del(self.__items[item.name])
+		if type(item) is Interface and self.__names.get(getNormalizedName(item.name)) is item:
+			del(self.__names[getNormalizedName(item.name)])
+
+	def __indexItems(self):
+		"""
+		Indexes the Model items by name.
+		"""
+
+		self.__items = {}
+		self.__names = {}
+		for item in self.__interfaces or ():
+			self.__indexItem(item)
+		self.__cacheItems()
+
+	def __getItemDisplay(self, item):
+		"""
+		Returns given item display data.
+
+		:param item: Item.
+		:type item: Interface or Categorie
+		:return: Display data.
+		:rtype: QVariant
+		"""
+
+		return QVariant(item.name)
+
+	def __getItemFlags(self, item):
+		"""
+		Returns given item flags.
+
+		:param item: Item.
+		:type item: Interface or Categorie
+		:return: Flags. ( Qt.ItemFlags )
+		"""
+
+		return Qt.ItemIsEnabled | Qt.ItemIsSelectable if type(item) is Interface else Qt.ItemIsEnabled
+
+	def __cacheItems(self):
+		"""
+		Caches the Model items display data and flags into flat arrays so that
+		:meth:`InterfacesModel.data` and :meth:`InterfacesModel.flags` methods don't compute them on each paint.
+		"""
+
+		self.__displays = [self.__getItemDisplay(item) for item in self.__interfaces or ()]
+		self.__flags = [self.__getItemFlags(item) for item in self.__interfaces or ()]
+
+	def getInterfaceByName(self, name):
+		"""
+		Returns the interface with given name, the case and the whitespaces are ignored.
+
+		:param name: Interface name.
+		:type name: unicode
+		:return: Interface.
+		:rtype: Interface
+		"""
+
+		return self.__names.get(getNormalizedName(name))
+
 	def getInterface(self, index):
 		"""
 		Returns the interface with given index.
@@ -294,7 +507,9 @@ class InterfacesModel(QAbstractListModel):
 
 		name = categorie[0]
 		if not name in self:
-			self.__interfaces.append(Categorie(name=name))
+			categorie = Categorie(name=name)
+			self.__interfaces.append(categorie)
+			self.__indexItem(categorie)
 
 	def __unregisterCategorie(self, name):
 		"""
@@ -311,7 +526,8 @@ class InterfacesModel(QAbstractListModel):
 				count += 1
 
 			if item.name == name and count == 1:
-				self.__interfaces.remove(self[name])
+				self.__unindexItem(item)
+				self.__interfaces.remove(item)
 
 	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
 	def registerInterface(self, interface):
@@ -332,10 +548,49 @@ class InterfacesModel(QAbstractListModel):
 		LOGGER.debug("> Registering '{0}' interface.".format(name))
 
 		self.__interfaces.append(interface)
+		self.__indexItem(interface)
 		self.__registerCategorie(name)
 		self.sort()
 		return True
 
+	def registerInterfaces(self, interfaces):
+		"""
+		Registers given interfaces in bulk, the Model is sorted and reset once.
+
+		Interfaces whose name is already registered are skipped.
+
+		:param interfaces: Interfaces to register.
+		:type interfaces: iterable
+		:return: Registered interfaces count.
+		:rtype: int
+		"""
+
+		names = dict((item.name, item) for item in self.__interfaces)
+		count = 0
+		for interface in interfaces:
+			name = interface.name
+			if name in names:
+				LOGGER.warning("!> {0} | An interface with '{1}' name is already registered!".format(
+				self.__class__.__name__, name))
+				continue
+
+			names[name] = interface
+			count += 1
+
+			categorie = name[0]
+			if not categorie in names:
+				names[categorie] = self.__categories.setdefault(categorie, Categorie(name=categorie))
+
+		LOGGER.debug("> Registering '{0}' interfaces.".format(count))
+
+		# TODO: Rollback to beginResetModel() whenever MPC changes it's PyQt version.
+		self.modelAboutToBeReset.emit()
+		self.__interfaces = sorted(names.itervalues(), key=lambda x: (x.name))
+		self.__indexItems()
+		# TODO: Rollback to endResetModel () whenever MPC changes it's PyQt version.
+		self.modelReset.emit()
+		return count
+
 	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
 	def unregisterInterface(self, name):
 		"""
@@ -357,6 +612,7 @@ class InterfacesModel(QAbstractListModel):
 			if not interface.name == name:
 				continue
 
+			self.__unindexItem(interface)
 			del(self.__interfaces[i])
 			self.__unregisterCategorie(name)
 			self.sort()
@@ -0,0 +1,585 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+**search.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Defines the :class:`InterfacesIndex` class filtering the interfaces displayed by the
+	:class:`snippets.loader.Loader` and :class:`snippets.popup.Popup` classes and the :class:`FuzzyMatcher`
+	class ranking them.
+
+**Others:**
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import bisect
+import logging
+import math
+import re
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.exceptions
+import foundations.verbose
+from snippets.globals.constants import Constants
+from snippets.managers.modulesManager import getTokens
+from snippets.ui.models import Interface
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2008 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["LOGGER", "isLiteralPattern", "getCharactersMask", "FuzzyMatcher", "InterfacesIndex"]
+
+LOGGER = foundations.verbose.installLogger()
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def isLiteralPattern(pattern):
+	"""
+	Returns if given regex pattern doesn't use any special character and matches literally.
+
+	:param pattern: Pattern.
+	:type pattern: unicode
+	:return: Is literal pattern.
+	:rtype: bool
+	"""
+
+	return re.search(r"[\\.^$*+?{}\[\]|()]", pattern) is None
+
+def getCharactersMask(text):
+	"""
+	Returns the bitmask of given text characters, a text can only contain the characters of another one
+	if its mask is included in the other one mask.
+
+	:param text: Text.
+	:type text: unicode
+	:return: Characters mask.
+	:rtype: int
+	"""
+
+	mask = 0
+	for character in text:
+		mask |= 1 << (ord(character) & 63)
+	return mask
+
+class FuzzyMatcher(object):
+	"""
+	Defines the **FuzzyMatcher** class scoring the candidates containing a query characters in order,
+	the matches on words starts, camelCase humps and consecutive characters score higher.
+	"""
+
+	scoreMatch = 16
+	bonusBoundary = 8
+	bonusCamelCase = 7
+	bonusConsecutive = 4
+	bonusFirstCharacterMultiplier = 2
+	penaltyGapStart = 3
+	penaltyGapExtension = 1
+	penaltyLeadingGap = 1
+	maximumLeadingPenalty = 3
+	bonusFrecency = 16
+
+	@classmethod
+	def getCandidate(cls, name):
+		"""
+		Returns the precomputed lowercase string, characters mask and per character bonuses of given name.
+
+		:param name: Candidate name.
+		:type name: unicode
+		:return: Lowercase name, characters mask, bonuses.
+		:rtype: tuple
+		"""
+
+		bonuses = []
+		previous = " "
+		for character in name:
+			if character.isalnum() and not previous.isalnum():
+				bonuses.append(cls.bonusBoundary)
+			elif (previous.islower() and character.isupper()) or (not previous.isdigit() and character.isdigit()):
+				bonuses.append(cls.bonusCamelCase)
+			else:
+				bonuses.append(0)
+			previous = character
+
+		lowered = name.lower()
+		return lowered, getCharactersMask(lowered), bonuses
+
+	@staticmethod
+	def getQuery(query):
+		"""
+		Returns given query prepared for matching, the whitespaces are not matched.
+
+		:param query: Query.
+		:type query: unicode
+		:return: Prepared query, characters mask.
+		:rtype: tuple
+		"""
+
+		query = "".join(query.lower().split())
+		return query, getCharactersMask(query)
+
+	@classmethod
+	def score(cls, query, candidate):
+		"""
+		Scores given candidate against given prepared query.
+
+		The shortest window ending on the first occurrence of the query characters is scored,
+		matches starting further in the candidate are slightly penalized.
+
+		:param query: Prepared query as returned by :meth:`FuzzyMatcher.getQuery` method.
+		:type query: tuple
+		:param candidate: Candidate as returned by :meth:`FuzzyMatcher.getCandidate` method.
+		:type candidate: tuple
+		:return: Score, None if the candidate doesn't match.
+		:rtype: int
+		"""
+
+		query, queryMask = query
+		text, mask, bonuses = candidate
+		if mask & queryMask != queryMask:
+			return
+
+		if not query:
+			return 0
+
+		end = -1
+		for character in query:
+			end = text.find(character, end + 1)
+			if end == -1:
+				return
+
+		start = end + 1
+		for character in reversed(query):
+			start = text.rfind(character, 0, start)
+
+		score = -min(start * cls.penaltyLeadingGap, cls.maximumLeadingPenalty)
+		consecutive = 0
+		firstBonus = 0
+		inGap = False
+		j = 0
+		for i in range(start, end + 1):
+			if j < len(query) and text[i] == query[j]:
+				bonus = bonuses[i]
+				if consecutive:
+					bonus = max(bonus, firstBonus, cls.bonusConsecutive)
+				else:
+					firstBonus = bonus
+				score += cls.scoreMatch + (bonus * cls.bonusFirstCharacterMultiplier if j == 0 else bonus)
+				consecutive += 1
+				inGap = False
+				j += 1
+			else:
+				score -= cls.penaltyGapExtension if inGap else cls.penaltyGapStart
+				consecutive = 0
+				inGap = True
+		return score
+
+	@classmethod
+	def match(cls, query, candidates, frecency=None):
+		"""
+		Returns the candidates matching given query ranked by decreasing score, then by length and name,
+		all the candidates are returned in their given order for an empty query.
+
+		The score of the frequently and recently used candidates is raised with the logarithm of their frecency.
+
+		:param query: Query.
+		:type query: unicode
+		:param candidates: Candidates as ( Name, Candidate, Item ) tuples.
+		:type candidates: list
+		:param frecency: Definition returning the frecency of given item.
+		:type frecency: object
+		:return: Matches as ( Score, Name, Candidate, Item ) tuples.
+		:rtype: list
+		"""
+
+		query = cls.getQuery(query)
+		if not query[0]:
+			return [(0, name, candidate, item) for name, candidate, item in candidates]
+
+		matches = []
+		for name, candidate, item in candidates:
+			score = cls.score(query, candidate)
+			if score is None:
+				continue
+
+			if frecency is not None:
+				score += cls.bonusFrecency * math.log(1 + frecency(item), 2)
+			matches.append((score, name, candidate, item))
+		return sorted(matches, key=lambda x: (-x[0], len(x[1]), x[1]))
+
+class InterfacesIndex(object):
+	"""
+	Defines the **InterfacesIndex** class holding the interfaces sorted by name and an inverted index of their
+	search tokens, see :func:`snippets.managers.modulesManager.parseModule` definition.
+
+	Filtering with a literal pattern containing the previous literal pattern only searches the previous results
+	so that extending the query while typing narrows the previous result set instead of searching everything again.
+	"""
+
+	def __init__(self, formatter=None, frecency=None):
+		"""
+		Initializes the class.
+
+		:param formatter: Definition returning the display name of given interface attribute.
+		:type formatter: object
+		:param frecency: Definition returning the frecency of given interface, biasing the search results.
+		:type frecency: object
+		"""
+
+		LOGGER.debug("> Initializing '{0}()' class.".format(self.__class__.__name__))
+
+		# --- Setting class attributes. ---
+		self.__formatter = formatter or (lambda attribute: attribute)
+		self.__frecency = frecency
+
+		self.__interfaces = {}
+		self.__entries = []
+
+		self.__postings = {}
+		self.__tokens = None
+		self.__interfacesTokens = {}
+
+		self.__query = None
+		self.__matches = None
+
+	#******************************************************************************************************************
+	#***	Attributes properties.
+	#******************************************************************************************************************
+	@property
+	def formatter(self):
+		"""
+		Property for **self.__formatter** attribute.
+
+		:return: self.__formatter.
+		:rtype: object
+		"""
+
+		return self.__formatter
+
+	@formatter.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def formatter(self, value):
+		"""
+		Setter for **self.__formatter** attribute.
+
+		:param value: Attribute value.
+		:type value: object
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "formatter"))
+
+	@formatter.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def formatter(self):
+		"""
+		Deleter for **self.__formatter** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "formatter"))
+
+	@property
+	def frecency(self):
+		"""
+		Property for **self.__frecency** attribute.
+
+		:return: self.__frecency.
+		:rtype: object
+		"""
+
+		return self.__frecency
+
+	@frecency.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def frecency(self, value):
+		"""
+		Setter for **self.__frecency** attribute.
+
+		:param value: Attribute value.
+		:type value: object
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "frecency"))
+
+	@frecency.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def frecency(self):
+		"""
+		Deleter for **self.__frecency** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "frecency"))
+
+	@property
+	def interfaces(self):
+		"""
+		Property for **self.__interfaces** attribute.
+
+		:return: self.__interfaces.
+		:rtype: dict
+		"""
+
+		return self.__interfaces
+
+	@interfaces.setter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def interfaces(self, value):
+		"""
+		Setter for **self.__interfaces** attribute.
+
+		:param value: Attribute value.
+		:type value: dict
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is read only!".format(self.__class__.__name__, "interfaces"))
+
+	@interfaces.deleter
+	@foundations.exceptions.handleExceptions(foundations.exceptions.ProgrammingError)
+	def interfaces(self):
+		"""
+		Deleter for **self.__interfaces** attribute.
+		"""
+
+		raise foundations.exceptions.ProgrammingError(
+		"{0} | '{1}' attribute is not deletable!".format(self.__class__.__name__, "interfaces"))
+
+	#******************************************************************************************************************
+	#***	Class methods.
+	#******************************************************************************************************************
+	def __getitem__(self, name):
+		"""
+		Reimplements the :meth:`object.__getitem__` method.
+
+		:param name: Interface name.
+		:type name: unicode
+		:return: Interface.
+		:rtype: Interface
+		"""
+
+		return self.__interfaces.get(name)
+
+	def __contains__(self, name):
+		"""
+		Reimplements the :meth:`object.__contains__` method.
+
+		:param name: Interface name.
+		:type name: unicode
+		:return: Interface existence.
+		:rtype: bool
+		"""
+
+		return name in self.__interfaces
+
+	def __len__(self):
+		"""
+		Reimplements the :meth:`object.__len__` method.
+
+		:return: Interfaces count.
+		:rtype: int
+		"""
+
+		return len(self.__interfaces)
+
+	def __invalidate(self):
+		"""
+		Invalidates the previous results.
+		"""
+
+		self.__query = self.__matches = None
+
+	def clear(self):
+		"""
+		Clears the index.
+
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.__interfaces = {}
+		self.__entries = []
+		self.__postings = {}
+		self.__tokens = None
+		self.__interfacesTokens = {}
+		self.__invalidate()
+		return True
+
+	def registerInterface(self, attribute, module):
+		"""
+		Registers given module interface, an interface with the same display name is not overridden.
+
+		:param attribute: Interface attribute.
+		:type attribute: unicode
+		:param module: Module.
+		:type module: Module
+		:return: Registered interface.
+		:rtype: Interface
+		"""
+
+		name = self.__formatter(attribute)
+		if name in self.__interfaces:
+			return
+
+		interface = self.__interfaces[name] = Interface(name=name, attribute=attribute, module=module)
+		bisect.insort(self.__entries, (name, name.lower(), interface, FuzzyMatcher.getCandidate(name)))
+
+		tokens = self.__interfacesTokens[name] = (getattr(module, "tokens", None) or {}).get(attribute) or \
+												getTokens(name)
+		for token in tokens:
+			if not token in self.__postings:
+				self.__postings[token] = set()
+				self.__tokens = None
+			self.__postings[token].add(name)
+
+		self.__invalidate()
+		return interface
+
+	def unregisterInterface(self, attribute, module):
+		"""
+		Unregisters given module interface.
+
+		:param attribute: Interface attribute.
+		:type attribute: unicode
+		:param module: Module.
+		:type module: Module
+		:return: Unregistered interface.
+		:rtype: Interface
+		"""
+
+		name = self.__formatter(attribute)
+		interface = self.__interfaces.get(name)
+		if interface is None or interface.module is not module:
+			return
+
+		del(self.__interfaces[name])
+		del(self.__entries[bisect.bisect_left(self.__entries, (name,))])
+
+		for token in self.__interfacesTokens.pop(name, ()):
+			self.__postings[token].discard(name)
+			if not self.__postings[token]:
+				del(self.__postings[token])
+				self.__tokens = None
+
+		self.__invalidate()
+		return interface
+
+	def build(self, modulesManager):
+		"""
+		Builds the index from given modules manager interfaces.
+
+		:param modulesManager: Modules manager.
+		:type modulesManager: ModulesManager
+		:return: Method success.
+		:rtype: bool
+		"""
+
+		self.clear()
+		for attribute in sorted(modulesManager.listInterfaces()):
+			self.registerInterface(attribute, modulesManager.getInterfaceModule(attribute))
+		return True
+
+	def filter(self, pattern=".*", flags=re.IGNORECASE):
+		"""
+		Returns the interfaces whose name matches given pattern sorted by name.
+
+		:param pattern: Regex pattern.
+		:type pattern: unicode
+		:param flags: Regex flags.
+		:type flags: int
+		:return: Interfaces, None if the pattern is invalid.
+		:rtype: list
+		"""
+
+		try:
+			search = re.compile(pattern, flags).search
+		except Exception:
+			return
+
+		return [entry[2] for entry in self.__entries if search(entry[0])]
+
+	def searchText(self, query):
+		"""
+		Returns the interfaces having a search token starting with each given query word,
+		ranked by decreasing frecency then by name.
+
+		The words shorter than :attr:`snippets.globals.constants.Constants.minimumTokenLength` attribute are ignored.
+
+		:param query: Query.
+		:type query: unicode
+		:return: Interfaces.
+		:rtype: list
+		"""
+
+		words = [word for word in query.lower().split() if len(word) >= Constants.minimumTokenLength]
+		if not words:
+			return []
+
+		if self.__tokens is None:
+			self.__tokens = sorted(self.__postings)
+
+		names = None
+		for word in words:
+			wordNames = set()
+			for i in range(bisect.bisect_left(self.__tokens, word), len(self.__tokens)):
+				if not self.__tokens[i].startswith(word):
+					break
+				wordNames.update(self.__postings[self.__tokens[i]])
+
+			names = wordNames if names is None else names & wordNames
+			if not names:
+				return []
+
+		interfaces = [self.__interfaces[name] for name in sorted(names)]
+		if self.__frecency is not None:
+			interfaces.sort(key=lambda x: -self.__frecency(x))
+		return interfaces
+
+	def search(self, query):
+		"""
+		Returns the interfaces fuzzy matching given query ranked by relevance, see :class:`FuzzyMatcher` class,
+		followed by the other interfaces matching the query words, see :meth:`InterfacesIndex.searchText` method.
+
+		A query containing the previous one only fuzzy matches the previous matches.
+
+		:param query: Query.
+		:type query: unicode
+		:return: Interfaces.
+		:rtype: list
+		"""
+
+		key = FuzzyMatcher.getQuery(query)[0]
+		if self.__matches is not None and self.__query in key:
+			candidates = [(name, candidate, interface) for score, name, candidate, interface in self.__matches]
+		else:
+			candidates = [(name, candidate, interface) for name, lowered, interface, candidate in self.__entries]
+
+		self.__query, self.__matches = key, FuzzyMatcher.match(query, candidates, self.__frecency)
+		interfaces = [match[-1] for match in self.__matches]
+
+		identities = set(id(interface) for interface in interfaces)
+		interfaces.extend(interface for interface in self.searchText(query) if not id(interface) in identities)
+		return interfaces
@@ -30,6 +30,7 @@ from PyQt4.QtGui import QListView
 #**********************************************************************************************************************
 import foundations.verbose
 from snippets.globals.constants import Constants
+from snippets.globals.uiConstants import UiConstants
 
 #**********************************************************************************************************************
 #***	Module attributes.
@@ -67,3 +68,8 @@ class Interfaces_QListView(QListView):
 
 		# --- Setting class attributes. ---
 		self.setModel(model)
+
+		# The items share a single size hint and are laid out in batches so that large Models scroll smoothly.
+		self.setUniformItemSizes(True)
+		self.setLayoutMode(QListView.Batched)
+		self.setBatchSize(UiConstants.viewsBatchSize)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+#**********************************************************************************************************************
+#
+# Copyright (C) 2009 - 2014 - Thomas Mansencal - thomas.mansencal@gmail.com
+#
+#**********************************************************************************************************************
+
+"""
+**buildLibrariesBundle.py**
+
+**Platform:**
+	Windows, Linux, Mac Os X.
+
+**Description:**
+	Builds a versioned libraries zip bundle, see :func:`snippets.managers.bundle.buildBundle` definition.
+
+**Others:**
+	Usage: python buildLibrariesBundle.py version output directory [directory ...]
+
+	The directories are given by decreasing priority, the bundle is registered by adding its path
+	to the **SNIPPETS_LIBRARIES_PATHS** environment variable.
+
+"""
+
+#**********************************************************************************************************************
+#***	Future imports.
+#**********************************************************************************************************************
+from __future__ import unicode_literals
+
+#**********************************************************************************************************************
+#***	External imports.
+#**********************************************************************************************************************
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+#**********************************************************************************************************************
+#***	Internal imports.
+#**********************************************************************************************************************
+import foundations.strings
+from snippets.managers.bundle import buildBundle
+
+#**********************************************************************************************************************
+#***	Module attributes.
+#**********************************************************************************************************************
+__author__ = "Thomas Mansencal"
+__copyright__ = "Copyright (C) 2010 - 2014 - Thomas Mansencal"
+__license__ = "GPL V3.0 - http://www.gnu.org/licenses/"
+__maintainer__ = "Thomas Mansencal"
+__email__ = "thomas.mansencal@gmail.com"
+__status__ = "Production"
+
+__all__ = ["main"]
+
+#**********************************************************************************************************************
+#***	Module classes and definitions.
+#**********************************************************************************************************************
+def main(arguments):
+	"""
+	Builds the bundle.
+
+	:param arguments: Command line arguments: version, output file, libraries directories.
+	:type arguments: list
+	:return: Definition success.
+	:rtype: bool
+	"""
+
+	if len(arguments) < 3:
+		print(__doc__.split("**Others:**")[-1].strip())
+		return False
+
+	version, file = (foundations.strings.toString(argument) for argument in arguments[:2])
+	directories = [os.path.abspath(foundations.strings.toString(directory)) for directory in arguments[2:]]
+	count = buildBundle(directories, os.path.abspath(file), version)
+	print("'{0}' bundle version '{1}' built with '{2}' modules.".format(file, version, count))
+	return True
+
+if __name__ == "__main__":
+	sys.exit(0 if main(sys.argv[1:]) else 1)